@@ -0,0 +1,139 @@
+"""
+Report Cache Module
+In-process LRU + TTL cache for report results, shared by the REST report
+endpoints and the read-only MCP tools.
+
+Entries are keyed by (report, user_id, parameters) and tagged with the user's
+data version at the time the report was computed. Every transaction, budget or
+goal write calls bump() after its commit, so a cached report is served only
+while none of that user's data has changed since it was built.
+
+Versions live in this process only. Writes made by another process on the
+same database, such as the stdio MCP server next to the REST API or a
+script writing to the file, do not bump them. Those writes show up once the
+entry's TTL runs out, so REPORT_CACHE_TTL_SECONDS bounds how stale a report
+can be and is kept short by default. Set it to 0 when several processes
+write and reports must always be current.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from app.config import settings
+from app.database import run_in_db
+
+class ReportCache:
+    """Thread-safe LRU cache with a TTL and per-user data versions"""
+
+    def __init__(
+        self,
+        max_entries: int = settings.REPORT_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = settings.REPORT_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple, Tuple[int, float, Any]]" = OrderedDict()
+        self._versions: Dict[int, int] = {}
+        self._counters = {"hits": 0, "misses": 0, "stale": 0, "expired": 0, "evictions": 0}
+
+    def data_version(self, user_id: int) -> int:
+        with self._lock:
+            return self._versions.get(user_id, 0)
+
+    def bump(self, user_id: int) -> None:
+        """Invalidate every cached report of a user; call after the write has committed"""
+        with self._lock:
+            self._versions[user_id] = self._versions.get(user_id, 0) + 1
+
+    def lookup(self, report: str, user_id: int, params: Hashable) -> Tuple[bool, Any, int]:
+        """
+        Return (hit, value, version) for a report
+
+        On a miss, `version` is the data version to pass to store() once the
+        report is computed. It is read before the computation starts, so a
+        write that lands in the meantime makes the stored entry stale at once.
+        """
+        key = (report, user_id, params)
+        with self._lock:
+            version = self._versions.get(user_id, 0)
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry_version, expires_at, value = entry
+                if entry_version != version:
+                    self._counters["stale"] += 1
+                    del self._entries[key]
+                elif expires_at <= self._clock():
+                    self._counters["expired"] += 1
+                    del self._entries[key]
+                else:
+                    self._entries.move_to_end(key)
+                    self._counters["hits"] += 1
+                    return True, value, version
+            self._counters["misses"] += 1
+            return False, None, version
+
+    def store(self, report: str, user_id: int, params: Hashable, version: int, value: Any) -> None:
+        if self.max_entries <= 0:
+            return
+        key = (report, user_id, params)
+        with self._lock:
+            self._entries[key] = (version, self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def get_or_compute(self, report: str, user_id: int, params: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached report or compute and cache it
+
+        Exceptions from `compute` propagate and nothing is cached. Cached
+        values are shared between callers and must not be mutated.
+        """
+        hit, value, version = self.lookup(report, user_id, params)
+        if hit:
+            return value
+        value = compute()
+        self.store(report, user_id, params, version, value)
+        return value
+
+    async def get_or_await(
+        self, report: str, user_id: int, params: Hashable, compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Async variant: hits are answered on the event loop, misses await `compute()`"""
+        hit, value, version = self.lookup(report, user_id, params)
+        if hit:
+            return value
+        value = await compute()
+        self.store(report, user_id, params, version, value)
+        return value
+
+    async def get_or_compute_async(self, report: str, user_id: int, params: Hashable, func, *args) -> Any:
+        """Async variant: hits are answered on the event loop, misses run `func(*args)` on the DB executor"""
+        return await self.get_or_await(report, user_id, params, lambda: run_in_db(func, *args))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                **self._counters,
+                "hit_ratio": round(self._counters["hits"] / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters; data versions are kept"""
+        with self._lock:
+            self._entries.clear()
+            for name in self._counters:
+                self._counters[name] = 0
+
+# Global report cache instance
+report_cache = ReportCache()
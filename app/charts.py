@@ -0,0 +1,65 @@
+"""
+Charts and Analytics Module
+Renders report charts with matplotlib/seaborn and builds pandas frames.
+The heavy libraries are imported on first use, never at module import, so
+workers, MCP servers and scripts that do not draw charts skip their cost.
+"""
+
+import base64
+import threading
+from io import BytesIO
+from typing import Dict, Any
+
+_import_lock = threading.Lock()
+_modules: Dict[str, Any] = {}
+
+def _load_plotting():
+    """Import matplotlib's Figure and Agg canvas, and seaborn, once"""
+    with _import_lock:
+        if "Figure" not in _modules:
+            import matplotlib
+            matplotlib.use("Agg")  # seaborn imports pyplot, which must not pick a GUI backend
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+            import seaborn as sns
+            _modules["Figure"] = Figure
+            _modules["FigureCanvasAgg"] = FigureCanvasAgg
+            _modules["sns"] = sns
+    return _modules["Figure"], _modules["FigureCanvasAgg"], _modules["sns"]
+
+def _load_pandas():
+    """Import pandas once"""
+    with _import_lock:
+        if "pd" not in _modules:
+            import pandas as pd
+            _modules["pd"] = pd
+    return _modules["pd"]
+
+def category_breakdown_frame(category_breakdown: Dict[str, float]):
+    """Category totals as a DataFrame sorted by amount, largest first"""
+    pd = _load_pandas()
+    frame = pd.DataFrame(
+        [(category, float(amount)) for category, amount in category_breakdown.items()],
+        columns=["category", "amount"]
+    )
+    return frame.sort_values("amount", ascending=False, ignore_index=True)
+
+def render_category_chart(category_breakdown: Dict[str, float], title: str = "Spending by category") -> str:
+    """Render a bar chart of category totals and return it as a base64 PNG"""
+    Figure, FigureCanvasAgg, sns = _load_plotting()
+    frame = category_breakdown_frame(category_breakdown)
+
+    # A Figure of its own rather than pyplot's global figure registry, since
+    # charts are drawn on the DB executor threads concurrently
+    fig = Figure(figsize=(8, 4.5))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    sns.barplot(data=frame, x="amount", y="category", ax=ax, color="#4f46e5")
+    ax.set_title(title)
+    ax.set_xlabel("Amount")
+    ax.set_ylabel("")
+    fig.tight_layout()
+
+    buffer = BytesIO()
+    fig.savefig(buffer, format="png", dpi=100)
+    return base64.b64encode(buffer.getvalue()).decode()
@@ -9,6 +9,45 @@ class Settings:
     
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./finance_tracker.db")
+    DB_EXECUTOR_WORKERS: int = int(os.getenv("DB_EXECUTOR_WORKERS", "8"))
+    BULK_INSERT_MAX_ITEMS: int = int(os.getenv("BULK_INSERT_MAX_ITEMS", "50000"))
+    SQL_ECHO: bool = os.getenv("SQL_ECHO", "false").lower() == "true"
+    DEFAULT_CURRENCY: str = os.getenv("DEFAULT_CURRENCY", "USD")  # ISO 4217 code for amounts without one
+    
+    # SQLite engine profile, applied to every new connection
+    SQLITE_JOURNAL_MODE: str = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    SQLITE_CACHE_SIZE: int = int(os.getenv("SQLITE_CACHE_SIZE", "-65536"))  # negative = KiB
+    SQLITE_TEMP_STORE: str = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "20000"))
+    LITEQUERY_MAX_READERS: int = int(os.getenv("LITEQUERY_MAX_READERS", "4"))
+    
+    # In-process report cache (see app/cache.py); 0 entries disables it. The
+    # TTL bounds how long writes from other processes go unseen
+    REPORT_CACHE_MAX_ENTRIES: int = int(os.getenv("REPORT_CACHE_MAX_ENTRIES", "1024"))
+    REPORT_CACHE_TTL_SECONDS: float = float(os.getenv("REPORT_CACHE_TTL_SECONDS", "5"))
+    
+    # MCP tool calls (see app/tool_sessions.py): per-statement timeout and
+    # per-call query budget; over budget, "reject" fails the call, "warn" logs it
+    MCP_TOOL_TIMEOUT_MS: int = int(os.getenv("MCP_TOOL_TIMEOUT_MS", "5000"))
+    MCP_QUERY_BUDGET_STATEMENTS: int = int(os.getenv("MCP_QUERY_BUDGET_STATEMENTS", "25"))
+    MCP_QUERY_BUDGET_ROWS: int = int(os.getenv("MCP_QUERY_BUDGET_ROWS", "100000"))
+    MCP_QUERY_BUDGET_MODE: str = os.getenv("MCP_QUERY_BUDGET_MODE", "reject")
+    # Concurrent MCP tool calls per kind; below DB_EXECUTOR_WORKERS so REST keeps
+    # free workers, and one writer since SQLite serializes writes anyway
+    MCP_READ_CONCURRENCY: int = int(os.getenv("MCP_READ_CONCURRENCY", "6"))
+    MCP_WRITE_CONCURRENCY: int = int(os.getenv("MCP_WRITE_CONCURRENCY", "1"))
+    
+    # Per-route and per-MCP-tool latency and SQL metrics served from /metrics
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    # Statements slower than the threshold are logged with their query plan and
+    # kept for /debug/slow-queries; 0 entries disables the slow-query log
+    SLOW_QUERY_THRESHOLD_MS: float = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "100"))
+    SLOW_QUERY_LOG_SIZE: int = int(os.getenv("SLOW_QUERY_LOG_SIZE", "200"))
+    # The /debug endpoints need this token in X-Debug-Token; unset disables them
+    DEBUG_TOKEN: str = os.getenv("DEBUG_TOKEN", "")
+    DEBUG_PROFILE_MAX_SECONDS: float = float(os.getenv("DEBUG_PROFILE_MAX_SECONDS", "60"))
     
     # CORS
     CORS_ORIGINS: List[str] = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000").split(",")
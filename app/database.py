@@ -1,31 +1,84 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+import asyncio
+import contextvars
+import functools
+
+from app.config import settings
+from app.metrics import instrument_engine
+from app.slow_queries import instrument_slow_queries
 
 # Database URL - using SQLite with litequery for enhanced performance
 DATABASE_URL = "sqlite:///./finance_tracker_litequery.db"
 
-# Create SQLite engine with litequery optimizations
-engine = create_engine(
-    DATABASE_URL,
-    echo=True,  # Enable SQL logging for debugging
-    pool_pre_ping=True,
-    pool_recycle=300,
-    connect_args={
-        "timeout": 20,
-        "check_same_thread": False,
-        "isolation_level": None  # Enable autocommit for better performance
-    }
-)
+def sqlite_pragma_statements() -> List[str]:
+    """PRAGMAs of the configured SQLite engine profile"""
+    return [
+        f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}",
+        f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}",
+        f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}",
+        f"PRAGMA cache_size={settings.SQLITE_CACHE_SIZE}",
+        f"PRAGMA temp_store={settings.SQLITE_TEMP_STORE}",
+        f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}",
+    ]
+
+def apply_sqlite_pragmas(dbapi_connection) -> None:
+    """Apply the engine profile to a raw sqlite3 connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for statement in sqlite_pragma_statements():
+            cursor.execute(statement)
+    finally:
+        cursor.close()
+
+def create_sqlite_engine(url: str, echo: bool = settings.SQL_ECHO):
+    """Create a SQLite engine that applies the tuned profile on every new connection"""
+    sqlite_engine = create_engine(
+        url,
+        echo=echo,
+        pool_pre_ping=True,
+        pool_recycle=300,
+        connect_args={
+            "timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000,
+            "check_same_thread": False
+        }
+    )
+
+    @event.listens_for(sqlite_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        apply_sqlite_pragmas(dbapi_connection)
+
+    instrument_engine(sqlite_engine)
+    instrument_slow_queries(sqlite_engine)
+    return sqlite_engine
+
+# Create SQLite engine with the tuned profile (SQL echo is opt-in via SQL_ECHO)
+engine = create_sqlite_engine(DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# Bounded pool of worker threads for blocking database calls made from
+# async route handlers, so a slow query never stalls the event loop
+db_executor = ThreadPoolExecutor(
+    max_workers=settings.DB_EXECUTOR_WORKERS,
+    thread_name_prefix="db-worker"
+)
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+async def run_in_db(func, *args, **kwargs):
+    """Run a blocking database function on the DB executor and await its result"""
+    loop = asyncio.get_running_loop()
+    # In the caller's context, so its SQL is counted against the caller's metrics scope
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(db_executor, functools.partial(context.run, func, *args, **kwargs))
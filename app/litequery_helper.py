@@ -5,48 +5,128 @@ Provides enhanced database operations using litequery for better performance
 
 import asyncio
 import aiosqlite
-from typing import List, Dict, Any, Optional
-from datetime import datetime, date
-import json
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Optional, AsyncIterator
+
+from app.config import settings
+from app.database import sqlite_pragma_statements
 
 class LiteQueryHelper:
-    """Helper class for enhanced database operations with litequery"""
+    """Helper class for enhanced database operations with litequery
+    
+    Queries run on a bounded pool of persistent aiosqlite connections: several
+    readers that SELECTs share, and a single writer that INSERT/UPDATE/DELETE
+    statements take turns on, matching SQLite's one-writer WAL model. The pool
+    is opened lazily on first use (or eagerly with start()) and must be closed
+    with close() on shutdown.
+    """
     
-    def __init__(self, db_path: str = "./finance_tracker_litequery.db"):
+    def __init__(self, db_path: str = "./finance_tracker_litequery.db", max_readers: int = settings.LITEQUERY_MAX_READERS):
         self.db_path = db_path
+        self.max_readers = max_readers
+        self._readers: Optional[asyncio.Queue] = None
+        self._all_readers: List[aiosqlite.Connection] = []
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._writer_lock: Optional[asyncio.Lock] = None
+        self._start_lock = asyncio.Lock()
+    
+    async def get_connection(self) -> aiosqlite.Connection:
+        """Open a new, unpooled connection with the engine profile applied"""
+        db = await aiosqlite.connect(self.db_path, timeout=settings.SQLITE_BUSY_TIMEOUT_MS / 1000)
+        db.row_factory = aiosqlite.Row
+        for statement in sqlite_pragma_statements():
+            # Close each cursor so no statement is left holding a read snapshot open
+            async with db.execute(statement) as cursor:
+                await cursor.fetchall()
+        return db
+    
+    async def start(self) -> None:
+        """Open and warm up the reader connections and the writer connection"""
+        async with self._start_lock:
+            if self._readers is not None:
+                return
+            self._writer = await self.get_connection()
+            readers = await asyncio.gather(*(self.get_connection() for _ in range(self.max_readers)))
+            queue = asyncio.Queue()
+            for db in readers:
+                # Touch the schema so the first real query skips the parse
+                async with db.execute("SELECT 1 FROM sqlite_master LIMIT 1") as cursor:
+                    await cursor.fetchall()
+                queue.put_nowait(db)
+            self._all_readers = list(readers)
+            self._writer_lock = asyncio.Lock()
+            self._readers = queue
     
-    async def get_connection(self):
-        """Get async database connection"""
-        return await aiosqlite.connect(self.db_path)
+    async def close(self) -> None:
+        """Wait for in-flight queries, then close every pooled connection"""
+        async with self._start_lock:
+            if self._readers is None:
+                return
+            readers, writer, writer_lock = self._readers, self._writer, self._writer_lock
+            self._readers = None
+            self._writer = None
+            self._writer_lock = None
+            
+            # Draining the queue and taking the writer lock waits for borrowed connections
+            connections = [await readers.get() for _ in self._all_readers]
+            self._all_readers = []
+            async with writer_lock:
+                connections.append(writer)
+            for db in connections:
+                await db.close()
+    
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a reader connection, waiting if all of them are busy"""
+        if self._readers is None:
+            await self.start()
+        readers = self._readers
+        db = await readers.get()
+        try:
+            yield db
+        finally:
+            readers.put_nowait(db)
+    
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Take exclusive use of the writer connection"""
+        if self._writer is None:
+            await self.start()
+        async with self._writer_lock:
+            yield self._writer
     
     async def execute_query(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
         """Execute a SELECT query and return results as list of dictionaries"""
-        async with self.get_connection() as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(query, params)
-            rows = await cursor.fetchall()
+        async with self.reader() as db:
+            async with db.execute(query, params) as cursor:
+                rows = await cursor.fetchall()
             return [dict(row) for row in rows]
     
     async def execute_insert(self, query: str, params: tuple = ()) -> int:
         """Execute an INSERT query and return the last row ID"""
-        async with self.get_connection() as db:
-            cursor = await db.execute(query, params)
-            await db.commit()
+        async with self.writer() as db:
+            try:
+                cursor = await db.execute(query, params)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
             return cursor.lastrowid
     
     async def execute_update(self, query: str, params: tuple = ()) -> int:
         """Execute an UPDATE query and return the number of affected rows"""
-        async with self.get_connection() as db:
-            cursor = await db.execute(query, params)
-            await db.commit()
+        async with self.writer() as db:
+            try:
+                cursor = await db.execute(query, params)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
             return cursor.rowcount
     
     async def execute_delete(self, query: str, params: tuple = ()) -> int:
         """Execute a DELETE query and return the number of affected rows"""
-        async with self.get_connection() as db:
-            cursor = await db.execute(query, params)
-            await db.commit()
-            return cursor.rowcount
+        return await self.execute_update(query, params)
     
     # Financial Analytics Methods
     async def get_user_financial_summary(self, user_id: int, start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, Any]:
@@ -55,18 +135,20 @@ class LiteQueryHelper:
         params = [user_id]
         
         if start_date:
-            date_filter += " AND date >= ?"
+            date_filter += " AND day >= date(?)"
             params.append(start_date)
         if end_date:
-            date_filter += " AND date <= ?"
+            date_filter += " AND day <= date(?)"
             params.append(end_date)
         
+        # Rollup rows store the enum member names ('INCOME'/'EXPENSE');
+        # amounts are summed as integer cents and scaled once per result
         query = f"""
         SELECT 
-            SUM(CASE WHEN transaction_type = 'income' THEN amount ELSE 0 END) as total_income,
-            SUM(CASE WHEN transaction_type = 'expense' THEN amount ELSE 0 END) as total_expenses,
-            COUNT(*) as transaction_count
-        FROM transactions 
+            SUM(CASE WHEN transaction_type = 'INCOME' THEN amount_sum_cents ELSE 0 END) / 100.0 as total_income,
+            SUM(CASE WHEN transaction_type = 'EXPENSE' THEN amount_sum_cents ELSE 0 END) / 100.0 as total_expenses,
+            COALESCE(SUM(transaction_count), 0) as transaction_count
+        FROM daily_category_totals 
         WHERE user_id = ? {date_filter}
         """
         
@@ -90,19 +172,19 @@ class LiteQueryHelper:
         params = [user_id]
         
         if start_date:
-            date_filter += " AND date >= ?"
+            date_filter += " AND day >= date(?)"
             params.append(start_date)
         if end_date:
-            date_filter += " AND date <= ?"
+            date_filter += " AND day <= date(?)"
             params.append(end_date)
         
         query = f"""
         SELECT 
             category,
-            SUM(amount) as total_spent,
-            COUNT(*) as transaction_count
-        FROM transactions 
-        WHERE user_id = ? AND transaction_type = 'expense' {date_filter}
+            SUM(amount_sum_cents) / 100.0 as total_spent,
+            SUM(transaction_count) as transaction_count
+        FROM daily_category_totals 
+        WHERE user_id = ? AND transaction_type = 'EXPENSE' {date_filter}
         GROUP BY category
         ORDER BY total_spent DESC
         """
@@ -113,13 +195,13 @@ class LiteQueryHelper:
         """Get monthly income and expense trends"""
         query = """
         SELECT 
-            strftime('%Y-%m', date) as month,
-            SUM(CASE WHEN transaction_type = 'income' THEN amount ELSE 0 END) as income,
-            SUM(CASE WHEN transaction_type = 'expense' THEN amount ELSE 0 END) as expenses
-        FROM transactions 
+            strftime('%Y-%m', day) as month,
+            SUM(CASE WHEN transaction_type = 'INCOME' THEN amount_sum_cents ELSE 0 END) / 100.0 as income,
+            SUM(CASE WHEN transaction_type = 'EXPENSE' THEN amount_sum_cents ELSE 0 END) / 100.0 as expenses
+        FROM daily_category_totals 
         WHERE user_id = ? 
-        AND date >= date('now', '-{} months')
-        GROUP BY strftime('%Y-%m', date)
+        AND day >= date('now', '-{} months')
+        GROUP BY strftime('%Y-%m', day)
         ORDER BY month
         """.format(months)
         
@@ -132,22 +214,22 @@ class LiteQueryHelper:
             b.id as budget_id,
             b.name as budget_name,
             b.category,
-            b.amount as budget_amount,
-            COALESCE(SUM(t.amount), 0) as spent_amount,
-            b.amount - COALESCE(SUM(t.amount), 0) as remaining_amount,
+            b.amount_cents / 100.0 as budget_amount,
+            COALESCE(SUM(t.amount_cents), 0) / 100.0 as spent_amount,
+            (b.amount_cents - COALESCE(SUM(t.amount_cents), 0)) / 100.0 as remaining_amount,
             CASE 
-                WHEN COALESCE(SUM(t.amount), 0) > b.amount THEN 'over_budget'
-                WHEN COALESCE(SUM(t.amount), 0) > b.amount * 0.8 THEN 'on_track'
+                WHEN COALESCE(SUM(t.amount_cents), 0) > b.amount_cents THEN 'over_budget'
+                WHEN COALESCE(SUM(t.amount_cents), 0) > b.amount_cents * 0.8 THEN 'on_track'
                 ELSE 'under_budget'
             END as status
         FROM budgets b
         LEFT JOIN transactions t ON b.category = t.category 
-            AND t.transaction_type = 'expense'
+            AND t.transaction_type = 'EXPENSE'
             AND t.date >= b.start_date 
             AND t.date <= b.end_date
             AND t.user_id = b.user_id
         WHERE b.user_id = ?
-        GROUP BY b.id, b.name, b.category, b.amount
+        GROUP BY b.id, b.name, b.category, b.amount_cents
         """
         
         return await self.execute_query(query, (user_id,))
@@ -159,11 +241,11 @@ class LiteQueryHelper:
             id,
             title,
             description,
-            target_amount,
-            current_amount,
+            target_amount_cents / 100.0 as target_amount,
+            current_amount_cents / 100.0 as current_amount,
             target_date,
             status,
-            ROUND((current_amount / target_amount) * 100, 2) as progress_percentage
+            ROUND(current_amount_cents * 100.0 / target_amount_cents, 2) as progress_percentage
         FROM goals
         WHERE user_id = ?
         ORDER BY target_date
@@ -176,7 +258,8 @@ class LiteQueryHelper:
         query = """
         SELECT 
             id,
-            amount,
+            amount_cents / 100.0 as amount,
+            currency,
             description,
             transaction_type,
             category,
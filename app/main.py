@@ -1,21 +1,34 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 import uvicorn
 
 from app.database import get_db
-from app.routers import transactions_simple, reports_simple
+from app.routers import transactions_simple, reports_simple, debug
 from app.models import Base
 from app.database import engine
+from app.migrations import run_migrations
+from app.litequery_helper import litequery_helper
+from app.metrics import MetricsMiddleware, PROMETHEUS_CONTENT_TYPE, render_prometheus
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
+run_migrations(engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up the LiteQuery connection pool and close it on shutdown"""
+    await litequery_helper.start()
+    yield
+    await litequery_helper.close()
 
 app = FastAPI(
     title="Personal Finance Tracker API",
     description="A comprehensive API for tracking income, expenses, budgets, and financial goals",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -26,13 +39,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+# Latency and SQL metrics per route, served from /metrics
+app.add_middleware(MetricsMiddleware)
+
 # No authentication required
 
 # Include routers (no authentication required)
 app.include_router(transactions_simple.router, prefix="/api/v1/transactions", tags=["Transactions"])
 app.include_router(reports_simple.router, prefix="/api/v1/reports", tags=["Reports & Analytics"])
+app.include_router(debug.router, prefix="/debug", tags=["Debug"])
 
 @app.get("/")
 async def root():
@@ -46,5 +64,10 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics: latency, SQL statements, rows and DB time per route"""
+    return Response(render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
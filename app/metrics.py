@@ -0,0 +1,230 @@
+"""
+Metrics Module
+Per-route and per-MCP-tool latency and SQL instrumentation, exposed in the
+Prometheus text format.
+
+Each HTTP request (MetricsMiddleware) and each MCP tool call (the
+ToolMetricsMiddleware of mcp_server.py) runs in a scope held in a context
+variable. The SQLAlchemy cursor hooks installed by instrument_engine() add
+every statement, its DB time and the rows it returns to the innermost active
+scope, so SQL issued inside an MCP tool call is counted against the tool.
+When the scope ends its latency goes into a histogram next to the SQL
+totals, and render_prometheus() serves all of them from /metrics.
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+ROUTE = "route"
+TOOL = "tool"
+
+# Upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+class RequestScope:
+    """SQL counters of one HTTP request or MCP tool call"""
+
+    __slots__ = ("kind", "name", "statements", "rows", "db_seconds", "error")
+
+    def __init__(self, kind: str, name: Optional[str]):
+        self.kind = kind
+        self.name = name
+        self.statements = 0
+        self.rows = 0
+        self.db_seconds = 0.0
+        self.error = False
+
+_current_scope: ContextVar[Optional[RequestScope]] = ContextVar("metrics_scope", default=None)
+
+def current_scope() -> Optional[RequestScope]:
+    return _current_scope.get()
+
+class _Series:
+    __slots__ = ("buckets", "count", "seconds", "errors", "statements", "rows", "db_seconds")
+
+    def __init__(self):
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.seconds = 0.0
+        self.errors = 0
+        self.statements = 0
+        self.rows = 0
+        self.db_seconds = 0.0
+
+class MetricsRegistry:
+    """Thread-safe latency histograms and SQL totals per (kind, name)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str], _Series] = {}
+
+    def observe(self, scope: RequestScope, seconds: float) -> None:
+        bucket = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+        with self._lock:
+            series = self._series.get((scope.kind, scope.name))
+            if series is None:
+                series = self._series[scope.kind, scope.name] = _Series()
+            if bucket < len(series.buckets):
+                series.buckets[bucket] += 1
+            series.count += 1
+            series.seconds += seconds
+            series.errors += scope.error
+            series.statements += scope.statements
+            series.rows += scope.rows
+            series.db_seconds += scope.db_seconds
+
+    def snapshot(self) -> Dict[Tuple[str, str], Dict[str, object]]:
+        """Copy of every series: cumulative bucket counts, latency and SQL totals"""
+        with self._lock:
+            series = {key: (list(s.buckets), s.count, s.seconds, s.errors, s.statements, s.rows, s.db_seconds)
+                      for key, s in self._series.items()}
+        result = {}
+        for key, (buckets, count, seconds, errors, statements, rows, db_seconds) in series.items():
+            cumulative, running = [], 0
+            for value in buckets:
+                running += value
+                cumulative.append(running)
+            result[key] = {
+                "buckets": cumulative, "count": count, "seconds": seconds, "errors": errors,
+                "statements": statements, "rows": rows, "db_seconds": db_seconds,
+            }
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+metrics_registry = MetricsRegistry()
+
+@contextmanager
+def track(kind: str, name: Optional[str]) -> Iterator[RequestScope]:
+    """
+    Record the latency and SQL of the enclosed work under (kind, name)
+
+    The name may be set on the yielded scope before the block ends, for
+    routes that are only known once the request has been dispatched.
+    """
+    scope = RequestScope(kind, name)
+    token = _current_scope.set(scope)
+    started = time.perf_counter()
+    try:
+        yield scope
+    except BaseException:
+        scope.error = True
+        raise
+    finally:
+        _current_scope.reset(token)
+        if settings.METRICS_ENABLED:
+            metrics_registry.observe(scope, time.perf_counter() - started)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None:
+        context.metrics_started = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    scope = _current_scope.get()
+    if scope is not None and context is not None:
+        scope.statements += 1
+        scope.db_seconds += time.perf_counter() - context.metrics_started
+
+def count_row(cursor, row):
+    """sqlite3 row_factory that counts the rows returned to the active scope"""
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.rows += 1
+    return row
+
+def instrument_engine(engine: Engine) -> None:
+    """Count the statements, DB time and returned rows of an engine's connections"""
+    if not settings.METRICS_ENABLED:
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", lambda dbapi_connection, record: setattr(dbapi_connection, "row_factory", count_row))
+
+def route_label(scope: dict) -> str:
+    """Method and route template of a dispatched ASGI request, without path parameters"""
+    route = scope.get("route")
+    if route is not None:
+        path = route.path
+    elif scope.get("endpoint") is not None:
+        path = scope["path"]  # Mounted sub-applications have fixed paths
+    else:
+        path = "unmatched"
+    return f"{scope['method']} {path}"
+
+class MetricsMiddleware:
+    """ASGI middleware recording every HTTP request under its route, until its body is sent"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        # Named by the raw path until routing has found the template
+        with track(ROUTE, f"{scope['method']} {scope['path']}") as request_scope:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                request_scope.name = route_label(scope)
+                request_scope.error = status >= 500
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+def render_prometheus() -> str:
+    """Every series in the Prometheus text exposition format"""
+    series = sorted(metrics_registry.snapshot().items())
+    lines: List[str] = []
+
+    def family(name: str, kind: str, help_text: str) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    family("finance_request_duration_seconds", "histogram", "Latency of HTTP routes and MCP tool calls")
+    for (kind, name), values in series:
+        labels = f'kind="{kind}",name="{_escape(name)}"'
+        for bound, count in zip(LATENCY_BUCKETS, values["buckets"]):
+            lines.append(f'finance_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+        lines.append(f'finance_request_duration_seconds_bucket{{{labels},le="+Inf"}} {values["count"]}')
+        lines.append(f"finance_request_duration_seconds_sum{{{labels}}} {_number(values['seconds'])}")
+        lines.append(f"finance_request_duration_seconds_count{{{labels}}} {values['count']}")
+
+    counters = (
+        ("finance_request_errors_total", "errors", "HTTP requests answered with a 5xx or MCP tool calls that raised"),
+        ("finance_db_statements_total", "statements", "SQL statements executed"),
+        ("finance_db_rows_total", "rows", "Rows returned by SQL statements"),
+        ("finance_db_seconds_total", "db_seconds", "Time spent executing SQL statements"),
+    )
+    for metric, key, help_text in counters:
+        family(metric, "counter", help_text)
+        for (kind, name), values in series:
+            lines.append(f'{metric}{{kind="{kind}",name="{_escape(name)}"}} {_number(values[key])}')
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,98 @@
+"""
+Database Migrations
+Lightweight, ordered schema migrations for existing SQLite databases.
+The applied version is tracked with PRAGMA user_version.
+"""
+
+from app.config import settings
+from app.models import Budget, DailyCategoryTotal, Goal, Transaction
+from app.services.rollups import rebuild_daily_totals
+
+def _columns(conn, table: str) -> set:
+    """Column names of a table as it exists in the database"""
+    return {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table})")}
+
+def _add_transaction_indexes(conn):
+    """Create the composite transaction indexes on databases that predate them"""
+    # Indexes on columns added by later migrations are created by those migrations
+    existing = _columns(conn, Transaction.__tablename__)
+    for index in Transaction.__table__.indexes:
+        if all(column.name in existing for column in index.columns):
+            index.create(conn, checkfirst=True)
+
+def _add_daily_category_totals(conn):
+    """Create the daily_category_totals rollup; _store_amounts_as_cents backfills it"""
+    DailyCategoryTotal.__table__.create(conn, checkfirst=True)
+
+# (model, old Float column, Money column) pairs converted to integer cents
+_MONEY_COLUMNS = [
+    (Transaction, "amount", "amount_cents"),
+    (Budget, "amount", "amount_cents"),
+    (Goal, "target_amount", "target_amount_cents"),
+    (Goal, "current_amount", "current_amount_cents"),
+]
+
+def _store_amounts_as_cents(conn):
+    """
+    Move Float amount columns to integer cents and add the currency columns
+
+    Values are rounded half up to the cent, which matches how app.money
+    converts new amounts. Indexes on the old columns are dropped with them and
+    the model's indexes are recreated; the rollup is rebuilt in cents.
+    """
+    for model, old, new in _MONEY_COLUMNS:
+        table = model.__tablename__
+        existing = _columns(conn, table)
+        if old in existing and new not in existing:
+            not_null = "" if model.__table__.c[old].nullable else " NOT NULL DEFAULT 0"
+            conn.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {new} INTEGER{not_null}")
+            conn.exec_driver_sql(
+                f"UPDATE {table} SET {new} = CAST(ROUND(ROUND({old}, 2) * 100) AS INTEGER) "
+                f"WHERE {old} IS NOT NULL"
+            )
+            for (index_name,) in conn.exec_driver_sql(
+                "SELECT DISTINCT il.name FROM pragma_index_list(?) il, pragma_index_info(il.name) ii "
+                "WHERE ii.name = ? AND il.origin = 'c'", (table, old)
+            ).all():
+                conn.exec_driver_sql(f'DROP INDEX "{index_name}"')
+            conn.exec_driver_sql(f"ALTER TABLE {table} DROP COLUMN {old}")
+
+    for model in (Transaction, Budget, Goal):
+        if "currency" not in _columns(conn, model.__tablename__):
+            conn.exec_driver_sql(
+                f"ALTER TABLE {model.__tablename__} ADD COLUMN currency VARCHAR(3) NOT NULL "
+                f"DEFAULT '{settings.DEFAULT_CURRENCY}'"
+            )
+
+    for index in Transaction.__table__.indexes:
+        index.create(conn, checkfirst=True)
+
+    DailyCategoryTotal.__table__.drop(conn, checkfirst=True)
+    DailyCategoryTotal.__table__.create(conn)
+    rebuild_daily_totals(conn)
+
+def _normalize_transaction_dates(conn):
+    """
+    Give server-defaulted transaction dates the microseconds the ORM writes
+
+    Rows dated by CURRENT_TIMESTAMP read "YYYY-MM-DD HH:MM:SS"; SQLite compares
+    dates as text, so the keyset cursor's "(date, id) <" predicate needs the
+    "YYYY-MM-DD HH:MM:SS.ffffff" form on every row.
+    """
+    conn.exec_driver_sql("UPDATE transactions SET date = date || '.000000' WHERE length(date) = 19")
+
+# Append new migrations at the end; never reorder or remove entries
+MIGRATIONS = [
+    _add_transaction_indexes,
+    _add_daily_category_totals,
+    _store_amounts_as_cents,
+    _normalize_transaction_dates,
+]
+
+def run_migrations(engine):
+    """Apply every migration newer than the database's user_version"""
+    with engine.begin() as conn:
+        version = conn.exec_driver_sql("PRAGMA user_version").scalar()
+        for number, migration in enumerate(MIGRATIONS[version:], start=version + 1):
+            migration(conn)
+            conn.exec_driver_sql(f"PRAGMA user_version = {number}")
@@ -1,9 +1,16 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Text, Enum
+from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, ForeignKey, Text, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
+from app.money import Money
+from app.config import settings
+from datetime import datetime, timezone
 import enum
 
+def utc_now() -> datetime:
+    """Naive UTC now, the clock of the CURRENT_TIMESTAMP server defaults"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 class TransactionType(str, enum.Enum):
     INCOME = "income"
     EXPENSE = "expense"
@@ -33,15 +40,42 @@ class Transaction(Base):
     __tablename__ = "transactions"
     
     id = Column(Integer, primary_key=True, index=True)
-    amount = Column(Float, nullable=False)
+    # Money columns hold integer cents and load as Decimal (see app/money.py)
+    amount = Column("amount_cents", Money, key="amount", nullable=False)
+    currency = Column(String(3), nullable=False, default=settings.DEFAULT_CURRENCY, server_default=settings.DEFAULT_CURRENCY)
     description = Column(String, nullable=False)
     transaction_type = Column(Enum(TransactionType), nullable=False)
     category = Column(String, nullable=False)
-    date = Column(DateTime(timezone=True), server_default=func.now())
+    # Defaulted in Python so every date is stored as "YYYY-MM-DD HH:MM:SS.ffffff":
+    # SQLite compares dates as text, and the keyset cursor depends on one format
+    date = Column(DateTime(timezone=True), default=utc_now, server_default=func.now())
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     
     # Relationships
     user = relationship("User", back_populates="transactions")
+    
+    # Composite indexes for the hot read paths: every query filters on user_id
+    # and a date range, and the aggregates also group by type and category.
+    # Trailing columns make them covering for the date-range and sum queries.
+    __table_args__ = (
+        Index("ix_transactions_user_date", "user_id", "date"),
+        Index("ix_transactions_user_type_category_date", "user_id", "transaction_type", "category", "date", "amount"),
+    )
+
+class DailyCategoryTotal(Base):
+    """
+    Per-day, per-category rollup of transactions. Kept in step with the
+    transactions table by app.services.rollups inside the same database
+    transaction, so reports cost O(days x categories) instead of O(transactions).
+    """
+    __tablename__ = "daily_category_totals"
+    
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    transaction_type = Column(Enum(TransactionType), primary_key=True)
+    category = Column(String, primary_key=True)
+    amount_sum = Column("amount_sum_cents", Money, key="amount_sum", nullable=False, default=0)
+    transaction_count = Column(Integer, nullable=False, default=0)
 
 class Budget(Base):
     __tablename__ = "budgets"
@@ -49,7 +83,8 @@ class Budget(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     category = Column(String, nullable=False)
-    amount = Column(Float, nullable=False)
+    amount = Column("amount_cents", Money, key="amount", nullable=False)
+    currency = Column(String(3), nullable=False, default=settings.DEFAULT_CURRENCY, server_default=settings.DEFAULT_CURRENCY)
     period = Column(String, nullable=False)  # monthly, weekly, yearly
     start_date = Column(DateTime(timezone=True), nullable=False)
     end_date = Column(DateTime(timezone=True), nullable=False)
@@ -65,8 +100,9 @@ class Goal(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     description = Column(Text)
-    target_amount = Column(Float, nullable=False)
-    current_amount = Column(Float, default=0.0)
+    target_amount = Column("target_amount_cents", Money, key="target_amount", nullable=False)
+    current_amount = Column("current_amount_cents", Money, key="current_amount", default=0)
+    currency = Column(String(3), nullable=False, default=settings.DEFAULT_CURRENCY, server_default=settings.DEFAULT_CURRENCY)
     target_date = Column(DateTime(timezone=True), nullable=False)
     status = Column(Enum(GoalStatus), default=GoalStatus.ACTIVE)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -0,0 +1,44 @@
+"""
+Money Module
+Amounts are stored as integer cents and handled as exact Decimals in Python.
+
+The Money column type converts at the database boundary, so SQL SUM()s add
+integers and the ORM still reads and writes currency units: 12.34 is stored
+as 1234 and loaded back as Decimal("12.34").
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional, Union
+
+from sqlalchemy import Integer
+from sqlalchemy.types import TypeDecorator
+
+CENT = Decimal("0.01")
+
+def to_cents(value: Union[Decimal, float, int, str]) -> int:
+    """Currency units to integer cents, rounding half up; floats are read by their shortest repr"""
+    if type(value) is int:
+        # Whole units need no rounding, so skip the Decimal round trip
+        return value * 100
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return int(value.quantize(CENT, rounding=ROUND_HALF_UP).scaleb(2))
+
+def from_cents(cents: int) -> Decimal:
+    """Integer cents to a two-place Decimal in currency units"""
+    return Decimal(int(cents)).scaleb(-2)
+
+class Money(TypeDecorator):
+    """Integer-cents column exposed to Python as Decimal currency units"""
+
+    impl = Integer
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect) -> Optional[int]:
+        return None if value is None else to_cents(value)
+
+    def process_result_value(self, value, dialect) -> Optional[Decimal]:
+        return None if value is None else from_cents(value)
+
+    def process_literal_param(self, value, dialect) -> str:
+        return str(to_cents(value))
@@ -0,0 +1,148 @@
+"""
+Profiling Module
+On-demand CPU and memory profiling of a live worker, without a restart.
+
+sample_stacks() runs a background thread that reads every other thread's
+Python stack with sys._current_frames() at a fixed interval and counts the
+distinct stacks. The result is rendered as collapsed stacks
+("thread;outer;...;inner count" per line), which flamegraph.pl, speedscope
+and similar tools read directly. Threads idling in a wait, queue get or
+selector poll are left out unless asked for.
+
+memory_diff() takes two tracemalloc snapshots some seconds apart and returns
+the source lines whose allocations grew the most. Tracing is switched on
+only for the length of the request, unless it was already running.
+
+Only one profile of either kind runs at a time per process.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+# Leaf frames of a thread that is waiting for work rather than doing any
+IDLE_LEAVES = {
+    ("threading.py", "wait"),
+    ("queue.py", "get"),
+    ("selectors.py", "select"),
+    ("thread.py", "_worker"),
+}
+
+class ProfilerBusy(Exception):
+    """Another profile is already running in this process"""
+
+_profile_lock = threading.Lock()
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+def _is_idle(frame) -> bool:
+    return (os.path.basename(frame.f_code.co_filename), frame.f_code.co_name) in IDLE_LEAVES
+
+class StackSampler:
+    """Counts the Python stacks of every other thread, sampled every `interval` seconds"""
+
+    def __init__(self, interval: float, include_idle: bool = False):
+        self.interval = interval
+        self.include_idle = include_idle
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def _sample(self) -> None:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        own = threading.get_ident()
+        for ident, frame in sys._current_frames().items():
+            if ident == own or (not self.include_idle and _is_idle(frame)):
+                continue
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            labels.append(names.get(ident, f"thread-{ident}"))
+            self.stacks[";".join(reversed(labels))] += 1
+        self.samples += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+def collapsed(stacks: Counter) -> str:
+    """Collapsed stack lines, heaviest first"""
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+async def sample_stacks(seconds: float, interval_ms: float, include_idle: bool = False) -> Tuple[Counter, int]:
+    """
+    Sample every thread for `seconds` while the event loop keeps serving
+
+    Returns the stack counts and the number of samples taken. Raises
+    ProfilerBusy when another profile is running.
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusy("A profile is already running")
+    try:
+        sampler = StackSampler(interval_ms / 1000, include_idle)
+        sampler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            await asyncio.get_running_loop().run_in_executor(None, sampler.stop)
+        return sampler.stacks, sampler.samples
+    finally:
+        _profile_lock.release()
+
+async def memory_diff(seconds: float, top: int) -> Dict[str, Any]:
+    """
+    The `top` source lines whose traced allocations grew the most over `seconds`
+
+    Raises ProfilerBusy when another profile is running.
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusy("A profile is already running")
+    started_tracing = not tracemalloc.is_tracing()
+    try:
+        if started_tracing:
+            tracemalloc.start()
+        exclude = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        before = tracemalloc.take_snapshot().filter_traces(exclude)
+        started = time.perf_counter()
+        await asyncio.sleep(seconds)
+        after = tracemalloc.take_snapshot().filter_traces(exclude)
+        elapsed = time.perf_counter() - started
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+        _profile_lock.release()
+
+    top_stats: List[Dict[str, Any]] = []
+    for stat in after.compare_to(before, "lineno")[:top]:
+        frame = stat.traceback[0]
+        top_stats.append({
+            "location": f"{frame.filename}:{frame.lineno}",
+            "size_diff_kb": round(stat.size_diff / 1024, 1),
+            "count_diff": stat.count_diff,
+            "size_kb": round(stat.size / 1024, 1),
+            "count": stat.count,
+        })
+    return {
+        "seconds": round(elapsed, 3),
+        "tracing_started_for_request": started_tracing,
+        "traced_current_kb": round(current / 1024, 1),
+        "traced_peak_kb": round(peak / 1024, 1),
+        "top": top_stats,
+    }
@@ -0,0 +1,56 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+from typing import Optional
+import secrets
+
+from app.config import settings
+from app.slow_queries import slow_query_log
+from app.profiling import ProfilerBusy, collapsed, memory_diff, sample_stacks
+
+router = APIRouter()
+
+def require_debug_token(x_debug_token: Optional[str] = Header(None)) -> None:
+    """The debug endpoints are off unless DEBUG_TOKEN is set, and then need it in X-Debug-Token"""
+    if not settings.DEBUG_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Debug endpoints are disabled")
+    if not x_debug_token or not secrets.compare_digest(x_debug_token, settings.DEBUG_TOKEN):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid debug token")
+
+@router.get("/slow-queries", dependencies=[Depends(require_debug_token)])
+async def get_slow_queries(limit: Optional[int] = Query(None, ge=1)):
+    """Statements slower than SLOW_QUERY_THRESHOLD_MS, newest first, with their query plans"""
+    return {
+        "threshold_ms": settings.SLOW_QUERY_THRESHOLD_MS,
+        "capacity": settings.SLOW_QUERY_LOG_SIZE,
+        "recorded": slow_query_log.recorded,
+        "entries": slow_query_log.entries(limit)
+    }
+
+@router.get("/profile", dependencies=[Depends(require_debug_token)], response_class=PlainTextResponse)
+async def profile(
+    seconds: float = Query(5.0, gt=0, le=settings.DEBUG_PROFILE_MAX_SECONDS),
+    interval_ms: float = Query(5.0, ge=1, le=1000),
+    include_idle: bool = False
+):
+    """
+    Sample the stacks of every thread of this worker for `seconds`
+
+    Returns collapsed stacks ("thread;outer;...;inner count" per line, heaviest
+    first), ready for flamegraph.pl or speedscope.
+    """
+    try:
+        stacks, samples = await sample_stacks(seconds, interval_ms, include_idle)
+    except ProfilerBusy as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return PlainTextResponse(collapsed(stacks), headers={"X-Profile-Samples": str(samples)})
+
+@router.get("/memory", dependencies=[Depends(require_debug_token)])
+async def memory(
+    seconds: float = Query(10.0, gt=0, le=settings.DEBUG_PROFILE_MAX_SECONDS),
+    top: int = Query(20, ge=1, le=200)
+):
+    """The source lines whose allocations grew the most over `seconds` (tracemalloc snapshot diff)"""
+    try:
+        return await memory_diff(seconds, top)
+    except ProfilerBusy as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
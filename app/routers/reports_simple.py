@@ -1,20 +1,34 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
 from typing import List, Optional
-from datetime import datetime, date, timedelta
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from io import BytesIO
-import base64
+from datetime import date
 
-from app.database import get_db
-from app.models import Transaction, Budget, User
+from app.database import get_db, run_in_db
 from app.schemas import SpendingReport, BudgetStatus
+from app.services.reports import build_spending_report, iter_transactions_csv
+from app.services.budgets import evaluate_budgets
+from app.cache import report_cache
+from app import charts
 
 router = APIRouter()
 
+# Blocking report builders, executed on the DB executor by the handlers below
+
+def _build_budget_statuses(db: Session) -> List[BudgetStatus]:
+    return [
+        BudgetStatus(**budget_status)
+        for budget_status in evaluate_budgets(db, 1)  # Default user
+    ]
+
+def _build_spending_chart(db: Session, start_date: date, end_date: date) -> dict:
+    report = build_spending_report(db, 1, start_date, end_date)  # Default user
+    image = charts.render_category_chart(report.category_breakdown)
+    return {"format": "png", "encoding": "base64", "image": image, "period": report.period}
+
+def _build_transactions_csv(db: Session, start_date: date, end_date: date) -> str:
+    return "".join(iter_transactions_csv(db, 1, start_date, end_date))  # Default user
+
 @router.get("/spending", response_model=SpendingReport)
 async def get_spending_report(
     start_date: Optional[date] = None,
@@ -26,83 +40,45 @@ async def get_spending_report(
         start_date = date.today().replace(day=1)
     if not end_date:
         end_date = date.today()
+
+    return await report_cache.get_or_compute_async(
+        "spending_report", 1, (start_date, end_date),
+        build_spending_report, db, 1, start_date, end_date  # Default user
+    )
+
+@router.get("/spending/chart")
+async def get_spending_chart(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    db: Session = Depends(get_db)
+):
+    """Spending by category as a base64-encoded PNG bar chart"""
+    if not start_date:
+        start_date = date.today().replace(day=1)
+    if not end_date:
+        end_date = date.today()
     
-    # Get transactions in date range
-    transactions = db.query(Transaction).filter(
-        and_(
-            Transaction.user_id == 1,  # Default user
-            Transaction.date >= start_date,
-            Transaction.date <= end_date
-        )
-    ).all()
-    
-    # Calculate totals
-    total_income = sum(t.amount for t in transactions if t.transaction_type == "income")
-    total_expenses = sum(t.amount for t in transactions if t.transaction_type == "expense")
-    net_income = total_income - total_expenses
-    
-    # Category breakdown
-    category_breakdown = {}
-    for transaction in transactions:
-        if transaction.transaction_type == "expense":
-            category = transaction.category
-            if category not in category_breakdown:
-                category_breakdown[category] = 0
-            category_breakdown[category] += transaction.amount
-    
-    return SpendingReport(
-        total_income=total_income,
-        total_expenses=total_expenses,
-        net_income=net_income,
-        category_breakdown=category_breakdown,
-        period=f"{start_date} to {end_date}"
+    return await report_cache.get_or_compute_async(
+        "spending_chart", 1, (start_date, end_date),  # Default user
+        _build_spending_chart, db, start_date, end_date
     )
 
 @router.get("/budget-status", response_model=List[BudgetStatus])
 async def get_budget_status(
     db: Session = Depends(get_db)
 ):
-    budgets = db.query(Budget).filter(Budget.user_id == 1).all()  # Default user
-    budget_statuses = []
-    
-    for budget in budgets:
-        # Calculate spent amount for this budget
-        spent = db.query(func.sum(Transaction.amount)).filter(
-            and_(
-                Transaction.user_id == 1,  # Default user
-                Transaction.transaction_type == "expense",
-                Transaction.category == budget.category,
-                Transaction.date >= budget.start_date,
-                Transaction.date <= budget.end_date
-            )
-        ).scalar() or 0
-        
-        remaining = budget.amount - spent
-        percentage_used = (spent / budget.amount) * 100 if budget.amount > 0 else 0
-        
-        if percentage_used > 100:
-            status = "over_budget"
-        elif percentage_used > 80:
-            status = "on_track"
-        else:
-            status = "under_budget"
-        
-        budget_statuses.append(BudgetStatus(
-            budget_id=budget.id,
-            budget_name=budget.name,
-            budget_amount=budget.amount,
-            spent_amount=spent,
-            remaining_amount=remaining,
-            percentage_used=percentage_used,
-            status=status
-        ))
-    
-    return budget_statuses
+    return await report_cache.get_or_compute_async("budget_status", 1, (), _build_budget_statuses, db)  # Default user
+
+@router.get("/cache/stats")
+async def get_report_cache_stats():
+    """Hit/miss counters and occupancy of the in-process report cache"""
+    return report_cache.stats()
 
 @router.get("/export/csv")
 async def export_transactions_csv(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
+    as_json: bool = False,
     db: Session = Depends(get_db)
 ):
     if not start_date:
@@ -110,17 +86,14 @@ async def export_transactions_csv(
     if not end_date:
         end_date = date.today()
     
-    transactions = db.query(Transaction).filter(
-        and_(
-            Transaction.user_id == 1,  # Default user
-            Transaction.date >= start_date,
-            Transaction.date <= end_date
-        )
-    ).all()
+    # Legacy shape for the frontend: the whole file wrapped in a JSON object
+    if as_json:
+        csv_content = await run_in_db(_build_transactions_csv, db, start_date, end_date)
+        return {"csv_content": csv_content}
     
-    # Create CSV content
-    csv_content = "Date,Type,Category,Description,Amount\n"
-    for transaction in transactions:
-        csv_content += f"{transaction.date},{transaction.transaction_type},{transaction.category},{transaction.description},{transaction.amount}\n"
-    
-    return {"csv_content": csv_content}
+    # Starlette iterates the sync generator in its threadpool, chunk by chunk
+    return StreamingResponse(
+        iter_transactions_csv(db, 1, start_date, end_date),  # Default user
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="transactions_{start_date}_{end_date}.csv"'}
+    )
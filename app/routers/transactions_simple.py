@@ -1,49 +1,146 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime, date
-from app.database import get_db
+from app.database import get_db, run_in_db
 from app.models import Transaction
-from app.schemas import TransactionCreate, TransactionResponse
+from app.config import settings
+from app.schemas import TransactionCreate, TransactionResponse, BulkTransactionResponse
+from app.services.transactions import list_transactions_page, bulk_insert_transactions
+from app.services.rollups import rollup_values, update_daily_totals
+from app.cache import report_cache
 
 router = APIRouter()
 
-@router.post("/", response_model=TransactionResponse)
-async def create_transaction(
-    transaction: TransactionCreate,
-    db: Session = Depends(get_db)
-):
+# Blocking query helpers, executed on the DB executor by the handlers below
+
+def _create_transaction(db: Session, transaction: TransactionCreate) -> Transaction:
     db_transaction = Transaction(
         **transaction.dict(),
         user_id=1  # Default user ID for demo
     )
     db.add(db_transaction)
+    db.flush()  # Assigns the default date the rollup is keyed on
+    update_daily_totals(db, added=[db_transaction])
     db.commit()
     db.refresh(db_transaction)
+    report_cache.bump(db_transaction.user_id)
     return db_transaction
 
+def _list_transactions(
+    db: Session,
+    skip: int,
+    limit: int,
+    transaction_type: Optional[str],
+    category: Optional[str],
+    start_date: Optional[date],
+    end_date: Optional[date],
+    cursor: Optional[str] = None
+) -> Tuple[List[Transaction], Optional[str]]:
+    return list_transactions_page(
+        db,
+        1,  # Default user
+        limit,
+        transaction_type=transaction_type,
+        category=category,
+        start_date=start_date,
+        end_date=end_date,
+        cursor=cursor,
+        skip=skip
+    )
+
+def _find_transaction(db: Session, transaction_id: int) -> Optional[Transaction]:
+    return db.query(Transaction).filter(
+        Transaction.id == transaction_id,
+        Transaction.user_id == 1  # Default user
+    ).first()
+
+def _update_transaction(
+    db: Session,
+    transaction_id: int,
+    transaction_update: TransactionCreate
+) -> Optional[Transaction]:
+    transaction = _find_transaction(db, transaction_id)
+    if not transaction:
+        return None
+
+    previous = rollup_values(transaction)
+    # An omitted date keeps the current one rather than clearing it
+    for field, value in transaction_update.dict(exclude_none=True).items():
+        setattr(transaction, field, value)
+
+    update_daily_totals(db, added=[transaction], removed=[previous])
+    db.commit()
+    report_cache.bump(previous["user_id"])
+    db.refresh(transaction)
+    return transaction
+
+def _delete_transaction(db: Session, transaction_id: int) -> bool:
+    transaction = _find_transaction(db, transaction_id)
+    if not transaction:
+        return False
+
+    user_id = transaction.user_id
+    db.delete(transaction)
+    update_daily_totals(db, removed=[transaction])
+    db.commit()
+    report_cache.bump(user_id)
+    return True
+
+@router.post("/", response_model=TransactionResponse)
+async def create_transaction(
+    transaction: TransactionCreate,
+    db: Session = Depends(get_db)
+):
+    return await run_in_db(_create_transaction, db, transaction)
+
+@router.post("/bulk", response_model=BulkTransactionResponse)
+async def create_transactions_bulk(
+    transactions: List[TransactionCreate],
+    db: Session = Depends(get_db)
+):
+    """Insert many transactions in a single database transaction and return their ids"""
+    if len(transactions) > settings.BULK_INSERT_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.BULK_INSERT_MAX_ITEMS} transactions per request"
+        )
+    
+    ids = await run_in_db(bulk_insert_transactions, db, 1, transactions)  # Default user
+    return BulkTransactionResponse(inserted=len(ids), ids=ids)
+
 @router.get("/", response_model=List[TransactionResponse])
 async def get_transactions(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     transaction_type: Optional[str] = None,
     category: Optional[str] = None,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    query = db.query(Transaction).filter(Transaction.user_id == 1)  # Default user
-    
-    if transaction_type:
-        query = query.filter(Transaction.transaction_type == transaction_type)
-    if category:
-        query = query.filter(Transaction.category == category)
-    if start_date:
-        query = query.filter(Transaction.date >= start_date)
-    if end_date:
-        query = query.filter(Transaction.date <= end_date)
+    """
+    List transactions newest first
+
+    The body stays a plain list of transactions. When more rows exist, the
+    X-Next-Cursor response header holds the cursor to pass back as `cursor`
+    for the next page; it is absent on the last page. `skip` is offset
+    paging for clients that do not use cursors, and sending both is a 400.
+    """
+    try:
+        transactions, next_cursor = await run_in_db(
+            _list_transactions, db, skip, limit, transaction_type, category, start_date, end_date, cursor
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
     
-    transactions = query.offset(skip).limit(limit).all()
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return transactions
 
 @router.get("/{transaction_id}", response_model=TransactionResponse)
@@ -51,11 +148,8 @@ async def get_transaction(
     transaction_id: int,
     db: Session = Depends(get_db)
 ):
-    transaction = db.query(Transaction).filter(
-        Transaction.id == transaction_id,
-        Transaction.user_id == 1  # Default user
-    ).first()
-    
+    transaction = await run_in_db(_find_transaction, db, transaction_id)
+
     if not transaction:
         raise HTTPException(
             status_code=404,
@@ -69,22 +163,13 @@ async def update_transaction(
     transaction_update: TransactionCreate,
     db: Session = Depends(get_db)
 ):
-    transaction = db.query(Transaction).filter(
-        Transaction.id == transaction_id,
-        Transaction.user_id == 1  # Default user
-    ).first()
-    
+    transaction = await run_in_db(_update_transaction, db, transaction_id, transaction_update)
+
     if not transaction:
         raise HTTPException(
             status_code=404,
             detail="Transaction not found"
         )
-    
-    for field, value in transaction_update.dict().items():
-        setattr(transaction, field, value)
-    
-    db.commit()
-    db.refresh(transaction)
     return transaction
 
 @router.delete("/{transaction_id}")
@@ -92,17 +177,11 @@ async def delete_transaction(
     transaction_id: int,
     db: Session = Depends(get_db)
 ):
-    transaction = db.query(Transaction).filter(
-        Transaction.id == transaction_id,
-        Transaction.user_id == 1  # Default user
-    ).first()
-    
-    if not transaction:
+    deleted = await run_in_db(_delete_transaction, db, transaction_id)
+
+    if not deleted:
         raise HTTPException(
             status_code=404,
             detail="Transaction not found"
         )
-    
-    db.delete(transaction)
-    db.commit()
     return {"message": "Transaction deleted successfully"}
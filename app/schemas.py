@@ -1,11 +1,18 @@
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, PlainSerializer
+from typing import Annotated, Dict, Optional, List
 from datetime import datetime
+from decimal import Decimal
+from app.config import settings
 from app.models import TransactionType, GoalStatus
 
+# Money is an exact Decimal in Python (stored as integer cents) and a plain
+# number in JSON, so API clients see the same shape as before
+Amount = Annotated[Decimal, PlainSerializer(float, return_type=float, when_used="json")]
+
 # Transaction schemas
 class TransactionBase(BaseModel):
-    amount: float
+    amount: Amount
+    currency: str = settings.DEFAULT_CURRENCY
     description: str
     transaction_type: TransactionType
     category: str
@@ -22,11 +29,16 @@ class TransactionResponse(TransactionBase):
     class Config:
         from_attributes = True
 
+class BulkTransactionResponse(BaseModel):
+    inserted: int
+    ids: List[int]
+
 # Budget schemas
 class BudgetBase(BaseModel):
     name: str
     category: str
-    amount: float
+    amount: Amount
+    currency: str = settings.DEFAULT_CURRENCY
     period: str
     start_date: datetime
     end_date: datetime
@@ -46,8 +58,9 @@ class BudgetResponse(BudgetBase):
 class GoalBase(BaseModel):
     title: str
     description: Optional[str] = None
-    target_amount: float
-    current_amount: float = 0.0
+    target_amount: Amount
+    current_amount: Amount = Decimal("0")
+    currency: str = settings.DEFAULT_CURRENCY
     target_date: datetime
 
 class GoalCreate(GoalBase):
@@ -56,8 +69,8 @@ class GoalCreate(GoalBase):
 class GoalUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
-    target_amount: Optional[float] = None
-    current_amount: Optional[float] = None
+    target_amount: Optional[Amount] = None
+    current_amount: Optional[Amount] = None
     target_date: Optional[datetime] = None
     status: Optional[GoalStatus] = None
 
@@ -74,10 +87,10 @@ class GoalResponse(GoalBase):
 
 # Report schemas
 class SpendingReport(BaseModel):
-    total_income: float
-    total_expenses: float
-    net_income: float
-    category_breakdown: dict
+    total_income: Amount
+    total_expenses: Amount
+    net_income: Amount
+    category_breakdown: Dict[str, Amount]
     period: str
 
 class BudgetStatus(BaseModel):
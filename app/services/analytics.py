@@ -0,0 +1,138 @@
+"""
+Analytics Service Module
+Vectorized spending statistics computed with NumPy over the daily rollup.
+
+Rows are loaded as (day, cents, category_code) columns straight into arrays,
+then the daily series, rolling means, percentiles, weekday seasonality and
+category totals are all computed without a Python-level loop per row. Sums
+are taken over integer cents and scaled to currency units once at the end.
+NumPy is imported on first use so importing this module stays cheap.
+"""
+
+from sqlalchemy.orm import Session
+from sqlalchemy import Integer, String, and_, select, type_coerce
+from datetime import date
+from typing import Any, Dict, List, Sequence, Tuple
+
+from app.models import DailyCategoryTotal, TransactionType
+
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+PERCENTILES = (50, 75, 90, 95)
+ROLLING_WINDOWS = (7, 30)
+
+def load_daily_category_arrays(
+    db: Session,
+    user_id: int,
+    start_day: date,
+    end_day: date,
+    transaction_type: TransactionType = TransactionType.EXPENSE
+) -> Tuple[Any, Any, Any, Any, List[str]]:
+    """
+    Load the rollup rows of a period as NumPy arrays
+
+    Returns (days as datetime64[D], amounts in integer cents, category codes,
+    transaction counts, category names indexed by code). The query runs on the Core
+    connection so no ORM rows are built, and days are fetched as their ISO
+    text and parsed by NumPy in one call.
+    """
+    rows = db.connection().execute(
+        select(
+            type_coerce(DailyCategoryTotal.day, String),
+            type_coerce(DailyCategoryTotal.amount_sum, Integer),
+            DailyCategoryTotal.category,
+            DailyCategoryTotal.transaction_count
+        ).where(
+            and_(
+                DailyCategoryTotal.user_id == user_id,
+                DailyCategoryTotal.transaction_type == transaction_type,
+                DailyCategoryTotal.day >= start_day,
+                DailyCategoryTotal.day <= end_day
+            )
+        )
+    ).all()
+    return daily_category_arrays(rows)
+
+def daily_category_arrays(rows: Sequence[Tuple[str, int, str, int]]) -> Tuple[Any, Any, Any, Any, List[str]]:
+    """Arrays of load_daily_category_arrays() from (ISO day, cents, category, count) rows"""
+    import numpy as np
+
+    if not rows:
+        empty = np.empty(0)
+        return empty.astype("datetime64[D]"), empty.astype(np.int64), empty.astype(np.int64), empty.astype(np.int64), []
+
+    days, cents, categories, counts = zip(*rows)
+    category_codes: Dict[str, int] = {}
+    codes = [category_codes.setdefault(category, len(category_codes)) for category in categories]
+    return (
+        np.array(days, dtype="datetime64[D]"),
+        np.array(cents, dtype=np.int64),
+        np.array(codes, dtype=np.int64),
+        np.array(counts, dtype=np.int64),
+        list(category_codes)
+    )
+
+def _rolling_means(daily, window: int):
+    """Trailing means over `window` days via a cumulative sum; shorter series use every day"""
+    import numpy as np
+
+    window = min(window, len(daily))
+    cumulative = np.concatenate(([0.0], np.cumsum(daily)))
+    return (cumulative[window:] - cumulative[:-window]) / window
+
+def spending_statistics(db: Session, user_id: int, start_day: date, end_day: date) -> Dict[str, Any]:
+    """
+    Spending statistics of the days from start_day to end_day inclusive
+
+    Days without spending count as zero in the daily series, rolling means,
+    percentiles and weekday averages. Returns an empty dict when there is no
+    spending in the period.
+    """
+    return period_statistics(load_daily_category_arrays(db, user_id, start_day, end_day), start_day, end_day)
+
+def period_statistics(arrays: Tuple[Any, Any, Any, Any, List[str]], start_day: date, end_day: date) -> Dict[str, Any]:
+    """spending_statistics() over arrays already loaded by load_daily_category_arrays()"""
+    import numpy as np
+
+    days, cents, codes, counts, categories = arrays
+    if len(days) == 0:
+        return {}
+
+    start = np.datetime64(start_day, "D")
+    n_days = int((np.datetime64(end_day, "D") - start).astype(np.int64)) + 1
+    offsets = (days - start).astype(np.int64)
+
+    # Integer cents add exactly in float64 (below 2**53); scale once at the end
+    daily = np.bincount(offsets, weights=cents, minlength=n_days) / 100
+    category_totals = np.bincount(codes, weights=cents, minlength=len(categories)) / 100
+    spending_days = daily[daily > 0]
+
+    # 1970-01-01 was a Thursday (weekday 3)
+    weekdays = (np.arange(n_days) + (start.astype(np.int64) + 3)) % 7
+    weekday_totals = np.bincount(weekdays, weights=daily, minlength=7)
+    weekday_counts = np.bincount(weekdays, minlength=7)
+    weekday_means = np.divide(weekday_totals, weekday_counts, out=np.zeros(7), where=weekday_counts > 0)
+
+    order = np.argsort(category_totals)[::-1]
+    percentile_values = np.percentile(daily, PERCENTILES)
+
+    return {
+        "total_spent": float(daily.sum()),
+        "transaction_count": int(counts.sum()),
+        "days_with_spending": int(len(spending_days)),
+        "max_daily_spending": float(spending_days.max()) if len(spending_days) else 0.0,
+        "min_daily_spending": float(spending_days.min()) if len(spending_days) else 0.0,
+        "daily_std_dev": round(float(daily.std()), 2),
+        "daily_percentiles": {
+            f"p{pct}": round(float(value), 2) for pct, value in zip(PERCENTILES, percentile_values)
+        },
+        "rolling_means": {
+            f"{window}_day": round(float(_rolling_means(daily, window)[-1]), 2) for window in ROLLING_WINDOWS
+        },
+        "weekday_average_spending": {
+            name: round(float(value), 2) for name, value in zip(WEEKDAYS, weekday_means)
+        },
+        "category_breakdown": {
+            categories[code]: float(category_totals[code]) for code in order
+        },
+        "top_spending_category": (categories[order[0]], float(category_totals[order[0]])),
+    }
@@ -0,0 +1,62 @@
+"""
+Budget Service Module
+Evaluates every budget of a user against its spending in a single query
+"""
+
+from sqlalchemy.orm import Session
+from sqlalchemy import func, and_
+from typing import List, Dict, Any
+
+from app.models import Transaction, Budget, TransactionType
+
+def budget_status_label(percentage_used: float) -> str:
+    """Classify how much of a budget has been used"""
+    if percentage_used > 100:
+        return "over_budget"
+    elif percentage_used > 80:
+        return "on_track"
+    return "under_budget"
+
+def evaluate_budgets(db: Session, user_id: int) -> List[Dict[str, Any]]:
+    """
+    Compute spent/remaining amounts for all budgets of a user
+
+    Budgets are LEFT JOINed to the matching expense transactions and grouped
+    per budget, so the cost is one round trip regardless of the budget count.
+    """
+    spent_column = func.coalesce(func.sum(Transaction.amount), 0)
+    rows = db.query(
+        Budget.id,
+        Budget.name,
+        Budget.category,
+        Budget.amount,
+        spent_column
+    ).outerjoin(
+        Transaction,
+        and_(
+            Transaction.user_id == Budget.user_id,
+            Transaction.transaction_type == TransactionType.EXPENSE,
+            Transaction.category == Budget.category,
+            Transaction.date >= Budget.start_date,
+            Transaction.date <= Budget.end_date
+        )
+    ).filter(
+        Budget.user_id == user_id
+    ).group_by(Budget.id).order_by(Budget.id).all()
+
+    # Amounts are exact Decimals; callers get plain floats
+    budget_statuses = []
+    for budget_id, name, category, amount, spent in rows:
+        percentage_used = float(spent / amount * 100) if amount > 0 else 0.0
+        budget_statuses.append({
+            "budget_id": budget_id,
+            "budget_name": name,
+            "category": category,
+            "budget_amount": float(amount),
+            "spent_amount": float(spent),
+            "remaining_amount": float(amount - spent),
+            "percentage_used": percentage_used,
+            "status": budget_status_label(percentage_used)
+        })
+
+    return budget_statuses
@@ -0,0 +1,132 @@
+"""
+Report Service Module
+Report queries shared by the REST reports and the MCP tools
+"""
+
+from sqlalchemy.orm import Session
+from sqlalchemy import func, and_
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, Tuple, Union
+import csv
+import io
+
+from app.models import DailyCategoryTotal, Transaction, TransactionType
+from app.schemas import SpendingReport
+from app.services.transactions import ends_by
+
+def _as_day(value: Union[date, datetime]) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+def build_spending_report(db: Session, user_id: int, start_date: date, end_date: date) -> SpendingReport:
+    """
+    Build a spending report for the days from start_date to end_date inclusive
+
+    Reads the daily_category_totals rollup, so the cost is O(days x categories)
+    however many transactions the period holds.
+    """
+    rows = db.query(
+        DailyCategoryTotal.transaction_type,
+        DailyCategoryTotal.category,
+        func.sum(DailyCategoryTotal.amount_sum)
+    ).filter(
+        and_(
+            DailyCategoryTotal.user_id == user_id,
+            DailyCategoryTotal.day >= _as_day(start_date),
+            DailyCategoryTotal.day <= _as_day(end_date)
+        )
+    ).group_by(DailyCategoryTotal.transaction_type, DailyCategoryTotal.category).all()
+
+    total_income = 0
+    total_expenses = 0
+    category_breakdown = {}
+    for transaction_type, category, amount in rows:
+        if transaction_type == TransactionType.INCOME:
+            total_income += amount
+        elif transaction_type == TransactionType.EXPENSE:
+            total_expenses += amount
+            category_breakdown[category] = amount
+
+    return SpendingReport(
+        total_income=total_income,
+        total_expenses=total_expenses,
+        net_income=total_income - total_expenses,
+        category_breakdown=category_breakdown,
+        period=f"{start_date} to {end_date}"
+    )
+
+def summarize_category_totals(rows: Iterable[Tuple[TransactionType, str, Decimal, int]]) -> Dict[str, Any]:
+    """
+    Totals, net worth and the expense breakdown of (type, category, amount, count) rows
+
+    Amounts are summed as exact Decimals and returned as plain floats, the
+    shape of the get_financial_summary MCP tool.
+    """
+    total_income = Decimal(0)
+    total_expenses = Decimal(0)
+    transaction_count = 0
+    category_breakdown = {}
+    for transaction_type, category, amount, count in rows:
+        transaction_count += count
+        if transaction_type == TransactionType.INCOME:
+            total_income += amount
+        elif transaction_type == TransactionType.EXPENSE:
+            total_expenses += amount
+            category_breakdown[category] = category_breakdown.get(category, Decimal(0)) + amount
+
+    category_breakdown = {category: float(amount) for category, amount in category_breakdown.items()}
+    top_categories = sorted(category_breakdown.items(), key=lambda x: x[1], reverse=True)[:5]
+
+    return {
+        "total_income": float(total_income),
+        "total_expenses": float(total_expenses),
+        "net_worth": float(total_income - total_expenses),
+        "transaction_count": transaction_count,
+        "category_breakdown": category_breakdown,
+        "top_spending_categories": top_categories,
+    }
+
+CSV_HEADER = ["Date", "Type", "Category", "Description", "Amount"]
+
+def iter_transactions_csv(
+    db: Session,
+    user_id: int,
+    start_date: date,
+    end_date: date,
+    chunk_size: int = 1000
+) -> Iterator[str]:
+    """
+    Yield a transactions CSV export in chunks of `chunk_size` rows
+
+    Rows are fetched incrementally with yield_per and written through the csv
+    module, so memory stays flat and commas or quotes in fields are escaped.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADER)
+
+    rows = db.query(
+        Transaction.date,
+        Transaction.transaction_type,
+        Transaction.category,
+        Transaction.description,
+        Transaction.amount
+    ).filter(
+        and_(
+            Transaction.user_id == user_id,
+            Transaction.date >= start_date,
+            ends_by(end_date)
+        )
+    ).order_by(Transaction.date, Transaction.id).yield_per(chunk_size)
+
+    pending = 0
+    for transaction_date, transaction_type, category, description, amount in rows:
+        writer.writerow([transaction_date, transaction_type.value, category, description, amount])
+        pending += 1
+        if pending >= chunk_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+
+    yield buffer.getvalue()
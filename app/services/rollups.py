@@ -0,0 +1,137 @@
+"""
+Rollup Service Module
+Maintains the daily_category_totals rollup that reports read instead of
+scanning raw transactions
+"""
+
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, bindparam, delete, func, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.dialects import postgresql, sqlite
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from app.models import DailyCategoryTotal, Transaction, TransactionType
+from app.money import from_cents, to_cents
+
+RollupKey = Tuple[int, date, TransactionType, str]
+
+_table = DailyCategoryTotal.__table__
+_upsert_dialects = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+def rollup_values(transaction: Transaction) -> Dict[str, Any]:
+    """Snapshot of the fields the rollup is keyed on, taken before a transaction is changed"""
+    return {
+        "user_id": transaction.user_id,
+        "date": transaction.date,
+        "transaction_type": transaction.transaction_type,
+        "category": transaction.category,
+        "amount": transaction.amount,
+    }
+
+def _fact(transaction: Any) -> Tuple[RollupKey, int]:
+    """Rollup key and amount in integer cents of a Transaction or of a transactions-table row dict"""
+    values = transaction if isinstance(transaction, dict) else rollup_values(transaction)
+    transaction_date = values["date"]
+    day = transaction_date.date() if isinstance(transaction_date, datetime) else transaction_date
+    transaction_type = TransactionType(values["transaction_type"])
+    return (values["user_id"], day, transaction_type, values["category"]), to_cents(values["amount"])
+
+def _apply_deltas(conn: Connection, deltas: Dict[RollupKey, list]) -> None:
+    """Upsert (cents, count) deltas and drop groups whose count reached zero"""
+    if not deltas:
+        return
+
+    rows = [
+        {"user_id": user_id, "day": day, "transaction_type": transaction_type, "category": category,
+         "amount_sum": from_cents(cents), "transaction_count": count}
+        for (user_id, day, transaction_type, category), (cents, count) in deltas.items()
+    ]
+    upsert = _upsert_dialects[conn.dialect.name](_table)
+    upsert = upsert.on_conflict_do_update(
+        index_elements=[column.name for column in _table.primary_key],
+        set_={
+            "amount_sum": _table.c.amount_sum + upsert.excluded.amount_sum,
+            "transaction_count": _table.c.transaction_count + upsert.excluded.transaction_count,
+        }
+    )
+    conn.execute(upsert, rows)
+
+    emptied = [
+        {"k_user_id": row["user_id"], "k_day": row["day"],
+         "k_transaction_type": row["transaction_type"], "k_category": row["category"]}
+        for row in rows if row["transaction_count"] < 0
+    ]
+    if emptied:
+        conn.execute(
+            delete(_table).where(and_(
+                _table.c.user_id == bindparam("k_user_id"),
+                _table.c.day == bindparam("k_day"),
+                _table.c.transaction_type == bindparam("k_transaction_type"),
+                _table.c.category == bindparam("k_category"),
+                _table.c.transaction_count <= 0
+            )),
+            emptied
+        )
+
+def apply_daily_deltas(db: Session, deltas: Dict[RollupKey, list]) -> None:
+    """
+    Apply (cents, count) deltas the caller has already aggregated per rollup key
+
+    For bulk writers that compute integer cents anyway, so the rollup is built
+    in the same pass instead of converting every row again.
+    """
+    _apply_deltas(db.connection(), deltas)
+
+def update_daily_totals(db: Session, added: Iterable[Any] = (), removed: Iterable[Any] = ()) -> None:
+    """
+    Apply transaction changes to the rollup inside the caller's database transaction
+
+    `added` and `removed` hold Transaction objects or transactions-table row
+    dicts; for an update, pass the new row as added and its rollup_values()
+    from before the change as removed. Changes are pre-aggregated per
+    (user, day, type, category), so a bulk insert costs one upsert per group
+    rather than one per transaction.
+    """
+    deltas: Dict[RollupKey, list] = {}
+    for transactions, sign in ((added, 1), (removed, -1)):
+        for transaction in transactions:
+            key, cents = _fact(transaction)
+            delta = deltas.setdefault(key, [0, 0])
+            delta[0] += sign * cents
+            delta[1] += sign
+    _apply_deltas(db.connection(), deltas)
+
+def rebuild_daily_totals(conn: Connection, user_id: Optional[int] = None) -> int:
+    """
+    Recompute the rollup from the transactions table, for one user or everyone
+
+    Used to backfill existing databases and to repair the rollup after rows
+    were written behind the services' back. Returns the number of rollup rows.
+    """
+    clear = delete(_table)
+    source = select(
+        Transaction.user_id,
+        func.date(Transaction.date),
+        Transaction.transaction_type,
+        Transaction.category,
+        func.sum(Transaction.amount),
+        func.count()
+    ).where(Transaction.date.is_not(None))
+    if user_id is not None:
+        clear = clear.where(_table.c.user_id == user_id)
+        source = source.where(Transaction.user_id == user_id)
+    source = source.group_by(
+        Transaction.user_id, func.date(Transaction.date), Transaction.transaction_type, Transaction.category
+    )
+
+    conn.execute(clear)
+    conn.execute(_table.insert().from_select(
+        ["user_id", "day", "transaction_type", "category", "amount_sum", "transaction_count"],
+        source
+    ))
+
+    count = select(func.count()).select_from(_table)
+    if user_id is not None:
+        count = count.where(_table.c.user_id == user_id)
+    return conn.execute(count).scalar()
@@ -0,0 +1,69 @@
+"""
+Snapshot Service Module
+One consistent read of a user's finances for the financial_snapshot MCP tool.
+
+begin_read_snapshot() opens a read transaction, so every query that follows
+sees the same committed state even while other calls write. The period's
+daily rollup is scanned once and feeds both the summary totals and the NumPy
+spending statistics.
+"""
+
+from sqlalchemy.orm import Session
+from sqlalchemy import Integer, String, and_, select, type_coerce
+from collections import defaultdict
+from datetime import date
+from typing import Any, Dict, List, Tuple
+
+from app.models import DailyCategoryTotal, TransactionType
+from app.money import from_cents
+from app.services.analytics import daily_category_arrays, period_statistics
+from app.services.reports import summarize_category_totals
+
+SECTIONS = ("summary", "spending", "budgets", "goals", "transactions")
+
+def begin_read_snapshot(db: Session) -> None:
+    """Start the read transaction that the session's following queries share"""
+    connection = db.connection()
+    if connection.dialect.name == "sqlite":
+        # pysqlite only opens a transaction before writes, so without an explicit
+        # BEGIN every SELECT would read its own snapshot
+        connection.exec_driver_sql("BEGIN")
+
+def load_period_rollup(db: Session, user_id: int, start_day: date, end_day: date) -> List[Tuple[str, TransactionType, str, int, int]]:
+    """(ISO day, type, category, cents, count) rollup rows of the days from start_day to end_day"""
+    return db.connection().execute(
+        select(
+            type_coerce(DailyCategoryTotal.day, String),
+            DailyCategoryTotal.transaction_type,
+            DailyCategoryTotal.category,
+            type_coerce(DailyCategoryTotal.amount_sum, Integer),
+            DailyCategoryTotal.transaction_count
+        ).where(
+            and_(
+                DailyCategoryTotal.user_id == user_id,
+                DailyCategoryTotal.day >= start_day,
+                DailyCategoryTotal.day <= end_day
+            )
+        )
+    ).all()
+
+def summarize_period(rows: List[Tuple[str, TransactionType, str, int, int]]) -> Dict[str, Any]:
+    """get_financial_summary totals of load_period_rollup() rows"""
+    totals: Dict[Tuple[TransactionType, str], List[int]] = defaultdict(lambda: [0, 0])
+    for _, transaction_type, category, cents, count in rows:
+        total = totals[transaction_type, category]
+        total[0] += cents
+        total[1] += count
+    return summarize_category_totals(
+        (transaction_type, category, from_cents(cents), count)
+        for (transaction_type, category), (cents, count) in totals.items()
+    )
+
+def period_spending(rows: List[Tuple[str, TransactionType, str, int, int]], start_day: date, end_day: date) -> Dict[str, Any]:
+    """analyze_spending_patterns statistics of load_period_rollup() rows"""
+    expenses = [
+        (day, cents, category, count)
+        for day, transaction_type, category, cents, count in rows
+        if transaction_type == TransactionType.EXPENSE
+    ]
+    return period_statistics(daily_category_arrays(expenses), start_day, end_day)
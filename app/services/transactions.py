@@ -0,0 +1,170 @@
+"""
+Transaction Service Module
+Transaction listing and ingestion shared by the REST API and the MCP tools
+"""
+
+from sqlalchemy.orm import Session
+from sqlalchemy import Integer, column, insert, table, tuple_
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Tuple, Union
+import base64
+import json
+
+from app.models import Transaction, utc_now
+from app.money import Money, to_cents
+from app.schemas import TransactionCreate
+from app.services.rollups import RollupKey, apply_daily_deltas
+from app.cache import report_cache
+
+# The transactions table with Money columns as plain integers: bulk inserts
+# bind the cents they already computed instead of converting each row again
+_plain_transactions = table(
+    Transaction.__table__.name,
+    *(column(c.name, Integer if isinstance(c.type, Money) else c.type) for c in Transaction.__table__.columns)
+)
+
+def ends_by(end_date: Union[date, datetime]):
+    """
+    Filter for transactions dated on or before the day of end_date
+
+    The bound is midnight after that day, so the whole end day is included,
+    like the day-keyed rollup the reports read.
+    """
+    day = end_date.date() if isinstance(end_date, datetime) else end_date
+    return Transaction.date < datetime.combine(day + timedelta(days=1), time.min)
+
+def encode_cursor(transaction: Transaction) -> str:
+    """Opaque cursor pointing just past the given transaction in (date, id) order"""
+    return cursor_for(transaction.date, transaction.id)
+
+def cursor_for(transaction_date: datetime, transaction_id: int) -> str:
+    """Opaque cursor pointing just past the (date, id) position"""
+    payload = json.dumps({"d": transaction_date.isoformat(), "i": transaction_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by encode_cursor, raising ValueError if it is malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["d"]), int(payload["i"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+def list_transactions_page(
+    db: Session,
+    user_id: int,
+    limit: int,
+    transaction_type: Optional[str] = None,
+    category: Optional[str] = None,
+    start_date: Optional[Union[date, datetime]] = None,
+    end_date: Optional[Union[date, datetime]] = None,
+    cursor: Optional[str] = None,
+    skip: int = 0
+) -> Tuple[List[Transaction], Optional[str]]:
+    """
+    Return one page of transactions, newest first, and the cursor of the next page
+
+    Pages are ordered by (date, id) descending and continued with a
+    `(date, id) < cursor` predicate, which the (user_id, date) index serves
+    directly, so every page costs the same however deep it is. `skip` is the
+    older offset paging and cannot be combined with a cursor, which already
+    marks where the page starts; that raises ValueError.
+    """
+    if cursor and skip:
+        raise ValueError("skip cannot be combined with cursor; the cursor already marks where the page starts")
+    if limit <= 0:
+        return [], None
+
+    query = db.query(Transaction).filter(Transaction.user_id == user_id)
+
+    if transaction_type:
+        query = query.filter(Transaction.transaction_type == transaction_type)
+    if category:
+        query = query.filter(Transaction.category == category)
+    if start_date:
+        query = query.filter(Transaction.date >= start_date)
+    if end_date:
+        query = query.filter(ends_by(end_date))
+    if cursor:
+        cursor_date, cursor_id = decode_cursor(cursor)
+        query = query.filter(tuple_(Transaction.date, Transaction.id) < tuple_(cursor_date, cursor_id))
+
+    query = query.order_by(Transaction.date.desc(), Transaction.id.desc())
+    if skip:
+        query = query.offset(skip)
+
+    # Fetch one extra row to learn whether another page exists
+    transactions = query.limit(limit + 1).all()
+    if len(transactions) > limit:
+        transactions = transactions[:limit]
+        return transactions, encode_cursor(transactions[-1])
+    return transactions, None
+
+def bulk_insert_transactions(db: Session, user_id: int, transactions: List[TransactionCreate]) -> List[int]:
+    """
+    Insert already-validated transactions in one database transaction
+
+    Rows go through a single Core executemany and one commit, together with
+    the matching daily_category_totals upserts. Each amount is converted to
+    cents once, and the same pass builds the insert rows and the rollup
+    deltas. Returns the new ids in the same order as the input.
+    """
+    if not transactions:
+        return []
+
+    # Core inserts skip the column's Python default, so apply the same clock here
+    now = utc_now()
+    rows = []
+    deltas: Dict[RollupKey, list] = {}
+    for transaction in transactions:
+        cents = to_cents(transaction.amount)
+        transaction_date = transaction.date or now
+        rows.append({
+            "amount_cents": cents,
+            "currency": transaction.currency,
+            "description": transaction.description,
+            "transaction_type": transaction.transaction_type,
+            "category": transaction.category,
+            "date": transaction_date,
+            "user_id": user_id
+        })
+        key = (user_id, transaction_date.date(), transaction.transaction_type, transaction.category)
+        delta = deltas.setdefault(key, [0, 0])
+        delta[0] += cents
+        delta[1] += 1
+
+    try:
+        conn = db.connection()
+        if conn.dialect.name == "sqlite":
+            # Plain executemany is ~3x faster than INSERT ... RETURNING here. The
+            # table has no AUTOINCREMENT and the write transaction holds the
+            # database lock, so the new rowids are consecutive up to last_insert_rowid().
+            # The driver gets ready-made tuples, each column converted once by the
+            # dialect's own bind processor: SQLAlchemy's per-row parameter
+            # handling would cost more than all the other Python work here.
+            names = list(rows[0])
+            columns = []
+            for name in names:
+                process = _plain_transactions.c[name].type.dialect_impl(conn.dialect).bind_processor(conn.dialect)
+                values = [row[name] for row in rows]
+                columns.append(values if process is None else [process(value) for value in values])
+            conn.exec_driver_sql(
+                f"INSERT INTO {_plain_transactions.name} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})",
+                list(zip(*columns))
+            )
+            last_id = conn.exec_driver_sql("SELECT last_insert_rowid()").scalar()
+            ids = list(range(last_id - len(rows) + 1, last_id + 1))
+        else:
+            result = conn.execute(
+                insert(_plain_transactions).returning(_plain_transactions.c.id, sort_by_parameter_order=True),
+                rows
+            )
+            ids = list(result.scalars())
+        apply_daily_deltas(db, deltas)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    report_cache.bump(user_id)
+    return ids
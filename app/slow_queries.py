@@ -0,0 +1,159 @@
+"""
+Slow Query Module
+Records every SQL statement slower than SLOW_QUERY_THRESHOLD_MS.
+
+The cursor hooks installed by instrument_slow_queries() time each statement.
+A statement over the threshold is logged and kept in a bounded ring buffer
+with its normalized SQL (literals and IN lists collapsed to ?), the shape of
+its bind parameters, its duration, the route or MCP tool that issued it
+(from the active metrics scope) and its EXPLAIN QUERY PLAN. Plans are
+captured once per normalized statement. The buffer is served from
+/debug/slow-queries.
+
+SQLite steps a statement lazily, so a duration covers execution up to the
+first row: the whole cost of an aggregate or sort, but not the fetching of
+a long result.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+from app.metrics import current_scope
+
+logger = logging.getLogger(__name__)
+
+# Normalized statements whose plan is remembered
+PLAN_CACHE_SIZE = 256
+
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "REPLACE")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+def normalize_sql(statement: str) -> str:
+    """The statement on one line, with literals replaced by ? and lists of them by (?, ...)"""
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _STRING_LITERAL.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    return _PLACEHOLDER_LIST.sub("(?, ...)", normalized)
+
+def bind_shape(parameters: Any, executemany: bool = False) -> Any:
+    """Type names of the bind parameters, never their values"""
+    if executemany:
+        rows = list(parameters)
+        return {"rows": len(rows), "each": bind_shape(rows[0]) if rows else None}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__ if parameters is not None else None
+
+def explain_query_plan(dbapi_connection, statement: str, parameters: Any) -> List[str]:
+    """EXPLAIN QUERY PLAN of a statement as indented detail lines"""
+    cursor = dbapi_connection.cursor()
+    cursor.row_factory = None  # Plan rows are not rows returned to the caller
+    try:
+        rows = cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ()).fetchall()
+    finally:
+        cursor.close()
+    depth = {0: -1}
+    lines = []
+    for node_id, parent, _, detail in rows:
+        depth[node_id] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node_id] + detail)
+    return lines
+
+class SlowQueryLog:
+    """Thread-safe ring buffer of slow statements, newest last"""
+
+    def __init__(self, size: int):
+        self._lock = threading.Lock()
+        self._entries: Deque[Dict[str, Any]] = deque(maxlen=size)
+        self._plans: "OrderedDict[str, List[str]]" = OrderedDict()
+        self.recorded = 0
+
+    def record(self, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries.append(entry)
+            self.recorded += 1
+
+    def cached_plan(self, normalized: str) -> Optional[List[str]]:
+        with self._lock:
+            plan = self._plans.get(normalized)
+            if plan is not None:
+                self._plans.move_to_end(normalized)
+            return plan
+
+    def remember_plan(self, normalized: str, plan: List[str]) -> None:
+        with self._lock:
+            self._plans[normalized] = plan
+            if len(self._plans) > PLAN_CACHE_SIZE:
+                self._plans.popitem(last=False)
+
+    def entries(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """The most recent entries, newest first"""
+        with self._lock:
+            entries = list(self._entries)
+        entries.reverse()
+        return entries[:limit] if limit else entries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._plans.clear()
+            self.recorded = 0
+
+slow_query_log = SlowQueryLog(settings.SLOW_QUERY_LOG_SIZE)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None:
+        context.slow_query_started = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is None:
+        return
+    duration_ms = (time.perf_counter() - context.slow_query_started) * 1000
+    if duration_ms < settings.SLOW_QUERY_THRESHOLD_MS:
+        return
+
+    normalized = normalize_sql(statement)
+    plan = slow_query_log.cached_plan(normalized)
+    if plan is None and conn.dialect.name == "sqlite" and statement.lstrip().upper().startswith(_EXPLAINABLE):
+        try:
+            first = parameters[0] if executemany and parameters else parameters
+            plan = explain_query_plan(cursor.connection, statement, first)
+            slow_query_log.remember_plan(normalized, plan)
+        except Exception as e:  # A plan is a diagnostic; never fail the statement over it
+            plan = [f"EXPLAIN QUERY PLAN failed: {e}"]
+
+    scope = current_scope()
+    entry = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "duration_ms": round(duration_ms, 3),
+        "sql": normalized,
+        "bind_shape": bind_shape(parameters, executemany),
+        "source": f"{scope.kind} {scope.name}" if scope is not None else None,
+        "plan": plan,
+    }
+    slow_query_log.record(entry)
+    logger.warning(
+        "Slow query (%.1f ms) from %s: %s\n%s",
+        duration_ms, entry["source"] or "no request", normalized, "\n".join(plan or [])
+    )
+
+def instrument_slow_queries(engine: Engine) -> None:
+    """Record the statements of an engine that run past SLOW_QUERY_THRESHOLD_MS"""
+    if settings.SLOW_QUERY_LOG_SIZE <= 0:
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
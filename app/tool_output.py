@@ -0,0 +1,119 @@
+"""
+Tool Output Module
+Compact, token-budgeted encodings for MCP tool results.
+
+Lists of records can be returned as a column-oriented table (keys once, rows
+as arrays) and projected onto the fields a caller asks for. A max_tokens
+budget caps the encoded size: fit_to_budget() finds how many records fit next
+to the result's aggregates, so an over-budget call returns a summary, the
+rows that fit and a cursor to continue from. with_meta() reports the size of
+every result in bytes and estimated tokens.
+"""
+
+import base64
+import json
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+ROWS = "rows"
+TABLE = "table"
+FORMATS = (ROWS, TABLE)
+
+# Rough size of one LLM token in bytes of compact JSON
+BYTES_PER_TOKEN = 4
+
+# Entries kept in the top-N lists of summarized output
+TOP_N = 5
+
+def encoded_size(payload: Any) -> int:
+    """Size in bytes of the payload as compact JSON"""
+    return len(json.dumps(payload, separators=(",", ":"), default=str).encode())
+
+def estimate_tokens(size: int) -> int:
+    return -(-size // BYTES_PER_TOKEN)
+
+def with_meta(payload: Dict[str, Any], output_format: str, truncated: bool = False) -> Dict[str, Any]:
+    """Add the encoded size and estimated token count of the payload under "_meta" """
+    size = encoded_size(payload)
+    payload["_meta"] = {
+        "format": output_format,
+        "bytes": size,
+        "estimated_tokens": estimate_tokens(size),
+        "truncated": truncated,
+    }
+    return payload
+
+def check_format(output_format: str) -> None:
+    if output_format not in FORMATS:
+        raise ValueError(f"Unknown output format '{output_format}', expected one of {', '.join(FORMATS)}")
+
+def project(available: Sequence[str], fields: Optional[Sequence[str]]) -> List[str]:
+    """The requested fields in the order given, or every available field"""
+    if not fields:
+        return list(available)
+    unknown = [field for field in fields if field not in available]
+    if unknown:
+        raise ValueError(f"Unknown fields {', '.join(unknown)}, expected some of {', '.join(available)}")
+    return list(dict.fromkeys(fields))
+
+def compact_timestamp(value: Optional[str]) -> Optional[str]:
+    """Drop the microseconds of an ISO timestamp, and its time when that is midnight"""
+    if not value:
+        return value
+    value = value[:19]
+    return value[:10] if value.endswith("T00:00:00") else value
+
+def encode_records(
+    records: Sequence[Dict[str, Any]],
+    columns: Sequence[str],
+    output_format: str,
+    timestamps: Sequence[str] = ()
+) -> Any:
+    """
+    Records as a list of dicts (rows) or {"columns": [...], "rows": [[...]]} (table)
+
+    Only `columns` are kept. Table output also compacts the `timestamps` columns.
+    """
+    if output_format == ROWS:
+        return [{column: record[column] for column in columns} for record in records]
+    compact = [column in timestamps for column in columns]
+    return {
+        "columns": list(columns),
+        "rows": [
+            [compact_timestamp(record[column]) if is_timestamp else record[column]
+             for column, is_timestamp in zip(columns, compact)]
+            for record in records
+        ],
+    }
+
+def fit_to_budget(build: Callable[[int], Dict[str, Any]], count: int, max_tokens: int) -> Tuple[Dict[str, Any], int]:
+    """
+    The payload build(n) for the largest n <= count that fits in max_tokens
+
+    build(n) must grow with n. Returns build(0) when not even that fits, so
+    a summary is always returned.
+    """
+    low, high = 0, count
+    while low < high:
+        middle = (low + high + 1) // 2
+        if estimate_tokens(encoded_size(build(middle))) <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    return build(low), low
+
+def encode_offset(offset: int) -> str:
+    """Opaque cursor for continuing a truncated list at `offset`"""
+    return base64.urlsafe_b64encode(json.dumps({"o": offset}).encode()).decode().rstrip("=")
+
+def decode_offset(cursor: Optional[str]) -> int:
+    """Offset of a cursor produced by encode_offset, raising ValueError if it is malformed"""
+    if not cursor:
+        return 0
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        offset = int(json.loads(base64.urlsafe_b64decode(padded.encode()))["o"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if offset < 0:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return offset
@@ -0,0 +1,311 @@
+"""
+Tool Session Module
+Scoped database sessions for MCP tool calls, with a statement timeout and a
+per-call query budget.
+
+tool_session() checks one connection out of the engine's pool for the length
+of a tool call and binds a Session to it. While the call runs, a SQLite
+progress handler aborts any statement that runs past the tool's timeout, and
+every statement and every row read is counted against the query budget. Over
+budget, the call is rejected (MCP_QUERY_BUDGET_MODE=reject) or finishes with
+a logged warning (warn), so one runaway request cannot monopolise the database.
+
+run_tool() is the async entry point used by the MCP tools: it waits for a
+slot under the read or write concurrency cap, runs the tool body in a
+tool_session on the DB executor, and interrupts the running SQLite statement
+when the awaiting task is cancelled.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import db_executor
+
+logger = logging.getLogger(__name__)
+
+# SQLite VM instructions between two deadline checks
+PROGRESS_HANDLER_STEPS = 1000
+
+class QueryBudgetExceeded(Exception):
+    """A tool call ran more statements or read more rows than its budget allows"""
+
+class ToolTimeout(Exception):
+    """A statement of a tool call ran past the tool's statement timeout"""
+
+class ToolCancelled(Exception):
+    """A tool call was cancelled by its caller while it was running"""
+
+class CancelScope:
+    """Lets another thread cancel a tool call by interrupting its SQLite statement"""
+
+    def __init__(self):
+        self.cancelled = False
+        self._lock = threading.Lock()
+        self._connection = None
+
+    def attach(self, dbapi_connection) -> None:
+        with self._lock:
+            self._connection = dbapi_connection
+
+    def detach(self) -> None:
+        # Under the lock, so a connection back in the pool is never interrupted
+        with self._lock:
+            self._connection = None
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            if self._connection is not None:
+                self._connection.interrupt()
+
+class ToolCall:
+    """Statement and row counters of one tool call, enforcing its budget as they grow"""
+
+    def __init__(
+        self,
+        tool: str,
+        timeout_ms: int,
+        max_statements: int,
+        max_rows: int,
+        reject: bool,
+        cancel_scope: Optional[CancelScope] = None
+    ):
+        self.tool = tool
+        self.timeout_ms = timeout_ms
+        self.max_statements = max_statements
+        self.max_rows = max_rows
+        self.reject = reject
+        self.cancel_scope = cancel_scope
+        self.statements = 0
+        self.rows_read = 0
+        self.rows_written = 0
+        self.over_budget = False
+        self.timed_out = False
+        self.next_row_factory = None
+        self._deadline = float("inf")
+
+    def _exceeded(self, what: str) -> None:
+        self.over_budget = True
+        if self.reject:
+            raise QueryBudgetExceeded(
+                f"{self.tool} exceeded its query budget of {what} "
+                f"({self.statements} statements, {self.rows_read} rows read)"
+            )
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_scope is not None and self.cancel_scope.cancelled
+
+    def before_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if self.cancelled:
+            raise ToolCancelled(f"{self.tool} was cancelled")
+        if self.statements >= self.max_statements:
+            self._exceeded(f"{self.max_statements} statements")
+        self.statements += 1
+        self._deadline = time.monotonic() + self.timeout_ms / 1000
+
+    def after_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        # rowcount is -1 for SELECTs; their rows are counted as they are fetched
+        if cursor.rowcount > 0:
+            self.rows_written += cursor.rowcount
+
+    def count_row(self, cursor, row):
+        """sqlite3 row_factory that counts rows read and passes them on to the connection's own factory"""
+        self.rows_read += 1
+        if self.rows_read > self.max_rows and not self.over_budget:
+            self._exceeded(f"{self.max_rows} rows")
+        return row if self.next_row_factory is None else self.next_row_factory(cursor, row)
+
+    def check_deadline(self) -> int:
+        """sqlite3 progress handler; a non-zero return interrupts the running statement"""
+        if self.cancelled:
+            return 1
+        if time.monotonic() > self._deadline:
+            self.timed_out = True
+            return 1
+        return 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "tool": self.tool,
+            "statements": self.statements,
+            "rows_read": self.rows_read,
+            "rows_written": self.rows_written,
+            "over_budget": self.over_budget,
+            "timed_out": self.timed_out,
+        }
+
+class ToolUsage:
+    """Thread-safe per-tool totals of the calls made through tool_session()"""
+
+    _FIELDS = ("calls", "statements", "rows_read", "rows_written", "over_budget",
+               "rejected", "timeouts", "cancelled", "errors")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tools: Dict[str, Dict[str, int]] = {}
+
+    def record(self, call: ToolCall, outcome: str) -> None:
+        with self._lock:
+            totals = self._tools.setdefault(call.tool, dict.fromkeys(self._FIELDS + ("max_statements", "max_rows_read"), 0))
+            totals["calls"] += 1
+            totals["statements"] += call.statements
+            totals["rows_read"] += call.rows_read
+            totals["rows_written"] += call.rows_written
+            totals["over_budget"] += call.over_budget
+            totals["max_statements"] = max(totals["max_statements"], call.statements)
+            totals["max_rows_read"] = max(totals["max_rows_read"], call.rows_read)
+            if outcome != "ok":
+                totals[outcome] += 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {tool: dict(totals) for tool, totals in self._tools.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tools.clear()
+
+tool_usage = ToolUsage()
+
+@contextmanager
+def tool_session(
+    tool: str,
+    bind: Engine,
+    timeout_ms: Optional[int] = None,
+    max_statements: Optional[int] = None,
+    max_rows: Optional[int] = None,
+    cancel_scope: Optional[CancelScope] = None
+) -> Iterator[Session]:
+    """
+    Session for one MCP tool call, closed (and rolled back if uncommitted) on exit
+
+    Limits default to the MCP_TOOL_TIMEOUT_MS and MCP_QUERY_BUDGET_* settings.
+    A statement past the timeout raises ToolTimeout; a call over budget raises
+    QueryBudgetExceeded in reject mode, and cancelling `cancel_scope` raises
+    ToolCancelled. The call's counters are available as db.info["tool_call"]
+    and are added to tool_usage on exit.
+    """
+    call = ToolCall(
+        tool,
+        timeout_ms=timeout_ms or settings.MCP_TOOL_TIMEOUT_MS,
+        max_statements=max_statements or settings.MCP_QUERY_BUDGET_STATEMENTS,
+        max_rows=max_rows or settings.MCP_QUERY_BUDGET_ROWS,
+        reject=settings.MCP_QUERY_BUDGET_MODE == "reject",
+        cancel_scope=cancel_scope
+    )
+    outcome = "ok"
+    with bind.connect() as conn:
+        event.listen(conn, "before_cursor_execute", call.before_execute)
+        event.listen(conn, "after_cursor_execute", call.after_execute)
+        dbapi_connection = conn.connection.dbapi_connection
+        is_sqlite = conn.dialect.name == "sqlite"
+        if is_sqlite:
+            call.next_row_factory = dbapi_connection.row_factory
+            dbapi_connection.row_factory = call.count_row
+            dbapi_connection.set_progress_handler(call.check_deadline, PROGRESS_HANDLER_STEPS)
+            if cancel_scope is not None:
+                cancel_scope.attach(dbapi_connection)
+
+        db = Session(bind=conn)
+        db.info["tool_call"] = call
+        try:
+            yield db
+        except QueryBudgetExceeded:
+            outcome = "rejected"
+            raise
+        except ToolCancelled:
+            outcome = "cancelled"
+            raise
+        except OperationalError as e:
+            if call.cancelled:
+                outcome = "cancelled"
+                raise ToolCancelled(f"{tool} was cancelled") from e
+            if not call.timed_out:
+                outcome = "errors"
+                raise
+            outcome = "timeouts"
+            raise ToolTimeout(f"{tool} statement exceeded {call.timeout_ms} ms") from e
+        except Exception:
+            outcome = "errors"
+            raise
+        finally:
+            db.close()
+            if cancel_scope is not None:
+                cancel_scope.detach()
+            if is_sqlite:
+                dbapi_connection.row_factory = call.next_row_factory
+                dbapi_connection.set_progress_handler(None, 0)
+            tool_usage.record(call, outcome)
+            if call.over_budget and outcome != "rejected":
+                logger.warning("MCP tool over query budget: %s", call.as_dict())
+
+READ = "read"
+WRITE = "write"
+
+# Concurrency caps per tool kind, created per event loop
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = \
+    weakref.WeakKeyDictionary()
+
+def _semaphore(kind: str) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphores = _semaphores.get(loop)
+    if semaphores is None:
+        semaphores = _semaphores[loop] = {
+            READ: asyncio.Semaphore(settings.MCP_READ_CONCURRENCY),
+            WRITE: asyncio.Semaphore(settings.MCP_WRITE_CONCURRENCY),
+        }
+    return semaphores[kind]
+
+def _run_in_session(tool: str, bind: Engine, cancel_scope: CancelScope, limits: Dict[str, Any],
+                    func: Callable[..., Any], args: tuple) -> Any:
+    with tool_session(tool, bind, cancel_scope=cancel_scope, **limits) as db:
+        return func(db, *args)
+
+async def run_tool(tool: str, kind: str, bind: Engine, func: Callable[..., Any], *args, **limits) -> Any:
+    """
+    Run func(db, *args) for an MCP tool on the DB executor and await its result
+
+    Callers wait for a slot under the MCP_READ_CONCURRENCY or
+    MCP_WRITE_CONCURRENCY cap on the event loop, not on a worker thread.
+    Cancelling the awaiting task interrupts the running statement; the slot
+    is held until the worker has actually stopped. `limits` are passed on to
+    tool_session().
+    """
+    semaphore = _semaphore(kind)
+    await semaphore.acquire()
+    cancel_scope = CancelScope()
+
+    def finished(future: asyncio.Future) -> None:
+        semaphore.release()
+        if not future.cancelled():
+            future.exception()  # Retrieved here when the caller is gone
+
+    try:
+        context = contextvars.copy_context()
+        future = asyncio.get_running_loop().run_in_executor(
+            db_executor, functools.partial(context.run, _run_in_session, tool, bind, cancel_scope, limits, func, args)
+        )
+    except BaseException:
+        semaphore.release()
+        raise
+    future.add_done_callback(finished)
+
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        cancel_scope.cancel()
+        raise
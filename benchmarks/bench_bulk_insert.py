@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Bulk ingestion benchmark
+Measures rows per second of app.services.transactions.bulk_insert_transactions
+on a WAL-mode database against one ORM add/commit/refresh per row.
+
+Usage: python benchmarks/bench_bulk_insert.py [--rows 100000] [--single-rows 2000]
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime
+from decimal import Decimal
+
+from common import create_bench_engine
+
+from sqlalchemy.orm import Session
+
+from app.models import Transaction
+from app.schemas import TransactionCreate
+from app.services.transactions import bulk_insert_transactions
+from generate_dataset import transaction_batches
+
+def make_items(rows, seed=7):
+    return [
+        TransactionCreate(
+            amount=Decimal(cents).scaleb(-2),
+            currency=currency,
+            description=description,
+            transaction_type=kind.lower(),
+            category=category,
+            date=datetime.fromisoformat(date)
+        )
+        for batch in transaction_batches([1], rows, seed=seed)
+        for cents, currency, description, kind, category, date, _ in batch
+    ]
+
+def bulk_rate(rows):
+    engine = create_bench_engine()
+    items = make_items(rows)
+    started = time.perf_counter()
+    with Session(engine) as db:
+        ids = bulk_insert_transactions(db, 1, items)
+    elapsed = time.perf_counter() - started
+    assert len(ids) == rows
+    engine.dispose()
+    return round(rows / elapsed, 1)
+
+def single_row_rate(rows):
+    engine = create_bench_engine()
+    items = make_items(rows)
+    started = time.perf_counter()
+    with Session(engine) as db:
+        for item in items:
+            transaction = Transaction(**item.model_dump(), user_id=1)
+            db.add(transaction)
+            db.commit()
+            db.refresh(transaction)
+    elapsed = time.perf_counter() - started
+    engine.dispose()
+    return round(rows / elapsed, 1)
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk vs per-row transaction inserts")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--single-rows", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(json.dumps({
+        "bulk_rows": args.rows,
+        "bulk_rows_per_second": bulk_rate(args.rows),
+        "single_rows": args.single_rows,
+        "single_row_commits_per_second": single_row_rate(args.single_rows),
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for the REST API
+Measures /api/v1/transactions/ latency while /api/v1/reports/spending runs in parallel,
+once with database work on the DB executor and once inline on the event loop.
+The report cache is switched off so every report load runs its query.
+
+Usage: python benchmarks/bench_concurrency.py [--rows 200000] [--requests 200]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import date, timedelta
+
+from common import create_bench_engine, make_session_override, seed_transactions, summarize
+
+import httpx
+
+from app import cache
+from app.main import app
+from app.database import get_db
+from app.routers import transactions_simple, reports_simple
+
+# Modules whose run_in_db the inline run replaces; reports reach it through app.cache
+RUN_IN_DB_MODULES = (transactions_simple, reports_simple, cache)
+
+async def _run_inline(func, *args, **kwargs):
+    """Pre-executor behaviour: run the blocking query directly on the event loop"""
+    return func(*args, **kwargs)
+
+async def measure(requests: int, report_workers: int):
+    start_date = (date.today() - timedelta(days=60)).isoformat()
+    end_date = (date.today() + timedelta(days=1)).isoformat()
+    transport = httpx.ASGITransport(app=app)
+    stop = asyncio.Event()
+    reports_done = 0
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def report_load():
+            nonlocal reports_done
+            while not stop.is_set():
+                response = await client.get(
+                    "/api/v1/reports/spending",
+                    params={"start_date": start_date, "end_date": end_date}
+                )
+                response.raise_for_status()
+                reports_done += 1
+
+        loaders = [asyncio.create_task(report_load()) for _ in range(report_workers)]
+        await asyncio.sleep(0.05)
+
+        latencies = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            response = await client.get("/api/v1/transactions/", params={"limit": 20})
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+
+        stop.set()
+        await asyncio.gather(*loaders)
+
+    result = summarize(latencies)
+    result["spending_reports_completed"] = reports_done
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Transaction listing latency under report load")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--report-workers", type=int, default=2)
+    args = parser.parse_args()
+
+    engine = create_bench_engine()
+    seed_transactions(engine, args.rows)
+    app.dependency_overrides[get_db] = make_session_override(engine)
+    # Cache hits are answered on the event loop in both modes and would hide the difference
+    cache.report_cache.max_entries = 0
+    cache.report_cache.clear()
+
+    results = {"rows": args.rows}
+    results["executor"] = asyncio.run(measure(args.requests, args.report_workers))
+
+    executor_run_in_db = transactions_simple.run_in_db
+    for module in RUN_IN_DB_MODULES:
+        module.run_in_db = _run_inline
+    try:
+        results["inline"] = asyncio.run(measure(args.requests, args.report_workers))
+    finally:
+        for module in RUN_IN_DB_MODULES:
+            module.run_in_db = executor_run_in_db
+
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
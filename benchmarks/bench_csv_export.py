@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+CSV export benchmark
+Streams a year-long export through app.services.reports.iter_transactions_csv and
+reports throughput and peak Python memory. The previous string-concatenation export
+is measured as well for sizes up to --legacy-max rows.
+
+Usage: python benchmarks/bench_csv_export.py [--sizes 100000 1000000 5000000]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from common import create_bench_engine, seed_transactions
+
+from sqlalchemy import and_
+from sqlalchemy.orm import Session
+
+from app.models import Transaction
+from app.services.reports import iter_transactions_csv
+
+def legacy_export(db, start_date, end_date):
+    """The original export: load every row and grow one string"""
+    transactions = db.query(Transaction).filter(
+        and_(
+            Transaction.user_id == 1,
+            Transaction.date >= start_date,
+            Transaction.date <= end_date
+        )
+    ).all()
+    csv_content = "Date,Type,Category,Description,Amount\n"
+    for transaction in transactions:
+        csv_content += f"{transaction.date},{transaction.transaction_type},{transaction.category},{transaction.description},{transaction.amount}\n"
+    return len(csv_content)
+
+def streaming_export(db, start_date, end_date):
+    written = 0
+    for chunk in iter_transactions_csv(db, 1, start_date, end_date):
+        written += len(chunk)
+    return written
+
+def measure(engine, exporter, start_date, end_date):
+    with Session(engine) as db:
+        tracemalloc.start()
+        started = time.perf_counter()
+        size = exporter(db, start_date, end_date)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {
+        "seconds": round(elapsed, 3),
+        "peak_mb": round(peak / 1_048_576, 2),
+        "output_mb": round(size / 1_048_576, 1),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming vs string-building CSV export")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000, 5_000_000])
+    parser.add_argument("--legacy-max", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    start_date = date.today() - timedelta(days=366)
+    end_date = date.today() + timedelta(days=1)
+    results = []
+
+    for size in args.sizes:
+        engine = create_bench_engine()
+        seed_transactions(engine, size, days=365)
+        result = {"rows": size, "streaming": measure(engine, streaming_export, start_date, end_date)}
+        if size <= args.legacy_max:
+            result["string_concat"] = measure(engine, legacy_export, start_date, end_date)
+        results.append(result)
+        engine.dispose()
+
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Daily rollup benchmark
+Compares a yearly spending report aggregated from raw transactions with the
+same report read from the daily_category_totals rollup, at several table
+sizes, and reports how long a full rollup rebuild takes.
+
+Usage: python benchmarks/bench_daily_rollup.py [--sizes 100000 1000000] [--repeat 5]
+"""
+
+import argparse
+import json
+import math
+import time
+from datetime import date, timedelta
+
+from common import create_bench_engine, seed_transactions
+
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session
+
+from app.models import Transaction, TransactionType
+from app.services.reports import build_spending_report
+from app.services.rollups import rebuild_daily_totals
+
+def raw_expense_totals(db: Session, user_id: int, start_date: date, end_date: date) -> float:
+    """The pre-rollup aggregate: GROUP BY over every transaction in the period"""
+    rows = db.query(
+        Transaction.transaction_type,
+        Transaction.category,
+        func.sum(Transaction.amount)
+    ).filter(
+        and_(
+            Transaction.user_id == user_id,
+            Transaction.date >= start_date,
+            Transaction.date < end_date + timedelta(days=1)
+        )
+    ).group_by(Transaction.transaction_type, Transaction.category).all()
+    return sum(amount for kind, _, amount in rows if kind == TransactionType.EXPENSE)
+
+def best_of(repeat, run):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run()
+        timings.append(time.perf_counter() - started)
+    return result, round(min(timings) * 1000, 2)
+
+def main():
+    parser = argparse.ArgumentParser(description="Yearly report: raw GROUP BY vs daily rollup")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    end_date = date.today()
+    start_date = end_date - timedelta(days=365)
+    results = []
+
+    for size in args.sizes:
+        engine = create_bench_engine()
+        seed_transactions(engine, size, days=365)
+
+        with Session(engine) as db:
+            raw_total, raw_ms = best_of(args.repeat, lambda: raw_expense_totals(db, 1, start_date, end_date))
+            report, rollup_ms = best_of(args.repeat, lambda: build_spending_report(db, 1, start_date, end_date))
+        assert math.isclose(raw_total, report.total_expenses, rel_tol=1e-9)
+
+        started = time.perf_counter()
+        with engine.begin() as conn:
+            rollup_rows = rebuild_daily_totals(conn)
+        rebuild_seconds = time.perf_counter() - started
+
+        results.append({
+            "rows": size,
+            "rollup_rows": rollup_rows,
+            "raw_group_by_ms": raw_ms,
+            "rollup_ms": rollup_ms,
+            "speedup": round(raw_ms / max(rollup_ms, 1e-6), 1),
+            "rebuild_seconds": round(rebuild_seconds, 2),
+        })
+        engine.dispose()
+
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
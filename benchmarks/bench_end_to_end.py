@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark for the REST API and the MCP tools
+Loads generate_dataset datasets of fixed sizes and measures throughput and
+p50/p95/p99 latency of every /api/v1/* route and every mcp_server tool at
+several concurrency levels. Routes are called in process through httpx's ASGI
+transport and tools through an in-memory fastmcp Client, so the numbers
+cover routing, validation, middleware and the database but not the network.
+
+The routes and tools are discovered from the apps; one without a request
+template below stops the run, so new endpoints cannot drop out of the suite.
+Results are written as JSON. Given a baseline from an earlier run (made
+with --save-baseline on the same machine), any p95 latency or throughput
+worse than the baseline by more than --tolerance is listed as a regression
+and the script exits with status 1. Baselines are machine-specific and are
+not committed; without one (and without --save-baseline) the script exits
+with status 2 rather than report a comparison it never made.
+
+Usage: python benchmarks/bench_end_to_end.py [--sizes 10000 100000] [--concurrency 1 4 16]
+       [--requests 200] [--output results.json] [--baseline baselines/end_to_end.json] [--save-baseline]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sqlite3
+import sys
+import time
+from collections import deque
+from datetime import date, timedelta
+from pathlib import Path
+
+from common import create_bench_engine, history_end, make_session_override, summarize
+
+import httpx
+from fastapi.routing import APIRoute
+from fastmcp import Client
+from sqlalchemy import select
+
+from app.cache import report_cache
+from app.config import settings
+from app.database import get_db
+from app.main import app
+from app.models import Transaction
+from generate_dataset import generate_dataset
+
+import mcp_server
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "end_to_end.json"
+ROUTE_PREFIX = "/api/v1/"
+BULK_ROWS = 100
+# Rows of user 1 that the id-based routes cycle through
+ID_SAMPLE = 1000
+
+def new_transaction(n):
+    kind = "income" if n % 10 == 0 else "expense"
+    return {"amount": 10 + n % 90, "description": f"Benchmark row {n}", "transaction_type": kind,
+            "category": "freelance" if kind == "income" else "food"}
+
+def period(days):
+    return {"start_date": (date.today() - timedelta(days=days)).isoformat(), "end_date": date.today().isoformat()}
+
+class Fixture:
+    """Ids of the loaded dataset handed out to the requests that need one"""
+
+    def __init__(self, ids):
+        self.ids = ids
+        self.deletable = deque()
+
+    def existing_id(self, n):
+        return self.ids[n % len(self.ids)]
+
+    async def create_deletable(self, http, count):
+        """Insert `count` rows through the bulk route for DELETE to remove"""
+        for first in range(0, count, settings.BULK_INSERT_MAX_ITEMS):
+            rows = [new_transaction(n) for n in range(first, min(first + settings.BULK_INSERT_MAX_ITEMS, count))]
+            response = await http.post("/api/v1/transactions/bulk", json=rows)
+            response.raise_for_status()
+            self.deletable.extend(response.json()["ids"])
+
+# Route label -> (n, fixture) -> (method, url, request keyword arguments)
+ROUTES = {
+    "GET /api/v1/transactions/": lambda n, f: ("GET", "/api/v1/transactions/", {"params": {"limit": 50}}),
+    "GET /api/v1/transactions/{transaction_id}": lambda n, f: ("GET", f"/api/v1/transactions/{f.existing_id(n)}", {}),
+    "GET /api/v1/reports/spending": lambda n, f: ("GET", "/api/v1/reports/spending", {"params": period(90)}),
+    "GET /api/v1/reports/spending/chart": lambda n, f: ("GET", "/api/v1/reports/spending/chart", {"params": period(90)}),
+    "GET /api/v1/reports/budget-status": lambda n, f: ("GET", "/api/v1/reports/budget-status", {}),
+    "GET /api/v1/reports/cache/stats": lambda n, f: ("GET", "/api/v1/reports/cache/stats", {}),
+    "GET /api/v1/reports/export/csv": lambda n, f: ("GET", "/api/v1/reports/export/csv", {"params": period(30)}),
+    "POST /api/v1/transactions/": lambda n, f: ("POST", "/api/v1/transactions/", {"json": new_transaction(n)}),
+    "POST /api/v1/transactions/bulk": lambda n, f: (
+        "POST", "/api/v1/transactions/bulk", {"json": [new_transaction(n * BULK_ROWS + i) for i in range(BULK_ROWS)]}),
+    "PUT /api/v1/transactions/{transaction_id}": lambda n, f: (
+        "PUT", f"/api/v1/transactions/{f.existing_id(n)}", {"json": new_transaction(n)}),
+    "DELETE /api/v1/transactions/{transaction_id}": lambda n, f: (
+        "DELETE", f"/api/v1/transactions/{f.deletable.popleft()}", {}),
+}
+
+# Tool name -> (n, fixture) -> arguments
+TOOLS = {
+    "get_transactions": lambda n, f: {"user_id": 1, "limit": 50},
+    "get_financial_summary": lambda n, f: {"user_id": 1, **period(90)},
+    "get_budget_status": lambda n, f: {"user_id": 1},
+    "get_financial_goals": lambda n, f: {"user_id": 1},
+    "analyze_spending_patterns": lambda n, f: {"user_id": 1, "days": 90},
+    "financial_snapshot": lambda n, f: {"user_id": 1, **period(90)},
+    "add_transaction": lambda n, f: {"user_id": 1, **new_transaction(n)},
+    "add_transactions_batch": lambda n, f: {
+        "user_id": 1, "transactions": [new_transaction(n * BULK_ROWS + i) for i in range(BULK_ROWS)]},
+    "create_budget": lambda n, f: {
+        "user_id": 1, "name": f"Benchmark budget {n}", "category": "food", "amount": 500.0, "period": "monthly",
+        "start_date": date.today().replace(day=1).isoformat(), "end_date": (date.today() + timedelta(days=30)).isoformat()},
+    "create_financial_goal": lambda n, f: {
+        "user_id": 1, "title": f"Benchmark goal {n}", "description": "Benchmark", "target_amount": 1000.0,
+        "target_date": (date.today() + timedelta(days=365)).isoformat()},
+}
+
+# Tools that only read; the others run with the writes
+READ_TOOLS = {"get_transactions", "get_financial_summary", "get_budget_status", "get_financial_goals",
+              "analyze_spending_patterns", "financial_snapshot"}
+
+def target_phase(kind, label):
+    """0 for reads, 1 for writes and 2 for deletes"""
+    if label.startswith("DELETE "):
+        return 2
+    reads = label.startswith("GET ") if kind == "route" else label in READ_TOOLS
+    return 0 if reads else 1
+
+async def discover_targets():
+    """Every /api/v1/* route and mcp_server tool, as (kind, label); raises if one has no request template"""
+    routes = sorted(
+        f"{method} {route.path}"
+        for route in app.routes if isinstance(route, APIRoute) and route.path.startswith(ROUTE_PREFIX)
+        for method in route.methods
+    )
+    tools = sorted(await mcp_server.mcp.get_tools())
+    missing = [label for label in routes if label not in ROUTES] + [name for name in tools if name not in TOOLS]
+    if missing:
+        raise SystemExit(f"No request template for: {', '.join(missing)}")
+    # Reads of both kinds before any write, so every read sees the loaded dataset; deletes last
+    order = list(ROUTES) + list(TOOLS)
+    return sorted([("route", label) for label in routes] + [("tool", name) for name in tools],
+                  key=lambda target: (target_phase(*target), order.index(target[1])))
+
+async def run_level(call, requests, concurrency):
+    """Issue `requests` calls from `concurrency` workers; latency samples, error count and wall time"""
+    issued = iter(range(requests))
+    latencies, errors = [], 0
+
+    async def worker():
+        nonlocal errors
+        for n in issued:
+            started = time.perf_counter()
+            try:
+                ok = await call(n)
+            except Exception:
+                ok = False
+            latencies.append(time.perf_counter() - started)
+            errors += not ok
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started
+
+async def measure_dataset(fixture, targets, levels, requests):
+    results = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http, Client(mcp_server.mcp) as mcp:
+        for kind, label in targets:
+            for concurrency in levels:
+                if label.startswith("DELETE "):
+                    await fixture.create_deletable(http, requests + 1)  # One more for the warm-up
+
+                if kind == "route":
+                    async def call(n, build=ROUTES[label]):
+                        method, url, kwargs = build(n, fixture)
+                        response = await http.request(method, url, **kwargs)
+                        return response.status_code < 400
+                else:
+                    async def call(n, build=TOOLS[label], name=label):
+                        result = await mcp.call_tool(name, build(n, fixture), raise_on_error=False)
+                        return not result.is_error
+
+                await call(0)  # Warm-up, not measured
+                latencies, errors, seconds = await run_level(call, requests, concurrency)
+                summary = summarize(latencies)
+                results.append({
+                    "kind": kind,
+                    "name": label,
+                    "concurrency": concurrency,
+                    "requests": requests,
+                    "errors": errors,
+                    "throughput_rps": round(requests / seconds, 1),
+                    "p50_ms": summary["p50_ms"],
+                    "p95_ms": summary["p95_ms"],
+                    "p99_ms": summary["p99_ms"],
+                    "mean_ms": summary["mean_ms"],
+                    "max_ms": summary["max_ms"],
+                })
+    return results
+
+def run_dataset(size, users, levels, requests, seed, path=None):
+    """Load a fresh dataset of `size` transactions and benchmark every target against it"""
+    engine = create_bench_engine(path)
+    load = generate_dataset(engine, users, size // users, days=365, seed=seed, end=history_end())
+    with engine.connect() as conn:
+        ids = conn.execute(select(Transaction.id).where(Transaction.user_id == 1)
+                           .order_by(Transaction.id).limit(ID_SAMPLE)).scalars().all()
+
+    app.dependency_overrides[get_db] = make_session_override(engine)
+    original_engine = mcp_server.engine
+    mcp_server.engine = engine
+    report_cache.clear()
+    try:
+        async def run():
+            targets = await discover_targets()
+            return await measure_dataset(Fixture(ids), targets, levels, requests)
+        results = asyncio.run(run())
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        mcp_server.engine = original_engine
+        engine.dispose()
+
+    for result in results:
+        result["dataset_rows"] = load["transactions"]
+    return {"rows": load["transactions"], "users": load["users"], "load_rows_per_second": round(load["rows_per_second"]),
+            "results": results}
+
+def result_key(result):
+    return f"{result['dataset_rows']} {result['kind']} {result['name']} c={result['concurrency']}"
+
+def compare(results, baseline, tolerance, min_delta_ms):
+    """
+    Regressions and improvements of `results` against the results of a baseline run
+
+    A regression is a p95 latency more than `tolerance` (a fraction) and
+    `min_delta_ms` above the baseline, a throughput more than `tolerance`
+    below it, or errors where the baseline had none.
+    """
+    previous = {result_key(result): result for result in baseline}
+    regressions, improvements, unmatched = [], [], []
+    for result in results:
+        key = result_key(result)
+        before = previous.get(key)
+        if before is None:
+            unmatched.append(key)
+            continue
+        p95_change = result["p95_ms"] - before["p95_ms"]
+        rps_ratio = result["throughput_rps"] / before["throughput_rps"] if before["throughput_rps"] else 1.0
+        entry = {"target": key, "p95_ms": [before["p95_ms"], result["p95_ms"]],
+                 "throughput_rps": [before["throughput_rps"], result["throughput_rps"]],
+                 "errors": [before["errors"], result["errors"]]}
+        slower = p95_change > max(before["p95_ms"] * tolerance, min_delta_ms)
+        if slower or rps_ratio < 1 - tolerance or (result["errors"] and not before["errors"]):
+            regressions.append(entry)
+        elif -p95_change > max(before["p95_ms"] * tolerance, min_delta_ms) and rps_ratio > 1 + tolerance:
+            improvements.append(entry)
+    return {"regressions": regressions, "improvements": improvements, "unmatched": unmatched}
+
+def main():
+    parser = argparse.ArgumentParser(description="REST routes and MCP tools under load, against a baseline")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000], help="Dataset sizes in transactions")
+    parser.add_argument("--users", type=int, default=10, help="Users per dataset; the routes and tools read user 1")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per target and level")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-report-cache", action="store_true", help="Compute every report instead of serving hits")
+    parser.add_argument("--output", type=Path, help="Also write the results to this file")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed fractional change before flagging")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="Ignore p95 changes smaller than this")
+    args = parser.parse_args()
+
+    settings.SLOW_QUERY_LOG_SIZE = 0  # Bulk loads and report scans would flood the slow-query log
+    if args.no_report_cache:
+        report_cache.max_entries = 0
+
+    datasets = [run_dataset(size, args.users, args.concurrency, args.requests, args.seed) for size in args.sizes]
+    results = [result for dataset in datasets for result in dataset["results"]]
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "report_cache": not args.no_report_cache,
+        },
+        "config": {"sizes": args.sizes, "users": args.users, "concurrency": args.concurrency,
+                   "requests": args.requests, "seed": args.seed},
+        "datasets": [{key: value for key, value in dataset.items() if key != "results"} for dataset in datasets],
+        "results": results,
+    }
+
+    exit_code = 0
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2))
+    elif args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+        report["comparison"] = {"baseline": str(args.baseline), "tolerance": args.tolerance,
+                                **compare(results, baseline["results"], args.tolerance, args.min_delta_ms)}
+        exit_code = 1 if report["comparison"]["regressions"] else 0
+    else:
+        print(f"No baseline at {args.baseline}; run once with --save-baseline on this machine first",
+              file=sys.stderr)
+        exit_code = 2
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+    print(json.dumps(report, indent=2))
+    sys.exit(exit_code)
+
+if __name__ == "__main__":
+    main()
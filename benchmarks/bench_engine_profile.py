@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+SQLite engine profile benchmark
+Compares the previous engine settings (autocommit driver, rollback journal,
+no PRAGMAs) with the tuned profile from app.database on:
+  - write throughput: one ORM insert + commit per transaction
+  - read throughput: listing queries running while a writer inserts
+
+Usage: python benchmarks/bench_engine_profile.py [--rows 100000] [--writes 2000] [--seconds 3]
+"""
+
+import argparse
+import json
+import threading
+import time
+from datetime import datetime
+
+from common import create_bench_engine, seed_transactions, temp_db_path
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.database import create_sqlite_engine
+from app.models import Base, Transaction, TransactionType
+
+def legacy_engine(path):
+    """The engine configuration app.database used before the tuned profile"""
+    return create_engine(
+        f"sqlite:///{path}",
+        connect_args={"timeout": 20, "check_same_thread": False, "isolation_level": None}
+    )
+
+def tuned_engine(path):
+    return create_sqlite_engine(f"sqlite:///{path}", echo=False)
+
+def new_transaction(i):
+    return Transaction(
+        amount=12.5,
+        description=f"Write benchmark {i}",
+        transaction_type=TransactionType.EXPENSE,
+        category="food",
+        date=datetime.now(),
+        user_id=1
+    )
+
+def write_throughput(engine, writes):
+    started = time.perf_counter()
+    with Session(engine) as db:
+        for i in range(writes):
+            db.add(new_transaction(i))
+            db.commit()
+    return round(writes / (time.perf_counter() - started), 1)
+
+def mixed_read_throughput(engine, seconds):
+    stop = threading.Event()
+    counters = {"reads": 0, "writes": 0, "busy_errors": 0}
+
+    def writer():
+        with Session(engine) as db:
+            i = 0
+            while not stop.is_set():
+                try:
+                    db.add(new_transaction(i))
+                    db.commit()
+                    counters["writes"] += 1
+                except OperationalError:
+                    db.rollback()
+                    counters["busy_errors"] += 1
+                i += 1
+
+    def reader():
+        with Session(engine) as db:
+            while not stop.is_set():
+                try:
+                    db.query(Transaction).filter(Transaction.user_id == 1).order_by(
+                        Transaction.date.desc()
+                    ).limit(50).all()
+                    db.rollback()
+                    counters["reads"] += 1
+                except OperationalError:
+                    db.rollback()
+                    counters["busy_errors"] += 1
+
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return {
+        "reads_per_second": round(counters["reads"] / seconds, 1),
+        "writes_per_second": round(counters["writes"] / seconds, 1),
+        "busy_errors": counters["busy_errors"],
+    }
+
+def run_profile(factory, rows, writes, seconds):
+    path = temp_db_path()
+    seed_engine = create_bench_engine(path)
+    seed_transactions(seed_engine, rows)
+    seed_engine.dispose()
+
+    engine = factory(path)
+    # The seed engine leaves the file in WAL mode; put the legacy run back on the rollback journal
+    with engine.connect() as conn:
+        mode = "WAL" if factory is tuned_engine else "DELETE"
+        conn.exec_driver_sql(f"PRAGMA journal_mode={mode}")
+    Base.metadata.create_all(bind=engine)
+
+    result = {"single_insert_commits_per_second": write_throughput(engine, writes)}
+    result.update(mixed_read_throughput(engine, seconds))
+    engine.dispose()
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Legacy vs tuned SQLite engine profile")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--writes", type=int, default=2000)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    print(json.dumps({
+        "rows": args.rows,
+        "legacy": run_profile(legacy_engine, args.rows, args.writes, args.seconds),
+        "tuned": run_profile(tuned_engine, args.rows, args.writes, args.seconds),
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Financial snapshot benchmark
+Compares answering "how am I doing this month" with the four separate MCP
+tool calls (summary, budget status, goals, latest transactions) against one
+financial_snapshot call, with the report cache cleared before every run.
+
+Usage: python benchmarks/bench_financial_snapshot.py [--sizes 100000 1000000]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import date, datetime, timedelta
+
+from common import create_bench_engine, seed_transactions
+
+from sqlalchemy.orm import Session
+
+import mcp_server
+from app.cache import report_cache
+from app.models import Budget, Goal
+from app.tool_sessions import tool_usage
+
+def best_of(repeat, run):
+    timings = []
+    for _ in range(repeat):
+        report_cache.clear()
+        started = time.perf_counter()
+        result = run()
+        timings.append(time.perf_counter() - started)
+    return result, round(min(timings) * 1000, 2)
+
+async def separate_calls(start_date):
+    summary = await mcp_server.get_financial_summary.fn(user_id=1, start_date=start_date)
+    budgets = await mcp_server.get_budget_status.fn(user_id=1)
+    goals = await mcp_server.get_financial_goals.fn(user_id=1)
+    transactions = await mcp_server.get_transactions.fn(user_id=1, limit=10, start_date=start_date)
+    return summary, budgets, goals, transactions
+
+def main():
+    parser = argparse.ArgumentParser(description="Four MCP tool calls vs one financial_snapshot")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    start_date = date.today().replace(day=1).isoformat()
+    sections = ["summary", "budgets", "goals", "transactions"]
+    results = []
+    for size in args.sizes:
+        engine = create_bench_engine()
+        seed_transactions(engine, size, days=365)
+        now = datetime.now()
+        with Session(engine) as db:
+            db.add_all(
+                Budget(name=category, category=category, amount=500.0, period="monthly",
+                       start_date=now - timedelta(days=30), end_date=now, user_id=1)
+                for category in ("food", "transport", "entertainment", "utilities")
+            )
+            db.add(Goal(title="Savings", description="Rainy day fund", target_amount=5000.0,
+                        target_date=now + timedelta(days=180), user_id=1))
+            db.commit()
+        mcp_server.engine = engine
+
+        tool_usage.clear()
+        _, separate_ms = best_of(args.repeat, lambda: asyncio.run(separate_calls(start_date)))
+        separate_statements = sum(totals["statements"] for totals in tool_usage.stats().values())
+
+        tool_usage.clear()
+        snapshot, snapshot_ms = best_of(args.repeat, lambda: asyncio.run(mcp_server.financial_snapshot.fn(
+            user_id=1, sections=sections, start_date=start_date)))
+        snapshot_statements = tool_usage.stats()["financial_snapshot"]["statements"]
+
+        results.append({
+            "rows": size,
+            "separate_calls_ms": separate_ms,
+            "snapshot_ms": snapshot_ms,
+            "separate_statements_per_run": separate_statements // args.repeat,
+            "snapshot_statements_per_run": snapshot_statements // args.repeat,
+            "snapshot_sections_ms": snapshot["timings_ms"],
+        })
+        engine.dispose()
+
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+LiteQueryHelper connection pool microbenchmark
+Queries per second of LiteQueryHelper.get_recent_transactions on the pooled
+connections against opening a fresh aiosqlite connection for every query.
+
+Usage: python benchmarks/bench_litequery_pool.py [--queries 5000] [--concurrency 16]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from common import create_bench_engine, seed_transactions, temp_db_path
+
+import aiosqlite
+
+from app.litequery_helper import LiteQueryHelper
+
+class ConnectPerQueryHelper(LiteQueryHelper):
+    """The previous behaviour: a new connection (thread + file open) per query"""
+
+    async def execute_query(self, query, params=()):
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
+            cursor = await db.execute(query, params)
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
+
+async def queries_per_second(helper, queries, concurrency):
+    remaining = queries
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await helper.get_recent_transactions(1, limit=10)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return round(queries / (time.perf_counter() - started), 1)
+
+async def run(path, queries, concurrency):
+    before = await queries_per_second(ConnectPerQueryHelper(path), queries, concurrency)
+
+    pooled = LiteQueryHelper(path)
+    await pooled.start()
+    try:
+        after = await queries_per_second(pooled, queries, concurrency)
+    finally:
+        await pooled.close()
+
+    return {"connect_per_query_qps": before, "pooled_qps": after}
+
+def main():
+    parser = argparse.ArgumentParser(description="LiteQueryHelper pooled vs per-query connections")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    path = temp_db_path()
+    engine = create_bench_engine(path)
+    seed_transactions(engine, args.rows)
+    engine.dispose()
+
+    result = asyncio.run(run(path, args.queries, args.concurrency))
+    result.update({"rows": args.rows, "queries": args.queries, "concurrency": args.concurrency})
+    print(json.dumps(result, indent=2))
+
+if __name__ == "__main__":
+    main()
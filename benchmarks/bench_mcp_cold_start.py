@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+MCP stdio cold-start benchmark
+Spawns the MCP server as a fresh subprocess, the way Gemini CLI does, and times
+how long it takes to answer `initialize` and then `tools/list`. Compares the
+fast-start entry point (mcp_fast_stdio.py) with FastMCP's own stdio server.
+
+Usage: python benchmarks/bench_mcp_cold_start.py [--runs 10]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from common import project_root
+
+ENTRY_POINTS = {
+    "fast_stdio": [sys.executable, str(project_root / "mcp_fast_stdio.py")],
+    "fastmcp_stdio": [sys.executable, "-c", "from mcp_server import mcp; mcp.run(show_banner=False)"],
+}
+
+INITIALIZE = {
+    "jsonrpc": "2.0", "id": 1, "method": "initialize",
+    "params": {"protocolVersion": "2025-06-18", "capabilities": {},
+               "clientInfo": {"name": "bench", "version": "1.0"}}
+}
+INITIALIZED = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+TOOLS_LIST = {"jsonrpc": "2.0", "id": 2, "method": "tools/list"}
+
+def send(process, message):
+    process.stdin.write(json.dumps(message) + "\n")
+    process.stdin.flush()
+
+def read_response(process, request_id):
+    while True:
+        line = process.stdout.readline()
+        if not line:
+            raise RuntimeError("MCP server exited before responding")
+        message = json.loads(line)
+        if message.get("id") == request_id:
+            return message
+
+def cold_start(command):
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        command, cwd=project_root, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL, text=True, bufsize=1
+    )
+    try:
+        send(process, INITIALIZE)
+        read_response(process, 1)
+        initialize_ms = (time.perf_counter() - started) * 1000
+
+        send(process, INITIALIZED)
+        send(process, TOOLS_LIST)
+        tools = read_response(process, 2)["result"]["tools"]
+        tools_list_ms = (time.perf_counter() - started) * 1000
+    finally:
+        process.stdin.close()
+        process.terminate()
+        process.wait()
+    return initialize_ms, tools_list_ms, len(tools)
+
+def main():
+    parser = argparse.ArgumentParser(description="Time to first MCP initialize response")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    results = {}
+    for name, command in ENTRY_POINTS.items():
+        samples = [cold_start(command) for _ in range(args.runs)]
+        results[name] = {
+            "initialize_median_ms": round(statistics.median(s[0] for s in samples), 1),
+            "initialize_max_ms": round(max(s[0] for s in samples), 1),
+            "tools_list_median_ms": round(statistics.median(s[1] for s in samples), 1),
+            "tools": samples[0][2],
+        }
+
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
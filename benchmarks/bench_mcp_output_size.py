@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+MCP output size benchmark
+Measures the bytes and estimated tokens of get_transactions and
+get_financial_summary results in the row and table formats, with and
+without field projection and a max_tokens budget, and the time spent
+shaping each result.
+
+Usage: python benchmarks/bench_mcp_output_size.py [--limits 50 200 1000] [--max-tokens 2000]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from common import create_bench_engine, seed_transactions
+
+import mcp_server
+from app.cache import report_cache
+
+def best_of(repeat, run):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run()
+        timings.append(time.perf_counter() - started)
+    return result, round(min(timings) * 1000, 2)
+
+def measure(repeat, tool, **kwargs):
+    # The report cache is left on: repeats of the summary time its shaping only
+    result, elapsed_ms = best_of(repeat, lambda: asyncio.run(getattr(mcp_server, tool).fn(**kwargs)))
+    meta = result["_meta"]
+    return {
+        "bytes": meta["bytes"],
+        "estimated_tokens": meta["estimated_tokens"],
+        "truncated": meta["truncated"],
+        "ms": elapsed_ms,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="MCP result size by output format")
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--limits", type=int, nargs="+", default=[50, 200, 1000])
+    parser.add_argument("--max-tokens", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_bench_engine()
+    seed_transactions(engine, args.rows, days=365)
+    mcp_server.engine = engine
+    report_cache.clear()
+
+    results = []
+    for limit in args.limits:
+        variants = {
+            "rows": {},
+            "table": {"output_format": "table"},
+            "table_projected": {"output_format": "table", "fields": ["date", "amount", "category"]},
+            "table_budgeted": {"output_format": "table", "max_tokens": args.max_tokens},
+        }
+        sizes = {
+            name: measure(args.repeat, "get_transactions", user_id=1, limit=limit, **options)
+            for name, options in variants.items()
+        }
+        sizes["table_vs_rows"] = round(sizes["table"]["bytes"] / sizes["rows"]["bytes"], 3)
+        results.append({"tool": "get_transactions", "limit": limit, **sizes})
+
+    results.append({
+        "tool": "get_financial_summary",
+        "rows": measure(args.repeat, "get_financial_summary", user_id=1),
+        "table": measure(args.repeat, "get_financial_summary", user_id=1, output_format="table"),
+        "totals_only": measure(args.repeat, "get_financial_summary", user_id=1,
+                               fields=["total_income", "total_expenses", "net_worth"]),
+    })
+    engine.dispose()
+
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Money storage benchmark
+Compares the old REAL amount column with integer cents on the same rows:
+SUM and GROUP BY timings, the rollup rebuild and spending report path, and
+how far float summation drifts from the exact total.
+
+Usage: python benchmarks/bench_money_storage.py [--sizes 100000 1000000]
+"""
+
+import argparse
+import json
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from common import create_bench_engine, seed_transactions
+
+from sqlalchemy.orm import Session
+
+from app.money import from_cents
+from app.services.reports import build_spending_report
+from app.services.rollups import rebuild_daily_totals
+
+# Copy of the transactions with the pre-migration REAL column
+LEGACY_COPY = (
+    "CREATE TABLE legacy_transactions AS "
+    "SELECT id, amount_cents / 100.0 AS amount, description, transaction_type, category, date, user_id "
+    "FROM transactions"
+)
+LEGACY_ROLLUP = (
+    "SELECT user_id, date(date), transaction_type, category, SUM(amount), COUNT(*) "
+    "FROM legacy_transactions GROUP BY user_id, date(date), transaction_type, category"
+)
+LEGACY_REPORT = (
+    "SELECT transaction_type, category, SUM(amount) FROM legacy_transactions "
+    "WHERE user_id = 1 AND date >= ? AND date < ? GROUP BY transaction_type, category"
+)
+
+def best_of(repeat, run):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run()
+        timings.append(time.perf_counter() - started)
+    return result, round(min(timings) * 1000, 2)
+
+def main():
+    parser = argparse.ArgumentParser(description="REAL amounts vs integer cents")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    end_date = date.today()
+    start_date = end_date - timedelta(days=365)
+    period = (start_date.isoformat(), (end_date + timedelta(days=1)).isoformat())
+    results = []
+
+    for size in args.sizes:
+        engine = create_bench_engine()
+        seed_transactions(engine, size, days=365)
+
+        with engine.begin() as conn:
+            conn.exec_driver_sql(LEGACY_COPY)
+            raw = conn.exec_driver_sql
+            float_sum, real_sum_ms = best_of(
+                args.repeat, lambda: raw("SELECT SUM(amount) FROM legacy_transactions").scalar())
+            cents_sum, cents_sum_ms = best_of(
+                args.repeat, lambda: raw("SELECT SUM(amount_cents) FROM transactions").scalar())
+            _, real_group_ms = best_of(args.repeat, lambda: raw(
+                "SELECT category, SUM(amount) FROM legacy_transactions GROUP BY category").all())
+            _, cents_group_ms = best_of(args.repeat, lambda: raw(
+                "SELECT category, SUM(amount_cents) FROM transactions GROUP BY category").all())
+            _, real_rebuild_ms = best_of(1, lambda: raw(LEGACY_ROLLUP).all())
+            _, cents_rebuild_ms = best_of(1, lambda: rebuild_daily_totals(conn))
+            _, real_report_ms = best_of(args.repeat, lambda: raw(LEGACY_REPORT, period).all())
+
+        with Session(engine) as db:
+            report, cents_report_ms = best_of(
+                args.repeat, lambda: build_spending_report(db, 1, start_date, end_date))
+
+        exact_total = from_cents(cents_sum)
+        results.append({
+            "rows": size,
+            "sum_real_ms": real_sum_ms,
+            "sum_cents_ms": cents_sum_ms,
+            "group_by_real_ms": real_group_ms,
+            "group_by_cents_ms": cents_group_ms,
+            "rollup_rebuild_real_ms": real_rebuild_ms,
+            "rollup_rebuild_cents_ms": cents_rebuild_ms,
+            "report_raw_real_ms": real_report_ms,
+            "report_rollup_cents_ms": cents_report_ms,
+            "exact_total": str(exact_total),
+            "float_total_drift": float(abs(Decimal(repr(float_sum)) - exact_total)),
+            "report_total_matches": report.total_income + report.total_expenses == exact_total,
+        })
+        engine.dispose()
+
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Spending pattern analysis benchmark
+Compares the original analyze_spending_patterns (hydrate every expense as an
+ORM object and loop over it three times) with the NumPy engine in
+app.services.analytics over years of history.
+
+Usage: python benchmarks/bench_spending_patterns.py [--sizes 100000 1000000] [--years 3]
+"""
+
+import argparse
+import json
+import math
+import time
+from datetime import date, datetime, timedelta
+
+from common import create_bench_engine, seed_transactions
+
+from sqlalchemy import and_
+from sqlalchemy.orm import Session
+
+from app.models import Transaction, TransactionType
+from app.services.analytics import spending_statistics
+
+def legacy_spending_patterns(db: Session, user_id: int, days: int):
+    """The original tool body: three Python passes over hydrated Transaction objects"""
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=days)
+    transactions = db.query(Transaction).filter(
+        and_(
+            Transaction.user_id == user_id,
+            Transaction.transaction_type == TransactionType.EXPENSE,
+            Transaction.date >= start_date,
+            Transaction.date <= end_date
+        )
+    ).all()
+
+    daily_spending = {}
+    for transaction in transactions:
+        day = transaction.date.date()
+        daily_spending[day] = daily_spending.get(day, 0) + transaction.amount
+    category_totals = {}
+    for transaction in transactions:
+        category_totals[transaction.category] = category_totals.get(transaction.category, 0) + transaction.amount
+    return sum(transaction.amount for transaction in transactions)
+
+def best_of(repeat, run):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run()
+        timings.append(time.perf_counter() - started)
+    return result, round(min(timings) * 1000, 2)
+
+def main():
+    parser = argparse.ArgumentParser(description="analyze_spending_patterns: ORM loops vs NumPy engine")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    days = 365 * args.years
+    results = []
+    for size in args.sizes:
+        engine = create_bench_engine()
+        seed_transactions(engine, size, days=days)
+
+        with Session(engine) as db:
+            legacy_total, legacy_ms = best_of(1, lambda: legacy_spending_patterns(db, 1, days + 1))
+            stats, numpy_ms = best_of(
+                args.repeat, lambda: spending_statistics(db, 1, date.today() - timedelta(days=days + 1), date.today())
+            )
+        assert math.isclose(legacy_total, stats["total_spent"], rel_tol=1e-9)
+
+        results.append({
+            "rows": size,
+            "days": days,
+            "orm_loops_ms": legacy_ms,
+            "numpy_engine_ms": numpy_ms,
+            "speedup": round(legacy_ms / max(numpy_ms, 1e-6), 1),
+        })
+        engine.dispose()
+
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
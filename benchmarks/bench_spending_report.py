@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Spending report benchmark
+Compares the ORM row-hydrating report against the GROUP BY aggregate in
+app.services.reports at several table sizes, reporting time and peak Python memory.
+
+Usage: python benchmarks/bench_spending_report.py [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import json
+import math
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from common import create_bench_engine, seed_transactions
+
+from sqlalchemy import and_
+from sqlalchemy.orm import Session
+
+from app.models import Transaction
+from app.schemas import SpendingReport
+from app.services.reports import build_spending_report
+
+def legacy_spending_report(db: Session, user_id: int, start_date: date, end_date: date) -> SpendingReport:
+    """The original implementation: hydrate every Transaction and sum in Python"""
+    transactions = db.query(Transaction).filter(
+        and_(
+            Transaction.user_id == user_id,
+            Transaction.date >= start_date,
+            Transaction.date <= end_date
+        )
+    ).all()
+
+    total_income = sum(t.amount for t in transactions if t.transaction_type == "income")
+    total_expenses = sum(t.amount for t in transactions if t.transaction_type == "expense")
+
+    category_breakdown = {}
+    for transaction in transactions:
+        if transaction.transaction_type == "expense":
+            category_breakdown[transaction.category] = category_breakdown.get(transaction.category, 0) + transaction.amount
+
+    return SpendingReport(
+        total_income=total_income,
+        total_expenses=total_expenses,
+        net_income=total_income - total_expenses,
+        category_breakdown=category_breakdown,
+        period=f"{start_date} to {end_date}"
+    )
+
+def measure(engine, builder, start_date, end_date):
+    with Session(engine) as db:
+        tracemalloc.start()
+        started = time.perf_counter()
+        report = builder(db, 1, start_date, end_date)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return report, {"seconds": round(elapsed, 4), "peak_mb": round(peak / 1_048_576, 2)}
+
+def main():
+    parser = argparse.ArgumentParser(description="Spending report: ORM loop vs SQL aggregate")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    start_date = date.today() - timedelta(days=31)
+    end_date = date.today() + timedelta(days=1)
+    results = []
+
+    for size in args.sizes:
+        engine = create_bench_engine()
+        seed_transactions(engine, size)
+
+        legacy_report, legacy = measure(engine, legacy_spending_report, start_date, end_date)
+        report, aggregate = measure(engine, build_spending_report, start_date, end_date)
+
+        assert math.isclose(legacy_report.total_expenses, report.total_expenses, rel_tol=1e-9)
+        assert legacy_report.category_breakdown.keys() == report.category_breakdown.keys()
+
+        results.append({
+            "rows": size,
+            "orm_loop": legacy,
+            "sql_aggregate": aggregate,
+            "speedup": round(legacy["seconds"] / max(aggregate["seconds"], 1e-9), 1),
+        })
+        engine.dispose()
+
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
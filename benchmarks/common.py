@@ -0,0 +1,87 @@
+"""
+Shared helpers for the benchmark scripts
+Builds throwaway SQLite databases, seeds them from generate_dataset and
+summarizes latencies
+"""
+
+import sys
+import os
+import math
+import tempfile
+import statistics
+from pathlib import Path
+from datetime import date, datetime, time
+from typing import List, Dict, Optional
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy.orm import sessionmaker
+
+from app.database import create_sqlite_engine
+from app.models import Base
+from app.services.rollups import rebuild_daily_totals
+from generate_dataset import EXPENSE_PROFILE, INCOME_PROFILE, load_transactions, tuned_for_loading
+
+EXPENSE_CATEGORIES = list(EXPENSE_PROFILE)
+INCOME_CATEGORIES = list(INCOME_PROFILE)
+
+def temp_db_path() -> str:
+    """Path of a new, empty SQLite file in the temp directory"""
+    fd, path = tempfile.mkstemp(prefix="finance_bench_", suffix=".db")
+    os.close(fd)
+    return path
+
+def create_bench_engine(path: Optional[str] = None):
+    """Create a tuned-profile engine on a fresh SQLite file with all tables in place"""
+    if path is None:
+        path = temp_db_path()
+    engine = create_sqlite_engine(f"sqlite:///{path}", echo=False)
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+def make_session_override(engine):
+    """Build a replacement for app.database.get_db bound to the given engine"""
+    SessionBench = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = SessionBench()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    return override_get_db
+
+def history_end() -> datetime:
+    """Midnight today; the benchmarks query windows that end today, so their data ends here too"""
+    return datetime.combine(date.today(), time.min)
+
+def seed_transactions(engine, rows: int, user_id: int = 1, days: int = 30,
+                      seed: int = 42, batch_size: int = 50_000) -> None:
+    """Bulk load `rows` synthetic transactions over the last `days` days for one user, then rebuild the rollup"""
+    with engine.connect() as conn:
+        with tuned_for_loading(conn):
+            load_transactions(conn, [user_id], rows, days, seed, batch_size, history_end())
+        rebuild_daily_totals(conn, user_id)
+        conn.commit()
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Latency summary in milliseconds for samples given in seconds"""
+    return {
+        "count": len(samples),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 2) if samples else 0.0,
+        "p50_ms": round(percentile(samples, 50) * 1000, 2),
+        "p95_ms": round(percentile(samples, 95) * 1000, 2),
+        "p99_ms": round(percentile(samples, 99) * 1000, 2),
+        "max_ms": round(max(samples) * 1000, 2) if samples else 0.0,
+    }
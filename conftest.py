@@ -0,0 +1,42 @@
+"""
+Shared pytest fixtures
+Every test gets its own SQLite file under pytest's tmp_path, so test
+databases are cleaned up with the rest of pytest's temporary directories.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from app.main import app
+from app.database import get_db
+from app.cache import report_cache
+from benchmarks.common import create_bench_engine, make_session_override
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path of a SQLite file that does not exist yet"""
+    return str(tmp_path / "finance_test.db")
+
+@pytest.fixture
+def engine(db_path):
+    """Tuned-profile engine on a fresh database with all tables in place"""
+    engine = create_bench_engine(db_path)
+    report_cache.clear()  # Cached reports belong to whichever database served them
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def client(engine):
+    """TestClient whose get_db sessions are bound to the test engine"""
+    app.dependency_overrides[get_db] = make_session_override(engine)
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_db, None)
@@ -14,7 +14,9 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from app.database import engine, SessionLocal, Base
+from app.migrations import run_migrations
 from app.models import User, Transaction, Budget, Goal, TransactionType, GoalStatus
+from app.services.rollups import update_daily_totals
 from sqlalchemy.orm import Session
 
 def create_dummy_users(db: Session):
@@ -102,6 +104,7 @@ def create_dummy_transactions(db: Session, users):
             db.add(transaction)
             transactions.append(transaction)
     
+    update_daily_totals(db, added=transactions)
     db.commit()
     print(f"✅ Created {len(transactions)} transactions")
     return transactions
@@ -208,6 +211,7 @@ def create_database_and_dummy_data():
     # Create all tables
     print("📋 Creating database tables...")
     Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
     print("✅ Database tables created")
     
     # Create database session
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Generate a large synthetic dataset for Finance Tracker
+Creates N users with M transactions each (up to 50M rows), plus matching
+budgets and goals, for benchmarking. The history ends at a fixed day
+(--end, 2025-01-01 unless given), so the same seed and arguments produce
+the same rows whenever they are run.
+
+Transactions follow a fixed shape rather than uniform noise:
+- Expense categories have their own frequency and a log-normal amount
+  around a typical price (coffee-sized food, rent-sized utilities)
+- Each user has a spending scale, a salary and a payday; one salary lands
+  on the payday of every month in the window and other income is occasional
+- Spending rises at the weekend and in December and dips in January and
+  February, and most purchases happen during the day
+
+Rows go in through batched Core inserts on one connection with SQLite tuned
+for loading (no fsync, in-memory journal, large cache) and the transactions
+indexes dropped and rebuilt afterwards. The engine profile is restored once
+the load is done. A crash mid-load can leave the file unusable, so only
+point this at a database you can recreate.
+
+Usage: python generate_dataset.py [--users N] [--transactions M] [--days D] [--end YYYY-MM-DD] [--seed S]
+       [--database URL]
+"""
+
+import sys
+import time
+import argparse
+from contextlib import contextmanager
+from pathlib import Path
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Connection
+
+from app.config import settings
+from app.database import Base, create_sqlite_engine, sqlite_pragma_statements
+from app.migrations import run_migrations
+from app.models import Budget, Goal, GoalStatus, User
+from app.services.rollups import rebuild_daily_totals
+
+MAX_ROWS = 50_000_000
+# Day after the last day of history; fixed so a run does not depend on when it happens
+DEFAULT_END = datetime(2025, 1, 1)
+DEFAULT_DATABASE_URL = "sqlite:///./finance_tracker_synthetic.db"
+
+# Same placeholder hash as create_dummy_data.py ("password123")
+PASSWORD_HASH = "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewdBPj4J/8KzK1K2"
+
+# category: (share of expense rows, median amount, log-normal sigma, descriptions)
+EXPENSE_PROFILE = {
+    "food": (0.34, 18.0, 0.70, ["Grocery shopping", "Coffee shop", "Restaurant dinner", "Lunch", "Takeaway"]),
+    "transportation": (0.14, 25.0, 0.60, ["Gas station", "Train ticket", "Taxi ride", "Parking", "Car maintenance"]),
+    "entertainment": (0.09, 30.0, 0.70, ["Movie tickets", "Concert", "Video game", "Bowling night"]),
+    "utilities": (0.05, 90.0, 0.40, ["Electric bill", "Water bill", "Internet bill", "Phone bill"]),
+    "healthcare": (0.04, 60.0, 0.90, ["Pharmacy", "Doctor visit", "Dentist", "Gym membership"]),
+    "shopping": (0.14, 45.0, 0.90, ["Online shopping", "Clothing store", "Electronics", "Home goods"]),
+    "education": (0.02, 120.0, 0.80, ["Online course", "Books", "Workshop fee"]),
+    "travel": (0.03, 250.0, 0.90, ["Flight", "Hotel stay", "Car rental"]),
+    "insurance": (0.02, 150.0, 0.30, ["Car insurance", "Health insurance", "Home insurance"]),
+    "subscriptions": (0.13, 13.0, 0.50, ["Netflix subscription", "Music streaming", "Cloud storage", "News subscription"]),
+}
+# Same for income; salaries are paid monthly rather than drawn, and their
+# median and sigma are the spread of salaries across users
+INCOME_PROFILE = {
+    "salary": (0.0, 4200.0, 0.35, ["Monthly salary"]),
+    "freelance": (0.40, 600.0, 0.60, ["Freelance project", "Consulting work"]),
+    "investment": (0.35, 150.0, 1.00, ["Investment dividend", "Interest payment"]),
+    "bonus": (0.10, 1500.0, 0.50, ["Performance bonus", "Year-end bonus"]),
+    "rental_income": (0.15, 1100.0, 0.20, ["Rental property income"]),
+}
+# Share of the non-salary rows that are income
+INCOME_SHARE = 0.03
+
+# Relative spending by weekday (Monday first), month (January first) and hour of day
+WEEKDAY_FACTORS = [0.90, 0.90, 0.95, 1.00, 1.20, 1.35, 1.10]
+MONTH_FACTORS = [0.85, 0.90, 0.95, 1.00, 1.00, 1.05, 1.10, 1.05, 0.95, 1.00, 1.10, 1.40]
+HOUR_FACTORS = [0.1, 0.05, 0.05, 0.05, 0.1, 0.2, 0.5, 1.0, 1.5, 1.5, 1.5, 1.8,
+                2.2, 1.8, 1.4, 1.4, 1.5, 1.9, 2.1, 1.8, 1.4, 1.0, 0.6, 0.3]
+PAYDAYS = [1, 15, 25]
+
+# Budgeted categories and goal templates: (title, description, target in months of salary)
+BUDGET_CATEGORIES = ["food", "transportation", "entertainment", "utilities", "shopping", "subscriptions"]
+GOAL_TEMPLATES = [
+    ("Emergency Fund", "Build emergency fund for 6 months of expenses", 6.0),
+    ("Vacation Fund", "Save for dream vacation", 1.5),
+    ("New Car Fund", "Save for down payment on new car", 4.0),
+    ("Home Renovation", "Kitchen and bathroom renovation project", 8.0),
+    ("Retirement Boost", "Additional retirement savings", 12.0),
+]
+
+GOAL_STATUSES = [GoalStatus.ACTIVE, GoalStatus.ACTIVE, GoalStatus.ACTIVE, GoalStatus.PAUSED]
+
+# Load-time PRAGMAs; the engine profile is put back afterwards
+LOAD_PRAGMAS = [
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA cache_size=-262144",
+    "PRAGMA temp_store=MEMORY",
+]
+
+INSERT_TRANSACTIONS = (
+    "INSERT INTO transactions (amount_cents, currency, description, transaction_type, category, date, user_id) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+CATEGORIES = list(EXPENSE_PROFILE) + list(INCOME_PROFILE)
+_PROFILES = list(EXPENSE_PROFILE.values()) + list(INCOME_PROFILE.values())
+_MEDIANS = np.array([profile[1] for profile in _PROFILES])
+_SIGMAS = np.array([profile[2] for profile in _PROFILES])
+_DESCRIPTIONS = np.array([text for profile in _PROFILES for text in profile[3]], dtype=object)
+_DESCRIPTION_COUNTS = np.array([len(profile[3]) for profile in _PROFILES])
+_DESCRIPTION_OFFSETS = np.concatenate(([0], np.cumsum(_DESCRIPTION_COUNTS)[:-1]))
+_CATEGORY_NAMES = np.array(CATEGORIES, dtype=object)
+_TYPE_NAMES = np.array(["EXPENSE"] * len(EXPENSE_PROFILE) + ["INCOME"] * len(INCOME_PROFILE), dtype=object)
+_CATEGORY_WEIGHTS = np.concatenate((
+    (1 - INCOME_SHARE) * np.array([profile[0] for profile in EXPENSE_PROFILE.values()]),
+    INCOME_SHARE * np.array([profile[0] for profile in INCOME_PROFILE.values()]),
+))
+_SALARY = CATEGORIES.index("salary")
+
+def _mean_amount(category: str) -> float:
+    _, median, sigma, _ = EXPENSE_PROFILE[category]
+    return median * float(np.exp(sigma ** 2 / 2))
+
+class UserProfiles:
+    """Per-user spending scale, monthly salary and payday, drawn once per dataset"""
+
+    def __init__(self, rng: np.random.Generator, count: int):
+        self.scale = rng.lognormal(0.0, 0.35, count)
+        _, median, sigma, _ = INCOME_PROFILE["salary"]
+        self.salary = np.round(rng.lognormal(np.log(median), sigma, count), -1)
+        self.payday = rng.choice(PAYDAYS, count)
+
+def paydays(profiles: UserProfiles, first_day: np.datetime64, days: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Each user's paydays inside the window, padded to one per month, and how many there are"""
+    months = np.arange(first_day.astype("datetime64[M]"), (first_day + days - 1).astype("datetime64[M]") + 1)
+    dates = months.astype("datetime64[D]")[None, :] + (profiles.payday[:, None] - 1)
+    inside = (dates >= first_day) & (dates < first_day + days)
+    # Move each user's paydays to the front of their row, still in date order
+    order = np.argsort(~inside, axis=1, kind="stable")
+    return np.take_along_axis(dates, order, axis=1), inside.sum(axis=1)
+
+def day_weights(first_day: np.datetime64, days: int) -> np.ndarray:
+    """Probability of each day in the window, from its weekday and month"""
+    day = np.arange(first_day, first_day + days)
+    weekday = (day.astype(np.int64) + 3) % 7  # 1970-01-01 was a Thursday
+    month = day.astype("datetime64[M]").astype(np.int64) % 12
+    weights = np.array(WEEKDAY_FACTORS)[weekday] * np.array(MONTH_FACTORS)[month]
+    return weights / weights.sum()
+
+class Window:
+    """The days a dataset covers, with each day's weight and every user's paydays in it"""
+
+    def __init__(self, profiles: UserProfiles, end: datetime, days: int):
+        self.days = days
+        self.first_day = np.datetime64((end - timedelta(days=days)).date(), "D")
+        self.day_probabilities = day_weights(self.first_day, days)
+        self.paydays, self.payday_count = paydays(profiles, self.first_day, days)
+
+def transaction_rows(rng: np.random.Generator, profiles: UserProfiles, window: Window,
+                     user_ids: np.ndarray, rows: np.ndarray, per_user: int) -> List[tuple]:
+    """
+    Transactions rows, in INSERT_TRANSACTIONS column order, for a range of row numbers
+
+    Row r belongs to user r // per_user. A user's first rows are their
+    salaries, one per payday in the window; the rest are drawn independently.
+    """
+    count = len(rows)
+    user = rows // per_user
+    position = rows % per_user
+    salary = position < window.payday_count[user]
+
+    category = rng.choice(len(CATEGORIES), count, p=_CATEGORY_WEIGHTS)
+    category[salary] = _SALARY
+    cents = rng.lognormal(np.log(_MEDIANS[category]), _SIGMAS[category])
+    cents = np.where(salary, profiles.salary[user], cents * profiles.scale[user])
+    cents = np.maximum(np.round(cents * 100), 1).astype(np.int64)
+
+    day = window.first_day + rng.choice(window.days, count, p=window.day_probabilities)
+    day[salary] = window.paydays[user[salary], position[salary]]
+    hour = rng.choice(24, count, p=np.array(HOUR_FACTORS) / sum(HOUR_FACTORS))
+    offset_us = (hour * 3600 + rng.integers(0, 3600, count)) * 1_000_000 + rng.integers(0, 1_000_000, count)
+    timestamps = day.astype("datetime64[us]") + offset_us.astype("timedelta64[us]")
+    dates = np.char.replace(np.datetime_as_string(timestamps, unit="us"), "T", " ")
+
+    pick = (rng.random(count) * _DESCRIPTION_COUNTS[category]).astype(np.int64)
+    descriptions = _DESCRIPTIONS[_DESCRIPTION_OFFSETS[category] + pick]
+    return list(zip(
+        cents.tolist(), [settings.DEFAULT_CURRENCY] * count, descriptions.tolist(), _TYPE_NAMES[category].tolist(),
+        _CATEGORY_NAMES[category].tolist(), dates.tolist(), user_ids[user].tolist()
+    ))
+
+@contextmanager
+def tuned_for_loading(conn: Connection) -> Iterator[None]:
+    """Apply LOAD_PRAGMAS and drop the transactions indexes, restoring both on the way out"""
+    indexes = conn.exec_driver_sql(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'transactions' AND sql IS NOT NULL"
+    ).all()
+    conn.commit()
+    for statement in LOAD_PRAGMAS:
+        conn.exec_driver_sql(statement)
+    for name, _ in indexes:
+        conn.exec_driver_sql(f'DROP INDEX "{name}"')
+    conn.commit()
+    try:
+        yield
+    finally:
+        conn.rollback()
+        for _, sql in indexes:
+            conn.exec_driver_sql(sql)
+        conn.commit()
+        for statement in sqlite_pragma_statements():
+            conn.exec_driver_sql(statement)
+
+def transaction_batches(user_ids: Sequence[int], per_user: int, days: int = 365, seed: int = 42,
+                        batch_size: int = 50_000, end: datetime = DEFAULT_END) -> Iterator[List[tuple]]:
+    """
+    `per_user` transactions for each user over the `days` days before `end`, in batches
+
+    Rows are tuples in INSERT_TRANSACTIONS column order.
+    """
+    rng = np.random.default_rng(seed)
+    ids = np.asarray(user_ids, dtype=np.int64)
+    profiles = UserProfiles(rng, len(ids))
+    window = Window(profiles, end, days)
+
+    total = len(ids) * per_user
+    for first in range(0, total, batch_size):
+        yield transaction_rows(rng, profiles, window, ids, np.arange(first, min(first + batch_size, total)), per_user)
+
+def load_transactions(conn: Connection, user_ids: Sequence[int], per_user: int, days: int = 365,
+                      seed: int = 42, batch_size: int = 50_000, end: datetime = DEFAULT_END) -> int:
+    """
+    Insert transaction_batches() through one connection, committing after every batch
+
+    Returns the number of rows written; the caller owns the load tuning and the rollup.
+    """
+    written = 0
+    for rows in transaction_batches(user_ids, per_user, days, seed, batch_size, end):
+        conn.exec_driver_sql(INSERT_TRANSACTIONS, rows)
+        conn.commit()
+        written += len(rows)
+    return written
+
+def create_users(conn: Connection, count: int) -> List[int]:
+    """Insert `count` users numbered after the highest existing id"""
+    first = (conn.execute(select(func.max(User.id))).scalar() or 0) + 1
+    ids = list(range(first, first + count))
+    conn.execute(User.__table__.insert(), [
+        {"id": n, "email": f"user{n}@example.com", "username": f"user{n}", "hashed_password": PASSWORD_HASH,
+         "full_name": f"Synthetic User {n}", "is_active": True}
+        for n in ids
+    ])
+    return ids
+
+def create_budgets(conn: Connection, user_ids: Sequence[int], per_user: int, days: int, seed: int,
+                   end: datetime = DEFAULT_END) -> int:
+    """A budget per budgeted category for the last month of the history, set near each user's expected spend"""
+    rng = np.random.default_rng(seed)
+    profiles = UserProfiles(rng, len(user_ids))  # Same draw as load_transactions for the same seed
+    start = (end - timedelta(days=1)).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    end = (start + timedelta(days=32)).replace(day=1) - timedelta(microseconds=1)
+    expenses_per_month = max(per_user - days / 30.4, 0) * (1 - INCOME_SHARE) * 30.4 / days
+
+    budgets = []
+    for i, user_id in enumerate(user_ids):
+        for category in BUDGET_CATEGORIES:
+            expected = expenses_per_month * EXPENSE_PROFILE[category][0] * _mean_amount(category) * profiles.scale[i]
+            amount = max(round(expected * rng.uniform(0.8, 1.2), -1), 10.0)
+            budgets.append({
+                "name": f"Monthly {category.title()} Budget", "category": category, "amount": amount,
+                "period": "monthly", "start_date": start, "end_date": end, "user_id": user_id,
+            })
+    conn.execute(Budget.__table__.insert(), budgets)
+    return len(budgets)
+
+def create_goals(conn: Connection, user_ids: Sequence[int], seed: int, end: datetime = DEFAULT_END) -> int:
+    """One to three savings goals per user, sized in months of their salary and due after `end`"""
+    rng = np.random.default_rng(seed)
+    profiles = UserProfiles(rng, len(user_ids))
+
+    goals = []
+    for i, user_id in enumerate(user_ids):
+        for t in rng.choice(len(GOAL_TEMPLATES), rng.integers(1, 4), replace=False):
+            title, description, months = GOAL_TEMPLATES[t]
+            target = round(float(profiles.salary[i]) * months, -2)
+            progress = rng.uniform(0.0, 1.1)
+            goals.append({
+                "title": title, "description": description, "target_amount": target,
+                "current_amount": round(target * min(progress, 1.0), 2),
+                "target_date": end + timedelta(days=int(rng.integers(180, 731))),
+                "status": GoalStatus.COMPLETED if progress >= 1.0 else GOAL_STATUSES[rng.integers(len(GOAL_STATUSES))],
+                "user_id": user_id,
+            })
+    conn.execute(Goal.__table__.insert(), goals)
+    return len(goals)
+
+def generate_dataset(engine, users: int, transactions_per_user: int, days: int = 365, seed: int = 42,
+                     batch_size: int = 50_000, budgets: bool = True, goals: bool = True,
+                     end: datetime = DEFAULT_END) -> Dict[str, Any]:
+    """
+    Load a synthetic dataset into an engine whose tables already exist
+
+    Users are numbered after the existing ones, and only their rollup rows
+    are rebuilt. Returns the counts, the time spent in each phase and the
+    transaction load rate in rows per second.
+    """
+    if users < 1 or transactions_per_user < 0:
+        raise ValueError("Need at least one user and a non-negative number of transactions each")
+    if users * transactions_per_user > MAX_ROWS:
+        raise ValueError(f"{users} x {transactions_per_user} transactions is over the {MAX_ROWS:,} row limit")
+
+    stats: Dict[str, Any] = {}
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        user_ids = create_users(conn, users)
+        stats["budgets"] = create_budgets(conn, user_ids, transactions_per_user, days, seed, end) if budgets else 0
+        stats["goals"] = create_goals(conn, user_ids, seed, end) if goals else 0
+        conn.commit()
+
+        with tuned_for_loading(conn):
+            load_started = time.perf_counter()
+            stats["transactions"] = load_transactions(conn, user_ids, transactions_per_user, days, seed,
+                                                      batch_size, end)
+            stats["load_seconds"] = time.perf_counter() - load_started
+            index_started = time.perf_counter()
+        stats["index_seconds"] = time.perf_counter() - index_started
+
+        rollup_started = time.perf_counter()
+        stats["rollup_rows"] = sum(rebuild_daily_totals(conn, user_id) for user_id in user_ids)
+        conn.commit()
+        stats["rollup_seconds"] = time.perf_counter() - rollup_started
+
+    stats["users"] = len(user_ids)
+    stats["user_ids"] = [user_ids[0], user_ids[-1]]
+    stats["total_seconds"] = time.perf_counter() - started
+    stats["rows_per_second"] = stats["transactions"] / stats["load_seconds"] if stats["load_seconds"] else 0.0
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a seeded synthetic Finance Tracker dataset")
+    parser.add_argument("--users", type=int, default=100, help="Number of users to create")
+    parser.add_argument("--transactions", type=int, default=1_000, help="Transactions per user")
+    parser.add_argument("--days", type=int, default=365, help="Length of the history in days, ending at --end")
+    parser.add_argument("--end", type=datetime.fromisoformat, default=DEFAULT_END,
+                        help=f"Day after the last day of the history (default {DEFAULT_END.date()})")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--database", default=DEFAULT_DATABASE_URL, help="SQLite database URL")
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Rows per insert batch")
+    parser.add_argument("--no-budgets", action="store_true", help="Skip the budgets")
+    parser.add_argument("--no-goals", action="store_true", help="Skip the goals")
+    args = parser.parse_args()
+
+    total = args.users * args.transactions
+    if total > MAX_ROWS:
+        parser.error(f"--users x --transactions is {total:,}; the limit is {MAX_ROWS:,}")
+
+    settings.SLOW_QUERY_LOG_SIZE = 0  # Every batch of a bulk load would count as a slow query
+    engine = create_sqlite_engine(args.database, echo=False)
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+
+    print(f"🚀 Generating {args.users:,} users x {args.transactions:,} transactions over the {args.days} days "
+          f"before {args.end.date()} (seed {args.seed})")
+    stats = generate_dataset(engine, args.users, args.transactions, args.days, args.seed,
+                             args.batch_size, not args.no_budgets, not args.no_goals, args.end)
+    engine.dispose()
+
+    print(f"👤 Users: {stats['users']:,} (ids {stats['user_ids'][0]}-{stats['user_ids'][-1]})")
+    print(f"💰 Transactions: {stats['transactions']:,} in {stats['load_seconds']:.2f}s "
+          f"({stats['rows_per_second']:,.0f} rows/s), indexes rebuilt in {stats['index_seconds']:.2f}s")
+    print(f"📊 Budgets: {stats['budgets']:,}  🎯 Goals: {stats['goals']:,}")
+    print(f"🔄 Rollup rows: {stats['rollup_rows']:,} in {stats['rollup_seconds']:.2f}s")
+    print(f"✅ Done in {stats['total_seconds']:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -5,54 +5,54 @@ Combines FastAPI backend with MCP server capabilities
 """
 
 import asyncio
-import threading
-import time
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 from contextlib import asynccontextmanager
 
 # Import your existing modules
 from app.database import get_db
-from app.routers import transactions_simple, reports_simple
+from app.routers import transactions_simple, reports_simple, debug
 from app.models import Base
 from app.database import engine
+from app.migrations import run_migrations
 from app.config import settings
+from app.litequery_helper import litequery_helper
+from app.metrics import MetricsMiddleware, PROMETHEUS_CONTENT_TYPE, render_prometheus
 
 # Import MCP server
 from mcp_server import mcp
 
-# Global variable to store MCP server thread
-mcp_server_thread = None
+# The MCP server runs as an ASGI sub-application on the same event loop, engine
+# and connection pools as the REST API, served at MCP_MOUNT_PATH + "/mcp"
+MCP_MOUNT_PATH = "/mcp-server"
+mcp_app = mcp.http_app(path="/mcp")
+
+# Set once the MCP session manager is running and accepting requests
+mcp_ready = asyncio.Event()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
-    global mcp_server_thread
-    
-    # Start MCP server in background thread
-    print("🚀 Starting MCP server in background...")
-    mcp_server_thread = threading.Thread(target=run_mcp_server, daemon=True)
-    mcp_server_thread.start()
-    
-    # Wait a moment for MCP server to initialize
-    await asyncio.sleep(2)
+    # Warm up the LiteQuery connection pool
+    await litequery_helper.start()
     
-    yield
+    # Run the MCP app's lifespan (session manager) inside ours
+    print("🚀 Starting MCP server...")
+    async with mcp_app.lifespan(mcp_app):
+        mcp_ready.set()
+        print(f"📡 MCP server ready at {MCP_MOUNT_PATH}/mcp")
+        try:
+            yield
+        finally:
+            mcp_ready.clear()
+            print("🛑 Shutting down MCP server...")
     
-    # Cleanup (if needed)
-    print("🛑 Shutting down MCP server...")
-
-def run_mcp_server():
-    """Run MCP server in a separate thread"""
-    try:
-        print("📡 MCP Server starting in background thread...")
-        mcp.run()
-    except Exception as e:
-        print(f"❌ MCP Server error: {e}")
+    await litequery_helper.close()
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
+run_migrations(engine)
 
 # Create FastAPI app with lifespan
 app = FastAPI(
@@ -71,11 +71,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+# Latency and SQL metrics per route, served from /metrics
+app.add_middleware(MetricsMiddleware)
+
 # Include existing routers
 app.include_router(transactions_simple.router, prefix="/api/v1/transactions", tags=["Transactions"])
 app.include_router(reports_simple.router, prefix="/api/v1/reports", tags=["Reports & Analytics"])
+app.include_router(debug.router, prefix="/debug", tags=["Debug"])
+
+# Mount the MCP streamable HTTP endpoint
+app.mount(MCP_MOUNT_PATH, mcp_app)
 
 # Add MCP-specific endpoints
 @app.get("/")
@@ -84,7 +92,7 @@ async def root():
         "message": "Welcome to Personal Finance Tracker API with MCP Integration",
         "version": "2.0.0",
         "docs": "/docs",
-        "mcp_server": "Running in background",
+        "mcp_server": f"{MCP_MOUNT_PATH}/mcp",
         "features": [
             "REST API endpoints for financial data",
             "MCP server for AI tool integration",
@@ -99,9 +107,14 @@ async def root():
 async def health_check():
     return {
         "status": "healthy",
-        "mcp_server": "active" if mcp_server_thread and mcp_server_thread.is_alive() else "inactive"
+        "mcp_server": "active" if mcp_ready.is_set() else "inactive"
     }
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics: latency, SQL statements, rows and DB time per route and MCP tool"""
+    return Response(render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
 @app.get("/mcp/tools")
 async def list_mcp_tools():
     """List available MCP tools"""
@@ -112,15 +125,21 @@ async def list_mcp_tools():
                 "description": "Add a new financial transaction (income or expense)",
                 "parameters": ["amount", "description", "transaction_type", "category", "user_id"]
             },
+            {
+                "name": "add_transactions_batch",
+                "description": "Add many financial transactions at once, in a single database transaction",
+                "parameters": ["transactions", "user_id"]
+            },
             {
                 "name": "get_transactions",
-                "description": "Retrieve financial transactions with optional filtering",
-                "parameters": ["user_id", "limit", "transaction_type", "category", "start_date", "end_date"]
+                "description": "Retrieve financial transactions with optional filtering and cursor paging",
+                "parameters": ["user_id", "limit", "transaction_type", "category", "start_date", "end_date", "cursor",
+                               "output_format", "fields", "max_tokens"]
             },
             {
                 "name": "get_financial_summary",
                 "description": "Get a comprehensive financial summary including income, expenses, and net worth",
-                "parameters": ["user_id", "start_date", "end_date"]
+                "parameters": ["user_id", "start_date", "end_date", "output_format", "fields", "max_tokens", "cursor"]
             },
             {
                 "name": "create_budget",
@@ -146,6 +165,11 @@ async def list_mcp_tools():
                 "name": "analyze_spending_patterns",
                 "description": "Analyze spending patterns over a specified period",
                 "parameters": ["user_id", "days"]
+            },
+            {
+                "name": "financial_snapshot",
+                "description": "Summary, spending, budgets, goals and latest transactions from one consistent read",
+                "parameters": ["user_id", "sections", "start_date", "end_date", "transactions_limit"]
             }
         ],
         "usage": "These tools are available through the MCP protocol for AI model integration"
@@ -155,7 +179,9 @@ async def list_mcp_tools():
 async def mcp_status():
     """Check MCP server status"""
     return {
-        "mcp_server_running": mcp_server_thread and mcp_server_thread.is_alive(),
+        "mcp_server_running": mcp_ready.is_set(),
+        "endpoint": f"{MCP_MOUNT_PATH}/mcp",
+        "transport": "streamable-http",
         "server_info": "MCP server provides AI tools for financial data management",
         "protocol": "Model Context Protocol (MCP)",
         "integration": "Seamlessly integrated with FastAPI backend"
@@ -167,7 +193,7 @@ if __name__ == "__main__":
     print("=" * 80)
     print("Starting integrated server with:")
     print("  • FastAPI REST API (Port 8000)")
-    print("  • MCP Server (Background)")
+    print("  • MCP Server (streamable HTTP, same process)")
     print("  • Database integration")
     print("  • CORS enabled")
     print("=" * 80)
@@ -177,6 +203,10 @@ if __name__ == "__main__":
     print("  • http://localhost:8000/docs - Interactive API documentation")
     print("  • http://localhost:8000/mcp/tools - MCP tools list")
     print("  • http://localhost:8000/mcp/status - MCP server status")
+    print("  • http://localhost:8000/metrics - Prometheus metrics per route and MCP tool")
+    print("  • http://localhost:8000/debug/slow-queries - Slow statements with their query plans (needs DEBUG_TOKEN)")
+    print("  • http://localhost:8000/debug/profile?seconds=N - Sampled stacks (needs DEBUG_TOKEN)")
+    print("  • http://localhost:8000/mcp-server/mcp - MCP streamable HTTP endpoint")
     print()
     print("MCP tools available for AI integration:")
     print("  • Financial transaction management")
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Fast-Start MCP Server (stdio)
+A startup-optimized stdio front end for the Finance Tracker MCP server.
+
+MCP clients such as Gemini CLI spawn a fresh server process per session and
+wait for `initialize` before anything else. Importing fastmcp, SQLAlchemy and
+the ORM models costs over a second, so this entry point only uses the standard
+library until a tool is actually called:
+
+  - initialize / ping / tools/list are answered from mcp_tools_manifest.json
+  - the first tools/call imports mcp_server (and with it the database layer)
+    and runs the tool through FastMCP, so validation, middleware and results are
+    identical
+
+Each tools/call runs as its own task on one event loop, so calls overlap as
+they do on FastMCP's transports, and notifications/cancelled cancels the
+task, which interrupts the tool's running statement. Responses are written as
+calls finish, so they can arrive out of request order; a cancelled request gets
+no response.
+
+Regenerate the manifest after changing any tool signature or docstring:
+    python mcp_fast_stdio.py --build-manifest
+"""
+
+import sys
+import json
+import asyncio
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+MANIFEST_PATH = project_root / "mcp_tools_manifest.json"
+SUPPORTED_PROTOCOL_VERSIONS = ("2025-06-18", "2025-03-26", "2024-11-05")
+SERVER_INFO = {"name": "Finance Tracker MCP Server", "version": "2.0.0"}
+
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+class FastStdioServer:
+    """Line-delimited JSON-RPC loop that defers every heavy import to the first tool call"""
+
+    def __init__(self, manifest_path: Path = MANIFEST_PATH):
+        with open(manifest_path, encoding="utf-8") as f:
+            self.tools = json.load(f)["tools"]
+        self.tool_names = {tool["name"] for tool in self.tools}
+        self._server = None
+        # Request id -> task of a tools/call that has not answered yet
+        self._calls = {}
+
+    def _load_server(self):
+        """Import the real MCP server"""
+        if self._server is None:
+            from mcp_server import mcp
+
+            self._server = mcp
+        return self._server
+
+    async def call_tool(self, name, arguments):
+        # The same entry point FastMCP's own transports use, so the server's
+        # middleware (tool metrics included) sees stdio calls too
+        try:
+            mcp_result = await self._load_server()._mcp_call_tool(name, arguments or {})
+        except Exception as e:
+            return {"content": [{"type": "text", "text": f"Error executing tool {name}: {e}"}], "isError": True}
+
+        content, structured = mcp_result if isinstance(mcp_result, tuple) else (mcp_result, None)
+        response = {
+            "content": [block.model_dump(by_alias=True, exclude_none=True, mode="json") for block in content],
+            "isError": False
+        }
+        if structured is not None:
+            response["structuredContent"] = structured
+        return response
+
+    async def handle(self, message):
+        """Return the JSON-RPC response for a message, or None for notifications"""
+        method = message.get("method")
+        params = message.get("params") or {}
+
+        if "id" not in message:
+            return None
+
+        if method == "initialize":
+            requested = params.get("protocolVersion")
+            version = requested if requested in SUPPORTED_PROTOCOL_VERSIONS else SUPPORTED_PROTOCOL_VERSIONS[0]
+            result = {
+                "protocolVersion": version,
+                "capabilities": {"tools": {"listChanged": False}},
+                "serverInfo": SERVER_INFO
+            }
+        elif method == "ping":
+            result = {}
+        elif method == "tools/list":
+            result = {"tools": self.tools}
+        elif method == "tools/call":
+            name = params.get("name")
+            if name not in self.tool_names:
+                return self._error(message["id"], INVALID_PARAMS, f"Unknown tool: {name}")
+            result = await self.call_tool(name, params.get("arguments"))
+        else:
+            return self._error(message["id"], METHOD_NOT_FOUND, f"Method not found: {method}")
+
+        return {"jsonrpc": "2.0", "id": message["id"], "result": result}
+
+    @staticmethod
+    def _error(request_id, code, text):
+        return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": text}}
+
+    async def _answer(self, message, write):
+        """Run one request to completion and write its response, unless it was cancelled"""
+        try:
+            response = await self.handle(message)
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            response = self._error(message.get("id"), INTERNAL_ERROR, str(e))
+        finally:
+            self._calls.pop(message.get("id"), None)
+        if response is not None:
+            write(response)
+
+    def _cancel(self, params):
+        task = self._calls.get(params.get("requestId"))
+        if task is not None:
+            task.cancel()
+
+    async def serve_async(self, stdin=sys.stdin, stdout=sys.stdout):
+        """Read requests until stdin closes, then wait for the calls still running"""
+        loop = asyncio.get_running_loop()
+
+        def write(response):
+            stdout.write(json.dumps(response) + "\n")
+            stdout.flush()
+
+        while True:
+            # A blocking read on a worker thread keeps the loop free for running calls
+            line = await loop.run_in_executor(None, stdin.readline)
+            if not line:
+                break
+            if not line.strip():
+                continue
+            try:
+                message = json.loads(line)
+            except ValueError as e:
+                write(self._error(None, INTERNAL_ERROR, str(e)))
+                continue
+
+            if message.get("method") == "notifications/cancelled":
+                self._cancel(message.get("params") or {})
+            elif message.get("method") == "tools/call" and "id" in message:
+                self._calls[message["id"]] = asyncio.create_task(self._answer(message, write))
+            else:
+                # Handshake and listing answers need no I/O, so they go out in order
+                await self._answer(message, write)
+
+        if self._calls:
+            await asyncio.gather(*self._calls.values())
+
+    def serve(self, stdin=sys.stdin, stdout=sys.stdout):
+        asyncio.run(self.serve_async(stdin, stdout))
+
+def build_manifest(manifest_path: Path = MANIFEST_PATH):
+    """Write the tools/list manifest from the FastMCP tool definitions"""
+    import asyncio
+    from mcp_server import mcp
+
+    tools = asyncio.run(mcp.get_tools())
+    manifest = {
+        "tools": [
+            tool.to_mcp_tool().model_dump(by_alias=True, exclude_none=True, mode="json")
+            for tool in tools.values()
+        ]
+    }
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+    print(f"Wrote {len(manifest['tools'])} tools to {manifest_path}", file=sys.stderr)
+
+if __name__ == "__main__":
+    if "--build-manifest" in sys.argv:
+        build_manifest()
+    else:
+        FastStdioServer().serve()
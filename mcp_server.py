@@ -5,31 +5,76 @@ A Model Context Protocol server that provides AI tools for financial data manage
 """
 
 from fastmcp import FastMCP
+from fastmcp.server.middleware import Middleware
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import func
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date, timedelta
-import json
+import sys
+import time
+from pydantic import TypeAdapter, ValidationError
 
 # Import your existing models and database
-from app.database import get_db, engine
-from app.models import Transaction, Budget, Goal, User, TransactionType, GoalStatus
-from app.schemas import TransactionCreate, TransactionResponse
+from app.database import engine
+from app.models import Transaction, Budget, Goal, TransactionType, DailyCategoryTotal
+from app.schemas import TransactionCreate
+from app.services.budgets import evaluate_budgets
+from app.services.transactions import list_transactions_page, bulk_insert_transactions, cursor_for
+from app.services.rollups import update_daily_totals
+from app.services.analytics import spending_statistics
+from app.services.reports import summarize_category_totals
+from app.services.snapshot import SECTIONS, begin_read_snapshot, load_period_rollup, period_spending, summarize_period
+from app.cache import report_cache
+from app.tool_sessions import READ, WRITE, run_tool
+from app.tool_output import (
+    ROWS, TABLE, TOP_N, check_format, decode_offset, encode_offset, encode_records,
+    encoded_size, estimate_tokens, fit_to_budget, project, with_meta
+)
+from app.config import settings
+from app.metrics import TOOL, track
+
+class ToolMetricsMiddleware(Middleware):
+    """Record the latency and SQL of every tool call under the tool's name (see app/metrics.py)"""
+    
+    async def on_call_tool(self, context, call_next):
+        with track(TOOL, context.message.name):
+            return await call_next(context)
 
 # Initialize FastMCP server
 mcp = FastMCP("Finance Tracker MCP Server")
+mcp.add_middleware(ToolMetricsMiddleware())
 
-# Database session dependency
-def get_database_session():
-    """Get database session for MCP tools"""
-    db = Session(engine)
-    try:
-        yield db
-    finally:
-        db.close()
+_transaction_batch_adapter = TypeAdapter(List[TransactionCreate])
+
+def _add_transaction(db: Session, amount: float, description: str, transaction_type: str,
+                     category: str, user_id: int) -> Dict[str, Any]:
+    transaction = Transaction(
+        amount=amount,
+        description=description,
+        transaction_type=TransactionType(transaction_type),
+        category=category,
+        user_id=user_id
+    )
+    
+    db.add(transaction)
+    db.flush()  # Assigns the default date the rollup is keyed on
+    update_daily_totals(db, added=[transaction])
+    db.commit()
+    report_cache.bump(user_id)
+    db.refresh(transaction)
+    
+    return {
+        "id": transaction.id,
+        "amount": float(transaction.amount),
+        "description": transaction.description,
+        "transaction_type": transaction.transaction_type.value,
+        "category": transaction.category,
+        "date": transaction.date.isoformat(),
+        "user_id": transaction.user_id
+    }
 
 @mcp.tool
-def add_transaction(
+async def add_transaction(
     amount: float,
     description: str,
     transaction_type: str,
@@ -49,100 +94,256 @@ def add_transaction(
     Returns:
         Dictionary with transaction details
     """
-    db = Session(engine)
+    # Validate transaction type
+    if transaction_type not in ["income", "expense"]:
+        return {"error": "Transaction type must be 'income' or 'expense'"}
+    
     try:
-        # Validate transaction type
-        if transaction_type not in ["income", "expense"]:
-            return {"error": "Transaction type must be 'income' or 'expense'"}
-        
-        # Create transaction
-        transaction = Transaction(
-            amount=amount,
-            description=description,
-            transaction_type=TransactionType(transaction_type),
-            category=category,
-            user_id=user_id
+        return await run_tool(
+            "add_transaction", WRITE, engine, _add_transaction,
+            amount, description, transaction_type, category, user_id
         )
-        
-        db.add(transaction)
-        db.commit()
-        db.refresh(transaction)
-        
+    except Exception as e:
+        return {"error": f"Failed to add transaction: {str(e)}"}
+
+def _add_transactions_batch(db: Session, user_id: int, validated: List[TransactionCreate]) -> Dict[str, Any]:
+    ids = bulk_insert_transactions(db, user_id, validated)
+    return {"inserted": len(ids), "ids": ids}
+
+@mcp.tool
+async def add_transactions_batch(
+    transactions: List[Dict[str, Any]],
+    user_id: int = 1
+) -> Dict[str, Any]:
+    """
+    Add many financial transactions at once, in a single database transaction
+    
+    Args:
+        transactions: List of transactions, each with amount, description,
+            transaction_type ('income' or 'expense'), category and optional date (ISO format)
+        user_id: User ID (defaults to 1 for demo)
+    
+    Returns:
+        Dictionary with the number inserted and the new transaction ids, in input order.
+        Nothing is inserted if any item is invalid.
+    """
+    if len(transactions) > settings.BULK_INSERT_MAX_ITEMS:
+        return {"error": f"At most {settings.BULK_INSERT_MAX_ITEMS} transactions per call"}
+    
+    # Validate the whole batch in one pass so every problem is reported together
+    try:
+        validated = _transaction_batch_adapter.validate_python(transactions)
+    except ValidationError as e:
         return {
-            "id": transaction.id,
-            "amount": transaction.amount,
-            "description": transaction.description,
-            "transaction_type": transaction.transaction_type.value,
-            "category": transaction.category,
-            "date": transaction.date.isoformat(),
-            "user_id": transaction.user_id
+            "error": "Invalid transactions in batch",
+            "invalid": [
+                {"index": err["loc"][0], "field": ".".join(str(part) for part in err["loc"][1:]), "message": err["msg"]}
+                for err in e.errors()
+            ]
         }
+    
+    try:
+        return await run_tool(
+            "add_transactions_batch", WRITE, engine, _add_transactions_batch, user_id, validated,
+            timeout_ms=60_000
+        )
     except Exception as e:
-        db.rollback()
-        return {"error": f"Failed to add transaction: {str(e)}"}
-    finally:
-        db.close()
+        return {"error": f"Failed to add transactions: {str(e)}"}
+
+def _get_transactions(db: Session, user_id: int, limit: int, transaction_type: Optional[str],
+                      category: Optional[str], start_date: Optional[str], end_date: Optional[str],
+                      cursor: Optional[str]) -> Dict[str, Any]:
+    transactions, next_cursor = list_transactions_page(
+        db,
+        user_id,
+        limit,
+        transaction_type=transaction_type,
+        category=category,
+        start_date=datetime.fromisoformat(start_date) if start_date else None,
+        end_date=datetime.fromisoformat(end_date) if end_date else None,
+        cursor=cursor
+    )
+    
+    return {
+        "transactions": [
+            {
+                "id": t.id,
+                "amount": float(t.amount),
+                "description": t.description,
+                "transaction_type": t.transaction_type.value,
+                "category": t.category,
+                "date": t.date.isoformat(),
+                "user_id": t.user_id
+            }
+            for t in transactions
+        ],
+        "next_cursor": next_cursor
+    }
+
+TRANSACTION_FIELDS = ("id", "date", "amount", "transaction_type", "category", "description", "user_id")
+# Every row of a page belongs to the requested user, so tables leave user_id out by default
+TABLE_TRANSACTION_FIELDS = TRANSACTION_FIELDS[:-1]
+
+def _summarize_transactions(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    totals = {TransactionType.INCOME.value: 0.0, TransactionType.EXPENSE.value: 0.0}
+    spending = {}
+    for record in records:
+        totals[record["transaction_type"]] += record["amount"]
+        if record["transaction_type"] == TransactionType.EXPENSE.value:
+            spending[record["category"]] = spending.get(record["category"], 0.0) + record["amount"]
+    top_categories = sorted(spending.items(), key=lambda x: x[1], reverse=True)[:TOP_N]
+    
+    return {
+        "count": len(records),
+        "total_income": round(totals[TransactionType.INCOME.value], 2),
+        "total_expenses": round(totals[TransactionType.EXPENSE.value], 2),
+        "first_date": records[-1]["date"] if records else None,
+        "last_date": records[0]["date"] if records else None,
+        "top_spending_categories": [[category, round(amount, 2)] for category, amount in top_categories]
+    }
+
+def _cursor_before(records: List[Dict[str, Any]], count: int) -> str:
+    """Cursor continuing a page whose first `count` records were returned"""
+    if count:
+        last = records[count - 1]
+        return cursor_for(datetime.fromisoformat(last["date"]), last["id"])
+    # Nothing fitted: point just past the newest record, so it is the next one returned
+    first = records[0]
+    return cursor_for(datetime.fromisoformat(first["date"]), first["id"] + 1)
+
+def _shape_transactions(page: Dict[str, Any], output_format: str, fields: Optional[List[str]],
+                        max_tokens: Optional[int]) -> Dict[str, Any]:
+    records = page["transactions"]
+    default_fields = TABLE_TRANSACTION_FIELDS if output_format == TABLE and not fields else TRANSACTION_FIELDS
+    columns = project(TRANSACTION_FIELDS, fields or default_fields)
+    
+    def build(count: int, summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        payload = {"transactions": encode_records(records[:count], columns, output_format, timestamps=("date",))}
+        if summary is not None:
+            payload["summary"] = summary
+        payload["next_cursor"] = page["next_cursor"] if count == len(records) else _cursor_before(records, count)
+        return payload
+    
+    payload = build(len(records))
+    if max_tokens is None or estimate_tokens(encoded_size(payload)) <= max_tokens:
+        return with_meta(payload, output_format)
+    
+    # Over budget: aggregates of the whole page, then as many rows as still fit
+    summary = _summarize_transactions(records)
+    payload, _ = fit_to_budget(lambda count: build(count, summary), len(records), max_tokens)
+    return with_meta(payload, output_format, truncated=True)
+
+def _check_output_options(output_format: str, max_tokens: Optional[int]) -> None:
+    check_format(output_format)
+    if max_tokens is not None and max_tokens <= 0:
+        raise ValueError("max_tokens must be positive")
 
 @mcp.tool
-def get_transactions(
+async def get_transactions(
     user_id: int = 1,
     limit: int = 50,
     transaction_type: Optional[str] = None,
     category: Optional[str] = None,
     start_date: Optional[str] = None,
-    end_date: Optional[str] = None
-) -> List[Dict[str, Any]]:
+    end_date: Optional[str] = None,
+    cursor: Optional[str] = None,
+    output_format: str = ROWS,
+    fields: Optional[List[str]] = None,
+    max_tokens: Optional[int] = None
+) -> Dict[str, Any]:
     """
-    Retrieve financial transactions with optional filtering
+    Retrieve financial transactions with optional filtering, newest first
     
     Args:
         user_id: User ID (defaults to 1 for demo)
-        limit: Maximum number of transactions to return
+        limit: Maximum number of transactions to return per page
         transaction_type: Filter by 'income' or 'expense'
         category: Filter by category
         start_date: Start date filter (YYYY-MM-DD format)
         end_date: End date filter (YYYY-MM-DD format)
+        cursor: next_cursor value from a previous call, to fetch the following page
+        output_format: 'rows' for one object per transaction, or 'table' for
+            {"columns": [...], "rows": [[...]]} with compact dates
+        fields: Transaction fields to return (id, date, amount, transaction_type,
+            category, description, user_id); all of them by default
+        max_tokens: Token budget for the result. Over budget, a summary of the
+            page and the transactions that fit are returned, with next_cursor
+            continuing after the last one returned
     
     Returns:
-        List of transaction dictionaries
+        Dictionary with the page of transactions, next_cursor (null on the last page)
+        and _meta with the result's size in bytes and estimated tokens
     """
-    db = Session(engine)
     try:
-        query = db.query(Transaction).filter(Transaction.user_id == user_id)
-        
-        if transaction_type:
-            query = query.filter(Transaction.transaction_type == transaction_type)
-        if category:
-            query = query.filter(Transaction.category == category)
-        if start_date:
-            query = query.filter(Transaction.date >= datetime.fromisoformat(start_date))
-        if end_date:
-            query = query.filter(Transaction.date <= datetime.fromisoformat(end_date))
-        
-        transactions = query.order_by(Transaction.date.desc()).limit(limit).all()
-        
-        return [
-            {
-                "id": t.id,
-                "amount": t.amount,
-                "description": t.description,
-                "transaction_type": t.transaction_type.value,
-                "category": t.category,
-                "date": t.date.isoformat(),
-                "user_id": t.user_id
-            }
-            for t in transactions
-        ]
+        _check_output_options(output_format, max_tokens)
+        page = await run_tool(
+            "get_transactions", READ, engine, _get_transactions,
+            user_id, limit, transaction_type, category, start_date, end_date, cursor
+        )
+        return _shape_transactions(page, output_format, fields, max_tokens)
     except Exception as e:
-        return [{"error": f"Failed to retrieve transactions: {str(e)}"}]
-    finally:
-        db.close()
+        return {"error": f"Failed to retrieve transactions: {str(e)}"}
+
+def _financial_summary(db: Session, user_id: int, start_date: Optional[str], end_date: Optional[str]) -> Dict[str, Any]:
+    # Read the daily rollup: O(days x categories) rows, however many transactions
+    query = db.query(
+        DailyCategoryTotal.transaction_type,
+        DailyCategoryTotal.category,
+        func.sum(DailyCategoryTotal.amount_sum),
+        func.sum(DailyCategoryTotal.transaction_count)
+    ).filter(DailyCategoryTotal.user_id == user_id)
+    
+    if start_date:
+        query = query.filter(DailyCategoryTotal.day >= datetime.fromisoformat(start_date).date())
+    if end_date:
+        query = query.filter(DailyCategoryTotal.day <= datetime.fromisoformat(end_date).date())
+    
+    rows = query.group_by(DailyCategoryTotal.transaction_type, DailyCategoryTotal.category).all()
+    
+    # Sums are exact Decimals of integer cents; the payload carries plain numbers
+    return {
+        **summarize_category_totals(rows),
+        "period": f"{start_date or 'all time'} to {end_date or 'now'}"
+    }
+
+SUMMARY_FIELDS = ("total_income", "total_expenses", "net_worth", "transaction_count",
+                  "category_breakdown", "top_spending_categories", "period")
+
+def _shape_summary(summary: Dict[str, Any], cursor: Optional[str], output_format: str,
+                   fields: Optional[List[str]], max_tokens: Optional[int]) -> Dict[str, Any]:
+    columns = project(SUMMARY_FIELDS, fields)
+    offset = decode_offset(cursor)
+    breakdown = sorted(summary["category_breakdown"].items(), key=lambda x: x[1], reverse=True)[offset:]
+    
+    def build(count: int) -> Dict[str, Any]:
+        payload = {}
+        for field in columns:
+            if field != "category_breakdown":
+                payload[field] = summary[field]
+                continue
+            shown = breakdown[:count]
+            payload[field] = dict(shown) if output_format == ROWS else \
+                {"columns": ["category", "amount"], "rows": [list(item) for item in shown]}
+            payload["next_cursor"] = encode_offset(offset + count) if count < len(breakdown) else None
+        return payload
+    
+    payload = build(len(breakdown))
+    if max_tokens is None or estimate_tokens(encoded_size(payload)) <= max_tokens:
+        return with_meta(payload, output_format)
+    
+    # Over budget: the totals and top categories, then as much of the breakdown as still fits
+    payload, _ = fit_to_budget(build, len(breakdown), max_tokens)
+    return with_meta(payload, output_format, truncated=True)
 
 @mcp.tool
-def get_financial_summary(
+async def get_financial_summary(
     user_id: int = 1,
     start_date: Optional[str] = None,
-    end_date: Optional[str] = None
+    end_date: Optional[str] = None,
+    output_format: str = ROWS,
+    fields: Optional[List[str]] = None,
+    max_tokens: Optional[int] = None,
+    cursor: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Get a comprehensive financial summary including income, expenses, and net worth
@@ -151,54 +352,59 @@ def get_financial_summary(
         user_id: User ID (defaults to 1 for demo)
         start_date: Start date for analysis (YYYY-MM-DD format)
         end_date: End date for analysis (YYYY-MM-DD format)
+        output_format: 'rows' for the category breakdown as an object, or 'table'
+            for {"columns": [...], "rows": [[...]]}, largest spending first
+        fields: Summary fields to return (total_income, total_expenses, net_worth,
+            transaction_count, category_breakdown, top_spending_categories, period);
+            all of them by default
+        max_tokens: Token budget for the result. Over budget, the category breakdown
+            is cut to the largest categories that fit and next_cursor continues it
+        cursor: next_cursor value from a previous call, to continue the category breakdown
     
     Returns:
-        Dictionary with financial summary
+        Dictionary with financial summary and _meta with its size in bytes and estimated tokens
     """
-    db = Session(engine)
     try:
-        query = db.query(Transaction).filter(Transaction.user_id == user_id)
-        
-        if start_date:
-            query = query.filter(Transaction.date >= datetime.fromisoformat(start_date))
-        if end_date:
-            query = query.filter(Transaction.date <= datetime.fromisoformat(end_date))
-        
-        transactions = query.all()
-        
-        # Calculate totals
-        total_income = sum(t.amount for t in transactions if t.transaction_type == TransactionType.INCOME)
-        total_expenses = sum(t.amount for t in transactions if t.transaction_type == TransactionType.EXPENSE)
-        net_worth = total_income - total_expenses
-        
-        # Category breakdown
-        category_breakdown = {}
-        for transaction in transactions:
-            if transaction.transaction_type == TransactionType.EXPENSE:
-                category = transaction.category
-                if category not in category_breakdown:
-                    category_breakdown[category] = 0
-                category_breakdown[category] += transaction.amount
-        
-        # Top categories by spending
-        top_categories = sorted(category_breakdown.items(), key=lambda x: x[1], reverse=True)[:5]
-        
-        return {
-            "total_income": total_income,
-            "total_expenses": total_expenses,
-            "net_worth": net_worth,
-            "transaction_count": len(transactions),
-            "category_breakdown": category_breakdown,
-            "top_spending_categories": top_categories,
-            "period": f"{start_date or 'all time'} to {end_date or 'now'}"
-        }
+        _check_output_options(output_format, max_tokens)
+        summary = await report_cache.get_or_await(
+            "get_financial_summary", user_id, (start_date, end_date),
+            lambda: run_tool("get_financial_summary", READ, engine, _financial_summary, user_id, start_date, end_date)
+        )
+        # The cached summary is shared, so it is shaped into a new payload
+        return _shape_summary(summary, cursor, output_format, fields, max_tokens)
     except Exception as e:
         return {"error": f"Failed to generate financial summary: {str(e)}"}
-    finally:
-        db.close()
+
+def _create_budget(db: Session, name: str, category: str, amount: float, period: str,
+                   start_date: str, end_date: str, user_id: int) -> Dict[str, Any]:
+    budget = Budget(
+        name=name,
+        category=category,
+        amount=amount,
+        period=period,
+        start_date=datetime.fromisoformat(start_date),
+        end_date=datetime.fromisoformat(end_date),
+        user_id=user_id
+    )
+    
+    db.add(budget)
+    db.commit()
+    report_cache.bump(user_id)
+    db.refresh(budget)
+    
+    return {
+        "id": budget.id,
+        "name": budget.name,
+        "category": budget.category,
+        "amount": float(budget.amount),
+        "period": budget.period,
+        "start_date": budget.start_date.isoformat(),
+        "end_date": budget.end_date.isoformat(),
+        "user_id": budget.user_id
+    }
 
 @mcp.tool
-def create_budget(
+async def create_budget(
     name: str,
     category: str,
     amount: float,
@@ -222,40 +428,23 @@ def create_budget(
     Returns:
         Dictionary with budget details
     """
-    db = Session(engine)
     try:
-        budget = Budget(
-            name=name,
-            category=category,
-            amount=amount,
-            period=period,
-            start_date=datetime.fromisoformat(start_date),
-            end_date=datetime.fromisoformat(end_date),
-            user_id=user_id
+        return await run_tool(
+            "create_budget", WRITE, engine, _create_budget,
+            name, category, amount, period, start_date, end_date, user_id
         )
-        
-        db.add(budget)
-        db.commit()
-        db.refresh(budget)
-        
-        return {
-            "id": budget.id,
-            "name": budget.name,
-            "category": budget.category,
-            "amount": budget.amount,
-            "period": budget.period,
-            "start_date": budget.start_date.isoformat(),
-            "end_date": budget.end_date.isoformat(),
-            "user_id": budget.user_id
-        }
     except Exception as e:
-        db.rollback()
         return {"error": f"Failed to create budget: {str(e)}"}
-    finally:
-        db.close()
+
+def _budget_status(db: Session, user_id: int) -> List[Dict[str, Any]]:
+    budget_statuses = evaluate_budgets(db, user_id)
+    for budget_status in budget_statuses:
+        budget_status["percentage_used"] = round(budget_status["percentage_used"], 2)
+    
+    return budget_statuses
 
 @mcp.tool
-def get_budget_status(user_id: int = 1) -> List[Dict[str, Any]]:
+async def get_budget_status(user_id: int = 1) -> List[Dict[str, Any]]:
     """
     Get current status of all budgets including spending vs. budget amounts
     
@@ -265,52 +454,42 @@ def get_budget_status(user_id: int = 1) -> List[Dict[str, Any]]:
     Returns:
         List of budget status dictionaries
     """
-    db = Session(engine)
     try:
-        budgets = db.query(Budget).filter(Budget.user_id == user_id).all()
-        budget_statuses = []
-        
-        for budget in budgets:
-            # Calculate spent amount for this budget
-            spent = db.query(func.sum(Transaction.amount)).filter(
-                and_(
-                    Transaction.user_id == user_id,
-                    Transaction.transaction_type == TransactionType.EXPENSE,
-                    Transaction.category == budget.category,
-                    Transaction.date >= budget.start_date,
-                    Transaction.date <= budget.end_date
-                )
-            ).scalar() or 0
-            
-            remaining = budget.amount - spent
-            percentage_used = (spent / budget.amount) * 100 if budget.amount > 0 else 0
-            
-            if percentage_used > 100:
-                status = "over_budget"
-            elif percentage_used > 80:
-                status = "on_track"
-            else:
-                status = "under_budget"
-            
-            budget_statuses.append({
-                "budget_id": budget.id,
-                "budget_name": budget.name,
-                "category": budget.category,
-                "budget_amount": budget.amount,
-                "spent_amount": spent,
-                "remaining_amount": remaining,
-                "percentage_used": round(percentage_used, 2),
-                "status": status
-            })
-        
-        return budget_statuses
+        return await report_cache.get_or_await(
+            "get_budget_status", user_id, (),
+            lambda: run_tool("get_budget_status", READ, engine, _budget_status, user_id)
+        )
     except Exception as e:
         return [{"error": f"Failed to get budget status: {str(e)}"}]
-    finally:
-        db.close()
+
+def _create_financial_goal(db: Session, title: str, description: str, target_amount: float,
+                           target_date: str, user_id: int) -> Dict[str, Any]:
+    goal = Goal(
+        title=title,
+        description=description,
+        target_amount=target_amount,
+        target_date=datetime.fromisoformat(target_date),
+        user_id=user_id
+    )
+    
+    db.add(goal)
+    db.commit()
+    report_cache.bump(user_id)
+    db.refresh(goal)
+    
+    return {
+        "id": goal.id,
+        "title": goal.title,
+        "description": goal.description,
+        "target_amount": float(goal.target_amount),
+        "current_amount": float(goal.current_amount),
+        "target_date": goal.target_date.isoformat(),
+        "status": goal.status.value,
+        "user_id": goal.user_id
+    }
 
 @mcp.tool
-def create_financial_goal(
+async def create_financial_goal(
     title: str,
     description: str,
     target_amount: float,
@@ -330,38 +509,34 @@ def create_financial_goal(
     Returns:
         Dictionary with goal details
     """
-    db = Session(engine)
     try:
-        goal = Goal(
-            title=title,
-            description=description,
-            target_amount=target_amount,
-            target_date=datetime.fromisoformat(target_date),
-            user_id=user_id
+        return await run_tool(
+            "create_financial_goal", WRITE, engine, _create_financial_goal,
+            title, description, target_amount, target_date, user_id
         )
-        
-        db.add(goal)
-        db.commit()
-        db.refresh(goal)
-        
-        return {
+    except Exception as e:
+        return {"error": f"Failed to create financial goal: {str(e)}"}
+
+def _financial_goals(db: Session, user_id: int) -> List[Dict[str, Any]]:
+    goals = db.query(Goal).filter(Goal.user_id == user_id).all()
+    
+    return [
+        {
             "id": goal.id,
             "title": goal.title,
             "description": goal.description,
-            "target_amount": goal.target_amount,
-            "current_amount": goal.current_amount,
+            "target_amount": float(goal.target_amount),
+            "current_amount": float(goal.current_amount),
             "target_date": goal.target_date.isoformat(),
             "status": goal.status.value,
+            "progress_percentage": float(round((goal.current_amount / goal.target_amount) * 100, 2)) if goal.target_amount > 0 else 0.0,
             "user_id": goal.user_id
         }
-    except Exception as e:
-        db.rollback()
-        return {"error": f"Failed to create financial goal: {str(e)}"}
-    finally:
-        db.close()
+        for goal in goals
+    ]
 
 @mcp.tool
-def get_financial_goals(user_id: int = 1) -> List[Dict[str, Any]]:
+async def get_financial_goals(user_id: int = 1) -> List[Dict[str, Any]]:
     """
     Get all financial goals for a user
     
@@ -371,36 +546,37 @@ def get_financial_goals(user_id: int = 1) -> List[Dict[str, Any]]:
     Returns:
         List of goal dictionaries
     """
-    db = Session(engine)
     try:
-        goals = db.query(Goal).filter(Goal.user_id == user_id).all()
-        
-        return [
-            {
-                "id": goal.id,
-                "title": goal.title,
-                "description": goal.description,
-                "target_amount": goal.target_amount,
-                "current_amount": goal.current_amount,
-                "target_date": goal.target_date.isoformat(),
-                "status": goal.status.value,
-                "progress_percentage": round((goal.current_amount / goal.target_amount) * 100, 2) if goal.target_amount > 0 else 0,
-                "user_id": goal.user_id
-            }
-            for goal in goals
-        ]
+        return await report_cache.get_or_await(
+            "get_financial_goals", user_id, (),
+            lambda: run_tool("get_financial_goals", READ, engine, _financial_goals, user_id)
+        )
     except Exception as e:
         return [{"error": f"Failed to get financial goals: {str(e)}"}]
-    finally:
-        db.close()
+
+def _spending_patterns(db: Session, user_id: int, days: int) -> Dict[str, Any]:
+    end_day = date.today()
+    start_day = end_day - timedelta(days=days)
+    
+    # Vectorized over the daily rollup; see app/services/analytics.py
+    statistics = spending_statistics(db, user_id, start_day, end_day)
+    if not statistics:
+        return {"message": "No transactions found for analysis"}
+    
+    return {
+        "analysis_period_days": days,
+        "average_daily_spending": round(statistics["total_spent"] / days, 2),
+        **statistics
+    }
 
 @mcp.tool
-def analyze_spending_patterns(
+async def analyze_spending_patterns(
     user_id: int = 1,
     days: int = 30
 ) -> Dict[str, Any]:
     """
-    Analyze spending patterns over a specified period
+    Analyze spending patterns over a specified period: totals, daily percentiles,
+    rolling 7/30-day means, weekday seasonality and per-category totals
     
     Args:
         user_id: User ID (defaults to 1 for demo)
@@ -409,71 +585,105 @@ def analyze_spending_patterns(
     Returns:
         Dictionary with spending pattern analysis
     """
-    db = Session(engine)
     try:
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-        
-        transactions = db.query(Transaction).filter(
-            and_(
-                Transaction.user_id == user_id,
-                Transaction.transaction_type == TransactionType.EXPENSE,
-                Transaction.date >= start_date,
-                Transaction.date <= end_date
-            )
-        ).all()
-        
-        if not transactions:
-            return {"message": "No transactions found for analysis"}
-        
-        # Daily spending analysis
-        daily_spending = {}
-        for transaction in transactions:
-            day = transaction.date.date()
-            if day not in daily_spending:
-                daily_spending[day] = 0
-            daily_spending[day] += transaction.amount
-        
-        # Category analysis
-        category_totals = {}
-        for transaction in transactions:
-            category = transaction.category
-            if category not in category_totals:
-                category_totals[category] = 0
-            category_totals[category] += transaction.amount
-        
-        # Calculate statistics
-        total_spent = sum(transaction.amount for transaction in transactions)
-        avg_daily_spending = total_spent / days
-        max_daily_spending = max(daily_spending.values()) if daily_spending else 0
-        min_daily_spending = min(daily_spending.values()) if daily_spending else 0
-        
-        return {
-            "analysis_period_days": days,
-            "total_spent": total_spent,
-            "average_daily_spending": round(avg_daily_spending, 2),
-            "max_daily_spending": max_daily_spending,
-            "min_daily_spending": min_daily_spending,
-            "category_breakdown": category_totals,
-            "top_spending_category": max(category_totals.items(), key=lambda x: x[1]) if category_totals else None,
-            "transaction_count": len(transactions)
-        }
+        return await report_cache.get_or_await(
+            "analyze_spending_patterns", user_id, (days, date.today()),
+            lambda: run_tool("analyze_spending_patterns", READ, engine, _spending_patterns, user_id, days)
+        )
     except Exception as e:
         return {"error": f"Failed to analyze spending patterns: {str(e)}"}
-    finally:
-        db.close()
+
+def _financial_snapshot(db: Session, user_id: int, sections: List[str], start_day: date, end_day: date,
+                        transactions_limit: int) -> Dict[str, Any]:
+    timings = {}
+    
+    def timed(section, compute):
+        started = time.perf_counter()
+        result = compute()
+        timings[section] = round((time.perf_counter() - started) * 1000, 2)
+        return result
+    
+    begin_read_snapshot(db)
+    snapshot = {"period": f"{start_day} to {end_day}"}
+    
+    # One scan of the period's rollup serves both the summary and the spending statistics
+    if "summary" in sections or "spending" in sections:
+        rows = timed("rollup_scan", lambda: load_period_rollup(db, user_id, start_day, end_day))
+    if "summary" in sections:
+        snapshot["summary"] = timed("summary", lambda: summarize_period(rows))
+    if "spending" in sections:
+        statistics = timed("spending", lambda: period_spending(rows, start_day, end_day))
+        snapshot["spending"] = statistics or {"message": "No transactions found for analysis"}
+    if "budgets" in sections:
+        snapshot["budgets"] = timed("budgets", lambda: _budget_status(db, user_id))
+    if "goals" in sections:
+        snapshot["goals"] = timed("goals", lambda: _financial_goals(db, user_id))
+    if "transactions" in sections:
+        snapshot["transactions"] = timed("transactions", lambda: _get_transactions(
+            db, user_id, transactions_limit, None, None,
+            start_day.isoformat(), datetime.combine(end_day, datetime.max.time()).isoformat(), None
+        ))
+    
+    snapshot["timings_ms"] = timings
+    return snapshot
+
+@mcp.tool
+async def financial_snapshot(
+    user_id: int = 1,
+    sections: Optional[List[str]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    transactions_limit: int = 10
+) -> Dict[str, Any]:
+    """
+    Answer "how am I doing" in one call: the financial summary, spending patterns,
+    budget status, goals and latest transactions of a period, read from one
+    consistent snapshot of the database
+    
+    Args:
+        user_id: User ID (defaults to 1 for demo)
+        sections: Sections to include, any of summary, spending, budgets, goals and
+            transactions (defaults to all of them)
+        start_date: Start of the period (YYYY-MM-DD format, defaults to the first day of this month)
+        end_date: End of the period, inclusive (YYYY-MM-DD format, defaults to today)
+        transactions_limit: Number of latest transactions of the period to include
+    
+    Returns:
+        Dictionary with one entry per requested section and timings_ms, the time
+        spent on each section in milliseconds
+    """
+    try:
+        sections = list(dict.fromkeys(sections or SECTIONS))
+        unknown = [section for section in sections if section not in SECTIONS]
+        if unknown:
+            raise ValueError(f"Unknown sections {', '.join(unknown)}, expected some of {', '.join(SECTIONS)}")
+        end_day = date.fromisoformat(end_date) if end_date else date.today()
+        start_day = date.fromisoformat(start_date) if start_date else end_day.replace(day=1)
+        
+        started = time.perf_counter()
+        snapshot = await run_tool(
+            "financial_snapshot", READ, engine, _financial_snapshot,
+            user_id, sections, start_day, end_day, transactions_limit
+        )
+        snapshot["timings_ms"]["total"] = round((time.perf_counter() - started) * 1000, 2)
+        return snapshot
+    except Exception as e:
+        return {"error": f"Failed to build financial snapshot: {str(e)}"}
 
 if __name__ == "__main__":
-    print("Starting Finance Tracker MCP Server...")
-    print("Available tools:")
-    print("- add_transaction: Add income or expense")
-    print("- get_transactions: Retrieve transactions with filters")
-    print("- get_financial_summary: Get comprehensive financial overview")
-    print("- create_budget: Create spending budgets")
-    print("- get_budget_status: Check budget performance")
-    print("- create_financial_goal: Set financial goals")
-    print("- get_financial_goals: View all goals")
-    print("- analyze_spending_patterns: Analyze spending behavior")
-    print("\nServer is ready to accept connections!")
+    # Banners go to stderr: stdout carries the stdio JSON-RPC stream
+    print("Starting Finance Tracker MCP Server...", file=sys.stderr)
+    print("Available tools:", file=sys.stderr)
+    print("- add_transaction: Add income or expense", file=sys.stderr)
+    print("- add_transactions_batch: Add many transactions in one call", file=sys.stderr)
+    print("- get_transactions: Retrieve transactions with filters", file=sys.stderr)
+    print("- get_financial_summary: Get comprehensive financial overview", file=sys.stderr)
+    print("- create_budget: Create spending budgets", file=sys.stderr)
+    print("- get_budget_status: Check budget performance", file=sys.stderr)
+    print("- create_financial_goal: Set financial goals", file=sys.stderr)
+    print("- get_financial_goals: View all goals", file=sys.stderr)
+    print("- analyze_spending_patterns: Analyze spending behavior", file=sys.stderr)
+    print("- financial_snapshot: Summary, budgets, goals and transactions in one call", file=sys.stderr)
+    print("\nServer is ready to accept connections!", file=sys.stderr)
     
     mcp.run()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Rebuild the daily_category_totals rollup for Finance Tracker
+Recomputes the per-day, per-category totals that the reports read from the
+transactions table. Run it after loading transactions outside the API/MCP
+write paths, or to repair a rollup that has drifted.
+
+Usage: python rebuild_daily_totals.py [--user-id ID]
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from app.database import engine, Base
+from app.migrations import run_migrations
+from app.services.rollups import rebuild_daily_totals
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the daily_category_totals rollup")
+    parser.add_argument("--user-id", type=int, default=None, help="Only rebuild this user's rows")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+
+    scope = f"user {args.user_id}" if args.user_id is not None else "all users"
+    print(f"🔄 Rebuilding daily category totals for {scope}...")
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        rows = rebuild_daily_totals(conn, args.user_id)
+    print(f"✅ Wrote {rows} rollup rows in {time.perf_counter() - started:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -42,7 +42,7 @@ def test_mcp_tools():
     print("\n2. Testing get_transactions...")
     try:
         from mcp_server import get_transactions
-        result = get_transactions(user_id=1, limit=5)
+        result = get_transactions(user_id=1, limit=5)["transactions"]
         print(f"   ✅ Found {len(result)} transactions")
         for tx in result[:2]:  # Show first 2
             print(f"      - {tx.get('description', 'N/A')}: ${tx.get('amount', 0)}")
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """
 MCP Server Startup Script for Gemini CLI Integration
-Optimized for Gemini CLI compatibility
+Optimized for Gemini CLI compatibility: uses the fast-start stdio server, which
+answers initialize and tools/list before loading the database layer
 """
 
 import sys
@@ -16,9 +17,9 @@ sys.path.insert(0, str(project_root))
 os.environ.setdefault("DATABASE_URL", "sqlite:///./finance_tracker_litequery.db")
 os.environ.setdefault("PYTHONPATH", str(project_root))
 
-# Import and run the MCP server
-from mcp_server import mcp
+# Import and run the fast-start MCP server (heavy imports happen on first tool call)
+from mcp_fast_stdio import FastStdioServer
 
 if __name__ == "__main__":
     # Run the MCP server
-    mcp.run()
+    FastStdioServer().serve()
@@ -15,31 +15,34 @@ sys.path.insert(0, str(project_root))
 os.environ.setdefault("DATABASE_URL", "sqlite:///./finance_tracker.db")
 
 if __name__ == "__main__":
-    print("=" * 60)
-    print("Finance Tracker MCP Server")
-    print("=" * 60)
-    print("Starting MCP server with the following tools:")
-    print()
-    print("Financial Management Tools:")
-    print("  • add_transaction - Add income/expense transactions")
-    print("  • get_transactions - Retrieve transactions with filters")
-    print("  • get_financial_summary - Get comprehensive financial overview")
-    print()
-    print("Budget Management Tools:")
-    print("  • create_budget - Create spending budgets")
-    print("  • get_budget_status - Check budget performance")
-    print()
-    print("Goal Management Tools:")
-    print("  • create_financial_goal - Set financial goals")
-    print("  • get_financial_goals - View all goals")
-    print()
-    print("Analytics Tools:")
-    print("  • analyze_spending_patterns - Analyze spending behavior")
-    print()
-    print("=" * 60)
-    print("Server is starting...")
-    print("=" * 60)
+    # Banners go to stderr: stdout carries the stdio JSON-RPC stream
+    print("=" * 60, file=sys.stderr)
+    print("Finance Tracker MCP Server", file=sys.stderr)
+    print("=" * 60, file=sys.stderr)
+    print("Starting MCP server with the following tools:", file=sys.stderr)
+    print(file=sys.stderr)
+    print("Financial Management Tools:", file=sys.stderr)
+    print("  • add_transaction - Add income/expense transactions", file=sys.stderr)
+    print("  • add_transactions_batch - Add many transactions in one call", file=sys.stderr)
+    print("  • get_transactions - Retrieve transactions with filters", file=sys.stderr)
+    print("  • get_financial_summary - Get comprehensive financial overview", file=sys.stderr)
+    print(file=sys.stderr)
+    print("Budget Management Tools:", file=sys.stderr)
+    print("  • create_budget - Create spending budgets", file=sys.stderr)
+    print("  • get_budget_status - Check budget performance", file=sys.stderr)
+    print(file=sys.stderr)
+    print("Goal Management Tools:", file=sys.stderr)
+    print("  • create_financial_goal - Set financial goals", file=sys.stderr)
+    print("  • get_financial_goals - View all goals", file=sys.stderr)
+    print(file=sys.stderr)
+    print("Analytics Tools:", file=sys.stderr)
+    print("  • analyze_spending_patterns - Analyze spending behavior", file=sys.stderr)
+    print("  • financial_snapshot - Summary, budgets, goals and transactions in one call", file=sys.stderr)
+    print(file=sys.stderr)
+    print("=" * 60, file=sys.stderr)
+    print("Server is starting...", file=sys.stderr)
+    print("=" * 60, file=sys.stderr)
     
-    # Import and run the MCP server
-    from mcp_server import mcp
-    mcp.run()
+    # Import and run the fast-start MCP server (heavy imports happen on first tool call)
+    from mcp_fast_stdio import FastStdioServer
+    FastStdioServer().serve()
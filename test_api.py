@@ -270,10 +270,10 @@ def test_csv_export(token):
     try:
         response = requests.get(f"{API_URL}/reports/export/csv", headers=headers)
         if response.status_code == 200:
-            csv_data = response.json()
+            csv_content = response.text  # The export streams text/csv, not JSON
             print("✅ CSV Export Successful!")
             print("CSV Content Preview:")
-            print(csv_data['csv_content'][:500] + "..." if len(csv_data['csv_content']) > 500 else csv_data['csv_content'])
+            print(csv_content[:500] + "..." if len(csv_content) > 500 else csv_content)
         else:
             print(f"❌ Failed to export CSV: {response.text}")
     except Exception as e:
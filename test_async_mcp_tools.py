@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Test the async MCP tools
+Runs 50 concurrent tool calls against the read/write concurrency caps and
+checks that cancelling a call interrupts its running SQLite statement.
+"""
+
+import sys
+import asyncio
+import threading
+import time
+from pathlib import Path
+from datetime import datetime, timedelta
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models import Transaction, TransactionType
+from app.config import settings
+from app.tool_sessions import READ, run_tool, tool_usage
+
+RUNAWAY_QUERY = (
+    "WITH RECURSIVE r(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM r) "
+    "SELECT count(*) FROM (SELECT i FROM r LIMIT 1000000000)"
+)
+
+def seed(engine, rows=200):
+    now = datetime.now()
+    with Session(engine) as db:
+        db.add_all(
+            Transaction(amount=3.0, description=f"Item {i}", transaction_type=TransactionType.EXPENSE,
+                        category="food", date=now - timedelta(minutes=i), user_id=1)
+            for i in range(rows)
+        )
+        db.commit()
+    tool_usage.clear()
+
+class ConcurrencyProbe:
+    """Wraps tool bodies to record the most calls of each kind running at once"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.active = {"read": 0, "write": 0}
+        self.peak = {"read": 0, "write": 0}
+
+    def wrap(self, kind, func):
+        def probed(db, *args):
+            with self._lock:
+                self.active[kind] += 1
+                self.peak[kind] = max(self.peak[kind], self.active[kind])
+            try:
+                time.sleep(0.005)  # Long enough for calls to overlap
+                return func(db, *args)
+            finally:
+                with self._lock:
+                    self.active[kind] -= 1
+        return probed
+
+def test_fifty_concurrent_calls_respect_the_caps(engine):
+    import mcp_server
+
+    seed(engine)
+    probe = ConcurrencyProbe()
+    originals = {
+        "engine": mcp_server.engine,
+        "_get_transactions": mcp_server._get_transactions,
+        "_add_transaction": mcp_server._add_transaction,
+    }
+    mcp_server.engine = engine
+    mcp_server._get_transactions = probe.wrap("read", originals["_get_transactions"])
+    mcp_server._add_transaction = probe.wrap("write", originals["_add_transaction"])
+
+    async def load():
+        calls = []
+        for i in range(50):
+            if i % 5 == 0:
+                calls.append(mcp_server.add_transaction.fn(
+                    amount=1.0, description=f"Load {i}", transaction_type="expense", category="food"))
+            else:
+                calls.append(mcp_server.get_transactions.fn(user_id=1, limit=20))
+        started = time.perf_counter()
+        results = await asyncio.gather(*calls)
+        return results, time.perf_counter() - started
+
+    try:
+        results, elapsed = asyncio.run(load())
+    finally:
+        for name, value in originals.items():
+            setattr(mcp_server, name, value)
+
+    assert all("error" not in result for result in results)
+    assert sum(1 for result in results if "transactions" in result) == 40
+    assert 1 < probe.peak["read"] <= settings.MCP_READ_CONCURRENCY
+    assert probe.peak["write"] == settings.MCP_WRITE_CONCURRENCY
+    usage = tool_usage.stats()
+    assert usage["get_transactions"]["calls"] == 40
+    assert usage["add_transaction"]["calls"] == 10
+    with Session(engine) as db:
+        assert db.query(Transaction).count() == 210
+    print(f"   50 concurrent tool calls in {elapsed * 1000:.0f} ms")
+
+def test_cancellation_interrupts_the_statement(engine):
+    seed(engine, rows=0)
+
+    def runaway(db):
+        return db.execute(text(RUNAWAY_QUERY)).scalar()
+
+    async def scenario():
+        task = asyncio.create_task(run_tool("runaway", READ, engine, runaway, timeout_ms=60_000))
+        await asyncio.sleep(0.2)
+        cancelled_at = time.perf_counter()
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+        # Every read slot is free again once the interrupted worker has stopped:
+        # a full set of calls can hold their slots at the same time
+        barrier = threading.Barrier(settings.MCP_READ_CONCURRENCY)
+
+        def hold_slot(db):
+            barrier.wait(timeout=5)
+            return db.execute(text("SELECT 1")).scalar()
+
+        results = await asyncio.gather(*(
+            run_tool("after", READ, engine, hold_slot) for _ in range(settings.MCP_READ_CONCURRENCY)
+        ))
+        return time.perf_counter() - cancelled_at, results
+
+    elapsed, results = asyncio.run(scenario())
+    assert results == [1] * settings.MCP_READ_CONCURRENCY
+    assert elapsed < 2.0
+    usage = tool_usage.stats()
+    assert usage["runaway"]["cancelled"] == 1
+    assert engine.pool.checkedout() == 0
+
+if __name__ == "__main__":
+    print("🧪 Testing async MCP tools")
+    sys.exit(pytest.main(["-q", __file__]))
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Regression test for budget status evaluation
+Checks the REST endpoint and the MCP tool return the expected payloads and
+that evaluating any number of budgets costs a single SQL statement.
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+from datetime import datetime
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models import Budget, Transaction, TransactionType
+from app.services.budgets import evaluate_budgets
+
+def seed(engine, extra_budgets=0):
+    start, end = datetime(2025, 3, 1), datetime(2025, 3, 31)
+    with Session(engine) as db:
+        db.add_all([
+            Budget(name="Food", category="food", amount=100.0, period="monthly", start_date=start, end_date=end, user_id=1),
+            Budget(name="Travel", category="travel", amount=50.0, period="monthly", start_date=start, end_date=end, user_id=1),
+            Budget(name="Shopping", category="shopping", amount=10.0, period="monthly", start_date=start, end_date=end, user_id=1),
+            Budget(name="Other user", category="food", amount=10.0, period="monthly", start_date=start, end_date=end, user_id=2),
+        ])
+        db.add_all([
+            Transaction(amount=30.0, description="Groceries", transaction_type=TransactionType.EXPENSE, category="food", date=datetime(2025, 3, 5), user_id=1),
+            Transaction(amount=60.0, description="Dinner", transaction_type=TransactionType.EXPENSE, category="food", date=datetime(2025, 3, 20), user_id=1),
+            Transaction(amount=99.0, description="Old groceries", transaction_type=TransactionType.EXPENSE, category="food", date=datetime(2025, 2, 20), user_id=1),
+            Transaction(amount=500.0, description="Food refund", transaction_type=TransactionType.INCOME, category="food", date=datetime(2025, 3, 6), user_id=1),
+            Transaction(amount=15.0, description="Shoes", transaction_type=TransactionType.EXPENSE, category="shopping", date=datetime(2025, 3, 7), user_id=1),
+            Transaction(amount=7.0, description="Snack", transaction_type=TransactionType.EXPENSE, category="food", date=datetime(2025, 3, 7), user_id=2),
+        ])
+        for i in range(extra_budgets):
+            db.add(Budget(name=f"Extra {i}", category=f"cat_{i}", amount=10.0, period="monthly", start_date=start, end_date=end, user_id=1))
+        db.commit()
+
+def count_statements(engine):
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    return statements
+
+def test_evaluate_budgets_payload(engine):
+    seed(engine)
+    with Session(engine) as db:
+        statuses = evaluate_budgets(db, 1)
+
+    assert [s["budget_name"] for s in statuses] == ["Food", "Travel", "Shopping"]
+    food, travel, shopping = statuses
+    assert food["spent_amount"] == 90.0
+    assert food["remaining_amount"] == 10.0
+    assert food["percentage_used"] == 90.0
+    assert food["status"] == "on_track"
+    assert travel["spent_amount"] == 0
+    assert travel["status"] == "under_budget"
+    assert shopping["spent_amount"] == 15.0
+    assert shopping["status"] == "over_budget"
+
+def test_budget_status_single_query(engine):
+    seed(engine, extra_budgets=200)
+    statements = count_statements(engine)
+    with Session(engine) as db:
+        statuses = evaluate_budgets(db, 1)
+
+    assert len(statuses) == 203
+    selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 1, f"expected 1 SELECT, got {len(selects)}"
+
+def test_rest_and_mcp_payloads(engine, client):
+    import mcp_server
+
+    seed(engine)
+    response = client.get("/api/v1/reports/budget-status")
+
+    assert response.status_code == 200
+    assert response.json()[0] == {
+        "budget_id": 1,
+        "budget_name": "Food",
+        "budget_amount": 100.0,
+        "spent_amount": 90.0,
+        "remaining_amount": 10.0,
+        "percentage_used": 90.0,
+        "status": "on_track"
+    }
+
+    original_engine = mcp_server.engine
+    mcp_server.engine = engine
+    try:
+        tool_result = asyncio.run(mcp_server.get_budget_status.fn(user_id=1))
+    finally:
+        mcp_server.engine = original_engine
+
+    assert tool_result[2] == {
+        "budget_id": 3,
+        "budget_name": "Shopping",
+        "category": "shopping",
+        "budget_amount": 10.0,
+        "spent_amount": 15.0,
+        "remaining_amount": -5.0,
+        "percentage_used": 150.0,
+        "status": "over_budget"
+    }
+
+if __name__ == "__main__":
+    print("🧪 Testing budget status evaluation")
+    print("=" * 50)
+    sys.exit(pytest.main(["-q", __file__]))
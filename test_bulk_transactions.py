@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test bulk transaction ingestion over REST and MCP
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models import Transaction
+
+def count_rows(engine):
+    with Session(engine) as db:
+        return db.query(func.count(Transaction.id)).scalar()
+
+def test_rest_bulk_insert(engine, client):
+    payload = [
+        {"amount": i + 0.5, "description": f"Row {i}", "transaction_type": "expense", "category": "food"}
+        for i in range(3000)
+    ]
+    payload[10]["date"] = "2025-02-01T10:00:00"
+    payload[11]["currency"] = "EUR"
+
+    response = client.post("/api/v1/transactions/bulk", json=payload)
+    invalid = client.post("/api/v1/transactions/bulk", json=[{"amount": "lots", "description": "x"}])
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["inserted"] == 3000
+    assert body["ids"] == list(range(1, 3001))
+    assert invalid.status_code == 422
+    assert count_rows(engine) == 3000
+
+    with Session(engine) as db:
+        row = db.get(Transaction, body["ids"][10])
+        assert row.amount == 10.5
+        assert row.date.isoformat() == "2025-02-01T10:00:00"
+        assert db.get(Transaction, body["ids"][11]).currency == "EUR"
+        assert db.get(Transaction, body["ids"][12]).currency == "USD"
+
+def test_mcp_batch_is_all_or_nothing(engine):
+    import mcp_server
+
+    original_engine = mcp_server.engine
+    mcp_server.engine = engine
+    try:
+        rejected = asyncio.run(mcp_server.add_transactions_batch.fn(transactions=[
+            {"amount": 5, "description": "Coffee", "transaction_type": "expense", "category": "food"},
+            {"amount": 5, "description": "Bad", "transaction_type": "refund", "category": "food"},
+            {"description": "No amount", "transaction_type": "income", "category": "salary"},
+        ]))
+        accepted = asyncio.run(mcp_server.add_transactions_batch.fn(transactions=[
+            {"amount": 5, "description": "Coffee", "transaction_type": "expense", "category": "food"},
+            {"amount": 900, "description": "Pay", "transaction_type": "income", "category": "salary", "date": "2025-03-01"},
+        ]))
+    finally:
+        mcp_server.engine = original_engine
+
+    assert rejected["error"] == "Invalid transactions in batch"
+    assert sorted(item["index"] for item in rejected["invalid"]) == [1, 2]
+    assert accepted == {"inserted": 2, "ids": [1, 2]}
+    assert count_rows(engine) == 2
+
+if __name__ == "__main__":
+    print("🧪 Testing bulk transaction ingestion")
+    sys.exit(pytest.main(["-q", __file__]))
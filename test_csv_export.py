@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test the streaming CSV export endpoint
+"""
+
+import sys
+import csv
+import io
+from pathlib import Path
+from datetime import date, datetime, timedelta
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models import Transaction, TransactionType
+from app.services.rollups import rebuild_daily_totals
+
+def seed(engine, rows):
+    with Session(engine) as db:
+        db.add_all(rows)
+        db.commit()
+    with engine.begin() as conn:
+        rebuild_daily_totals(conn)
+
+def test_csv_export_streams_quoted_rows(engine, client):
+    day = datetime.now() - timedelta(days=1)
+    rows = [
+        Transaction(amount=12.5, description='Dinner, drinks and "tips"', transaction_type=TransactionType.EXPENSE,
+                    category="food", date=day, user_id=1)
+    ] + [
+        Transaction(amount=float(i), description=f"Item {i}", transaction_type=TransactionType.INCOME,
+                    category="salary", date=day + timedelta(seconds=i), user_id=1)
+        for i in range(1, 2500)
+    ]
+    seed(engine, rows)
+    params = {"start_date": (date.today() - timedelta(days=2)).isoformat(),
+              "end_date": (date.today() + timedelta(days=1)).isoformat()}
+    response = client.get("/api/v1/reports/export/csv", params=params)
+    legacy = client.get("/api/v1/reports/export/csv", params={**params, "as_json": "true"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    parsed = list(csv.reader(io.StringIO(response.text)))
+    assert parsed[0] == ["Date", "Type", "Category", "Description", "Amount"]
+    assert len(parsed) == 2501
+    assert parsed[1][1:] == ["expense", "food", 'Dinner, drinks and "tips"', "12.50"]
+
+    assert legacy.status_code == 200
+    assert legacy.json()["csv_content"] == response.text
+
+def test_end_date_includes_the_whole_end_day(engine, client):
+    rows = [
+        Transaction(amount=amount, description=description, transaction_type=TransactionType.EXPENSE,
+                    category="food", date=when, user_id=1)
+        for amount, description, when in [
+            (1.0, "Before", datetime(2024, 12, 31, 23, 59)),
+            (2.0, "First day", datetime(2025, 1, 1, 0, 0)),
+            (4.0, "Evening of the end day", datetime(2025, 1, 31, 18, 30)),
+            (8.0, "After", datetime(2025, 2, 1, 0, 0)),
+        ]
+    ]
+    seed(engine, rows)
+    params = {"start_date": "2025-01-01", "end_date": "2025-01-31"}
+    exported = client.get("/api/v1/reports/export/csv", params=params)
+    listed = client.get("/api/v1/transactions/", params=params)
+    report = client.get("/api/v1/reports/spending", params=params)
+
+    descriptions = [row[3] for row in csv.reader(io.StringIO(exported.text))][1:]
+    assert descriptions == ["First day", "Evening of the end day"]
+    assert [t["description"] for t in listed.json()] == ["Evening of the end day", "First day"]
+    assert report.json()["total_expenses"] == 6.0
+
+if __name__ == "__main__":
+    print("🧪 Testing streaming CSV export")
+    sys.exit(pytest.main(["-q", __file__]))
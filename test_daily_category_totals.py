@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test the daily_category_totals rollup
+Every write path must keep the rollup identical to a rebuild from raw
+transactions, and the reports read from it must match the raw data.
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+from datetime import date, datetime
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models import DailyCategoryTotal, Transaction, TransactionType
+from app.migrations import run_migrations, MIGRATIONS
+from app.services.reports import build_spending_report
+from app.services.rollups import rebuild_daily_totals
+
+def rollup_rows(engine):
+    with Session(engine) as db:
+        rows = db.query(DailyCategoryTotal).order_by(
+            DailyCategoryTotal.day, DailyCategoryTotal.transaction_type, DailyCategoryTotal.category
+        ).all()
+        return [(r.user_id, r.day, r.transaction_type, r.category, round(r.amount_sum, 6), r.transaction_count)
+                for r in rows]
+
+def assert_matches_rebuild(engine):
+    maintained = rollup_rows(engine)
+    with engine.begin() as conn:
+        rebuild_daily_totals(conn)
+    assert maintained == rollup_rows(engine)
+    return maintained
+
+def test_write_paths_keep_rollup_in_sync(engine, client):
+    import mcp_server
+
+    original_engine = mcp_server.engine
+    mcp_server.engine = engine
+    try:
+        first = client.post("/api/v1/transactions/", json={
+            "amount": 20.0, "description": "Lunch", "transaction_type": "expense",
+            "category": "food", "date": "2025-03-05T12:00:00"
+        }).json()
+        client.post("/api/v1/transactions/", json={
+            "amount": 5.5, "description": "Coffee", "transaction_type": "expense",
+            "category": "food", "date": "2025-03-05T08:00:00"
+        })
+        client.post("/api/v1/transactions/bulk", json=[
+            {"amount": 1000.0, "description": "Salary", "transaction_type": "income",
+             "category": "salary", "date": "2025-03-01T09:00:00"},
+            {"amount": 12.0, "description": "Bus", "transaction_type": "expense",
+             "category": "transportation", "date": "2025-03-05T18:00:00"},
+        ])
+        asyncio.run(mcp_server.add_transaction.fn(amount=7.0, description="Snack", transaction_type="expense", category="food"))
+        assert_matches_rebuild(engine)
+
+        # Moving a transaction to another day and category shifts it between groups
+        client.put(f"/api/v1/transactions/{first['id']}", json={
+            "amount": 25.0, "description": "Dinner", "transaction_type": "expense",
+            "category": "entertainment", "date": "2025-03-06T20:00:00"
+        })
+        rows = assert_matches_rebuild(engine)
+        assert (1, date(2025, 3, 6), TransactionType.EXPENSE, "entertainment", 25.0, 1) in rows
+
+        # Omitting the date keeps the existing one
+        updated = client.put(f"/api/v1/transactions/{first['id']}", json={
+            "amount": 30.0, "description": "Dinner", "transaction_type": "expense", "category": "entertainment"
+        })
+        assert updated.json()["date"].startswith("2025-03-06")
+        assert_matches_rebuild(engine)
+
+        client.delete(f"/api/v1/transactions/{first['id']}")
+        rows = assert_matches_rebuild(engine)
+        assert not [row for row in rows if row[3] == "entertainment"]
+    finally:
+        mcp_server.engine = original_engine
+
+def test_reports_match_raw_transactions(engine):
+    with Session(engine) as db:
+        for day in range(1, 29):
+            for category, amount in (("food", 10.0), ("travel", 3.25)):
+                db.add(Transaction(amount=amount * day, description="x", transaction_type=TransactionType.EXPENSE,
+                                   category=category, date=datetime(2025, 2, day, 10), user_id=1))
+        db.add(Transaction(amount=4000.0, description="Pay", transaction_type=TransactionType.INCOME,
+                           category="salary", date=datetime(2025, 2, 28, 23, 59), user_id=1))
+        db.commit()
+    with engine.begin() as conn:
+        assert rebuild_daily_totals(conn) == 28 * 2 + 1
+
+    with Session(engine) as db:
+        report = build_spending_report(db, 1, date(2025, 2, 1), date(2025, 2, 28))
+        raw_food = db.query(Transaction).filter(Transaction.category == "food").all()
+    assert report.total_income == 4000.0
+    assert report.category_breakdown["food"] == sum(t.amount for t in raw_food)
+    assert round(report.total_expenses, 6) == round(sum(13.25 * day for day in range(1, 29)), 6)
+
+def test_migration_backfills_existing_database(engine):
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO transactions (amount_cents, description, transaction_type, category, date, user_id) "
+            "VALUES (950, 'Old', 'EXPENSE', 'food', '2024-12-31 10:00:00', 1), "
+            "(50, 'Old', 'EXPENSE', 'food', '2024-12-31 22:00:00', 1)"
+        ))
+        # A database from before the rollup existed, with the index migration applied
+        conn.exec_driver_sql("PRAGMA user_version = 1")
+    run_migrations(engine)
+
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA user_version").scalar() == len(MIGRATIONS)
+    rows = rollup_rows(engine)
+    assert [(row[3], row[4], row[5]) for row in rows] == [("food", 10.0, 2)]
+    assert str(rows[0][1]) == "2024-12-31"
+
+if __name__ == "__main__":
+    print("🧪 Testing the daily category totals rollup")
+    sys.exit(pytest.main(["-q", __file__]))
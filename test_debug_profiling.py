@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test the on-demand profiling endpoints
+Covers the DEBUG_TOKEN guard, collapsed stacks from /debug/profile, the
+tracemalloc diff from /debug/memory and the one-profile-at-a-time lock.
+"""
+
+import sys
+import asyncio
+import threading
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.config import settings
+from app.profiling import ProfilerBusy, sample_stacks
+
+TOKEN = "test-debug-token"
+
+def busy_spending_loop(stop):
+    total = 0
+    while not stop.is_set():
+        total += sum(i * i for i in range(1000))
+    return total
+
+def growing_ledger(stop, ledger):
+    while not stop.is_set():
+        ledger.append(bytearray(64 * 1024))
+        stop.wait(0.01)
+
+def run_alongside(target, run, *args):
+    """Call run() while target(stop, *args) runs on a background thread"""
+    stop = threading.Event()
+    worker = threading.Thread(target=target, args=(stop, *args), daemon=True)
+    worker.start()
+    try:
+        return run()
+    finally:
+        stop.set()
+        worker.join()
+
+def with_token(token, run):
+    original = settings.DEBUG_TOKEN
+    settings.DEBUG_TOKEN = token
+    try:
+        return run()
+    finally:
+        settings.DEBUG_TOKEN = original
+
+def test_endpoints_are_guarded():
+    client = TestClient(app)
+    disabled = with_token("", lambda: client.get("/debug/profile", params={"seconds": 0.1}))
+    wrong = with_token(TOKEN, lambda: client.get("/debug/memory", params={"seconds": 0.1},
+                                                 headers={"X-Debug-Token": "guess"}))
+    missing = with_token(TOKEN, lambda: client.get("/debug/profile", params={"seconds": 0.1}))
+    too_long = with_token(TOKEN, lambda: client.get(
+        "/debug/profile", params={"seconds": settings.DEBUG_PROFILE_MAX_SECONDS + 1}, headers={"X-Debug-Token": TOKEN}))
+
+    assert disabled.status_code == 404
+    assert wrong.status_code == 403
+    assert missing.status_code == 403
+    assert too_long.status_code == 422
+
+def test_profile_returns_collapsed_stacks():
+    client = TestClient(app)
+    response = with_token(TOKEN, lambda: run_alongside(busy_spending_loop, lambda: client.get(
+        "/debug/profile", params={"seconds": 0.5, "interval_ms": 2}, headers={"X-Debug-Token": TOKEN})))
+
+    assert response.status_code == 200
+    assert int(response.headers["X-Profile-Samples"]) > 10
+    lines = response.text.splitlines()
+    stack, count = lines[0].rsplit(" ", 1)  # Heaviest stack first
+    assert int(count) > 0
+    assert any("busy_spending_loop (test_debug_profiling.py" in line for line in lines)
+    # Idle threads (the event loop waiting in select, parked workers) are left out
+    leaves = [line.rsplit(" ", 1)[0].rsplit(";", 1)[-1] for line in lines]
+    assert not any(leaf.startswith(("select (selectors.py", "wait (threading.py")) for leaf in leaves)
+
+def test_memory_diff_reports_growth():
+    client = TestClient(app)
+    ledger = []
+    response = with_token(TOKEN, lambda: run_alongside(growing_ledger, lambda: client.get(
+        "/debug/memory", params={"seconds": 0.5, "top": 5}, headers={"X-Debug-Token": TOKEN}), ledger))
+
+    body = response.json()
+    assert response.status_code == 200
+    assert body["tracing_started_for_request"]
+    assert body["top"][0]["location"].startswith(str(Path(__file__).resolve()))
+    assert body["top"][0]["size_diff_kb"] > 64
+
+def test_one_profile_at_a_time():
+    async def two_profiles():
+        return await asyncio.gather(sample_stacks(0.2, 5), sample_stacks(0.2, 5), return_exceptions=True)
+
+    first, second = asyncio.run(two_profiles())
+    assert isinstance(second, ProfilerBusy)
+    assert first[1] > 0
+
+if __name__ == "__main__":
+    print("🧪 Testing profiling endpoints")
+    test_endpoints_are_guarded()
+    test_profile_returns_collapsed_stacks()
+    test_memory_diff_reports_growth()
+    test_one_profile_at_a_time()
+    print("✅ Profiling endpoint checks passed")
@@ -9,6 +9,7 @@ import time
 import requests
 import sys
 import os
+import tempfile
 from pathlib import Path
 
 def test_server_startup(server_type, timeout=30):
@@ -53,29 +54,29 @@ def test_server_startup(server_type, timeout=30):
         print(f"❌ Error testing {server_type}: {e}")
         return False
 
-def test_performance_monitor():
-    """Test the performance monitoring script"""
-    print("🧪 Testing performance monitor...")
+def test_benchmark_harness():
+    """Test that the end-to-end benchmark covers every route and MCP tool and runs cleanly"""
+    print("🧪 Testing benchmark harness...")
     
-    try:
-        # Test if monitor script can be imported
-        import monitor_performance
-        print("✅ Performance monitor script imports successfully")
-        
-        # Test basic functionality
-        monitor = monitor_performance.PerformanceMonitor("http://127.0.0.1:8001")
-        stats = monitor.get_system_stats()
-        
-        if "cpu_percent" in stats and "memory_percent" in stats:
-            print("✅ Performance monitor can collect system stats")
-            return True
-        else:
-            print("❌ Performance monitor failed to collect stats")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Error testing performance monitor: {e}")
-        return False
+    # The benchmarks import their shared helpers as a top-level module
+    sys.path.insert(0, str(Path(__file__).parent / "benchmarks"))
+    import asyncio
+    import bench_end_to_end
+    print("✅ Benchmark harness imports successfully")
+    
+    # Every /api/v1/* route and MCP tool needs a request template
+    targets = asyncio.run(bench_end_to_end.discover_targets())
+    assert {kind for kind, _ in targets} == {"route", "tool"}
+    print(f"✅ Benchmark harness covers {len(targets)} routes and tools")
+    
+    # One request per target against a small dataset
+    with tempfile.TemporaryDirectory() as directory:
+        dataset = bench_end_to_end.run_dataset(200, users=2, levels=[1], requests=1, seed=1,
+                                               path=os.path.join(directory, "bench.db"))
+    results = dataset["results"]
+    assert [(result["kind"], result["name"]) for result in results] == targets
+    assert not [result["name"] for result in results if result["errors"]]
+    print(f"✅ Benchmark smoke run completed {len(results)} targets without errors")
 
 def test_configuration_files():
     """Test that all configuration files exist and are valid"""
@@ -86,7 +87,7 @@ def test_configuration_files():
         "gunicorn.conf.py", 
         "hypercorn.toml",
         "start_fast_server.py",
-        "monitor_performance.py"
+        "benchmarks/bench_end_to_end.py"
     ]
     
     all_exist = True
@@ -131,7 +132,7 @@ def main():
     tests = [
         ("Configuration Files", test_configuration_files),
         ("Dependencies", test_dependencies),
-        ("Performance Monitor", test_performance_monitor),
+        ("Benchmark Harness", lambda: test_benchmark_harness() is None),
         ("Hypercorn Server", lambda: test_server_startup("hypercorn")),
         ("Gunicorn Server", lambda: test_server_startup("gunicorn")),
         ("Uvicorn Server", lambda: test_server_startup("uvicorn"))
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test the financial_snapshot MCP tool
+Checks that each section matches the tool it replaces, that the whole
+snapshot is read in one transaction that a concurrent write cannot split,
+and that the rollup is scanned once for the summary and spending sections.
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+from datetime import date, datetime, timedelta
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models import Budget, Goal, Transaction, TransactionType
+from app.services.rollups import rebuild_daily_totals, update_daily_totals
+from app.tool_sessions import tool_usage
+
+def seed(engine):
+    now = datetime.now()
+    with Session(engine) as db:
+        db.add_all(
+            Transaction(amount=12.5 + i, description=f"Item {i}",
+                        transaction_type=TransactionType.INCOME if i % 7 == 0 else TransactionType.EXPENSE,
+                        category=["food", "travel", "rent"][i % 3], date=now - timedelta(hours=9 * i), user_id=1)
+            for i in range(90)
+        )
+        db.add(Budget(name="Food", category="food", amount=400.0, period="monthly",
+                      start_date=now - timedelta(days=30), end_date=now + timedelta(days=1), user_id=1))
+        db.add(Goal(title="Trip", description="Summer trip", target_amount=1000.0, current_amount=250.0,
+                    target_date=now + timedelta(days=90), user_id=1))
+        db.commit()
+    with engine.begin() as conn:
+        rebuild_daily_totals(conn)
+    tool_usage.clear()
+
+def call_tool(engine, tool, **kwargs):
+    import mcp_server
+
+    original_engine = mcp_server.engine
+    mcp_server.engine = engine
+    try:
+        return asyncio.run(getattr(mcp_server, tool).fn(**kwargs))
+    finally:
+        mcp_server.engine = original_engine
+
+def test_sections_match_the_individual_tools(engine):
+    seed(engine)
+    start = (date.today() - timedelta(days=20)).isoformat()
+    snapshot = call_tool(engine, "financial_snapshot", user_id=1, start_date=start, transactions_limit=5)
+    summary = call_tool(engine, "get_financial_summary", user_id=1, start_date=start)
+    spending = call_tool(engine, "analyze_spending_patterns", user_id=1, days=20)
+    budgets = call_tool(engine, "get_budget_status", user_id=1)
+    goals = call_tool(engine, "get_financial_goals", user_id=1)
+    latest = call_tool(engine, "get_transactions", user_id=1, limit=5)
+
+    assert snapshot["period"] == f"{start} to {date.today()}"
+    for key, value in snapshot["summary"].items():
+        assert summary[key] == value, key
+    for key, value in snapshot["spending"].items():
+        assert spending[key] == value, key
+    assert snapshot["budgets"] == budgets
+    assert snapshot["goals"] == goals
+    assert snapshot["transactions"]["transactions"] == latest["transactions"]
+    assert set(snapshot["timings_ms"]) == {"rollup_scan", "summary", "spending", "budgets", "goals",
+                                           "transactions", "total"}
+
+def test_one_rollup_scan_and_selected_sections(engine):
+    seed(engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    snapshot = call_tool(engine, "financial_snapshot", user_id=1)
+    rollup_reads = [s for s in statements if "FROM daily_category_totals" in s]
+
+    partial = call_tool(engine, "financial_snapshot", user_id=1, sections=["goals"])
+    unknown = call_tool(engine, "financial_snapshot", user_id=1, sections=["goals", "net_worth"])
+
+    assert "summary" in snapshot and "spending" in snapshot
+    assert len(rollup_reads) == 1
+    assert tool_usage.stats()["financial_snapshot"]["max_statements"] <= 5  # BEGIN and one query per source
+    assert set(partial) == {"period", "goals", "timings_ms"}
+    assert "net_worth" in unknown["error"]
+
+def test_concurrent_write_does_not_split_the_snapshot(engine):
+    import mcp_server
+
+    seed(engine)
+    original_budget_status = mcp_server._budget_status
+
+    def budget_status_then_write(db, user_id):
+        # Another connection commits a transaction halfway through the snapshot
+        with Session(engine) as writer:
+            added = Transaction(amount=999.0, description="Late", transaction_type=TransactionType.EXPENSE,
+                                category="food", user_id=1)
+            writer.add(added)
+            writer.flush()
+            update_daily_totals(writer, added=[added])
+            writer.commit()
+        return original_budget_status(db, user_id)
+
+    mcp_server._budget_status = budget_status_then_write
+    try:
+        snapshot = call_tool(engine, "financial_snapshot", user_id=1, transactions_limit=200)
+    finally:
+        mcp_server._budget_status = original_budget_status
+    after = call_tool(engine, "financial_snapshot", user_id=1, transactions_limit=200)
+
+    listed = snapshot["transactions"]["transactions"]
+    assert "Late" not in {t["description"] for t in listed}
+    assert len(listed) == snapshot["summary"]["transaction_count"]
+    assert len(after["transactions"]["transactions"]) == len(listed) + 1
+    assert after["summary"]["total_expenses"] == snapshot["summary"]["total_expenses"] + 999.0
+
+if __name__ == "__main__":
+    print("🧪 Testing financial_snapshot")
+    sys.exit(pytest.main(["-q", __file__]))
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test the synthetic dataset generator
+Checks row counts, seeded determinism, the shape of the generated data, the
+rollup and that the load-time tuning leaves the indexes and engine profile
+as it found them.
+"""
+
+import sys
+from pathlib import Path
+from datetime import datetime
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+from generate_dataset import CATEGORIES, DEFAULT_END, EXPENSE_PROFILE, generate_dataset, transaction_batches
+
+def scalar(engine, statement):
+    with engine.connect() as conn:
+        return conn.exec_driver_sql(statement).scalar()
+
+def index_names(engine):
+    with engine.connect() as conn:
+        return sorted(row[0] for row in conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'transactions'"))
+
+def test_generates_users_transactions_budgets_and_goals(engine):
+    indexes = index_names(engine)
+    stats = generate_dataset(engine, users=4, transactions_per_user=500, days=365, seed=7, batch_size=300)
+
+    assert stats["users"] == 4 and stats["user_ids"] == [1, 4]
+    assert stats["transactions"] == 2000 and stats["rows_per_second"] > 0
+    assert scalar(engine, "SELECT count(*) FROM transactions") == 2000
+    assert scalar(engine, "SELECT count(DISTINCT user_id) FROM transactions") == 4
+    assert scalar(engine, "SELECT min(amount_cents) FROM transactions") > 0
+    assert scalar(engine, "SELECT count(*) FROM budgets") == stats["budgets"] == 24
+    assert 4 <= scalar(engine, "SELECT count(*) FROM goals") == stats["goals"] <= 12
+
+    with engine.connect() as conn:
+        categories = {row[0] for row in conn.exec_driver_sql("SELECT DISTINCT category FROM transactions")}
+        # One salary per user per month, paid on the same day of the month
+        salaries = conn.exec_driver_sql(
+            "SELECT user_id, count(*), count(DISTINCT strftime('%d', date)), count(DISTINCT amount_cents) "
+            "FROM transactions WHERE category = 'salary' GROUP BY user_id"
+        ).all()
+        weekend, weekday = conn.exec_driver_sql(
+            "SELECT avg(strftime('%w', date) IN ('5', '6')), avg(strftime('%w', date) IN ('1', '2')) "
+            "FROM transactions WHERE transaction_type = 'EXPENSE'"
+        ).one()
+    assert set(EXPENSE_PROFILE) <= categories <= set(CATEGORIES)
+    # The 365 days before 2025-01-01 start on 2024-01-02, so a payday on the 1st comes round 11 times
+    assert all(count in (11, 12) and days == 1 and amounts == 1 for _, count, days, amounts in salaries)
+    assert weekend > weekday  # Fridays and Saturdays are busier than Mondays and Tuesdays
+
+    # The rollup was rebuilt, and the load put the indexes and journal mode back
+    assert scalar(engine, "SELECT sum(transaction_count) FROM daily_category_totals") == 2000
+    assert stats["rollup_rows"] == scalar(engine, "SELECT count(*) FROM daily_category_totals")
+    assert index_names(engine) == indexes
+    assert scalar(engine, "PRAGMA journal_mode") == "wal"
+
+def test_same_seed_same_rows():
+    end = datetime(2025, 1, 1)
+    first = [row for batch in transaction_batches([1, 2], 300, days=90, seed=3, batch_size=200, end=end) for row in batch]
+    again = [row for batch in transaction_batches([1, 2], 300, days=90, seed=3, batch_size=200, end=end) for row in batch]
+    other = [row for batch in transaction_batches([1, 2], 300, days=90, seed=4, batch_size=200, end=end) for row in batch]
+
+    assert first == again
+    assert first != other
+    assert len(first) == 600
+    assert all("2024-10-03" <= row[5] < "2025-01-01" for row in first)
+
+def test_appends_users_to_an_existing_database(engine):
+    generate_dataset(engine, users=2, transactions_per_user=50, days=60, budgets=False, goals=False)
+    with engine.begin() as conn:
+        # Only the new users' rollup is rebuilt, so this stays as it is
+        conn.exec_driver_sql("UPDATE daily_category_totals SET transaction_count = 0 WHERE user_id = 1")
+    stats = generate_dataset(engine, users=3, transactions_per_user=50, days=60, seed=9, budgets=False, goals=False)
+
+    assert stats["user_ids"] == [3, 5]
+    assert scalar(engine, "SELECT count(*) FROM transactions") == 250
+    assert scalar(engine, "SELECT sum(transaction_count) FROM daily_category_totals WHERE user_id = 1") == 0
+    assert stats["rollup_rows"] == scalar(engine, "SELECT count(*) FROM daily_category_totals WHERE user_id >= 3")
+    # The history ends at the fixed default, not today
+    assert scalar(engine, "SELECT max(date) FROM transactions") < DEFAULT_END.isoformat(" ")
+
+if __name__ == "__main__":
+    print("🧪 Testing the synthetic dataset generator")
+    sys.exit(pytest.main(["-q", __file__]))
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Import-time budget test for the API entry point
+Uses `python -X importtime` to check that importing app.main stays under a
+budget and that pandas, matplotlib and seaborn are not imported eagerly.
+"""
+
+import sys
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+
+project_root = Path(__file__).parent
+
+# Generous enough for slow CI machines; app.main imports in ~0.7s locally
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "1200"))
+HEAVY_MODULES = ("pandas", "matplotlib", "seaborn")
+
+def import_profile(module: str):
+    """Return (cumulative ms, set of imported modules) for a fresh interpreter importing `module`"""
+    env = dict(os.environ, PYTHONPATH=str(project_root))
+    with tempfile.TemporaryDirectory() as workdir:
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=workdir, env=env, capture_output=True, text=True, check=True
+        )
+
+    cumulative_us, imported = None, set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        if not cumulative.strip().isdigit():
+            continue
+        imported.add(name)
+        if name == module:
+            cumulative_us = int(cumulative)
+    assert cumulative_us is not None, completed.stderr[-2000:]
+    return cumulative_us / 1000, imported
+
+def test_app_main_skips_heavy_imports():
+    _, imported = import_profile("app.main")
+    eager = sorted(name for name in imported if name.split(".")[0] in HEAVY_MODULES)
+    assert not eager, f"app.main imports heavy modules eagerly: {eager[:5]}"
+
+def test_app_main_import_budget():
+    # Best of three runs to keep disk-cache noise out of the measurement
+    best_ms = min(import_profile("app.main")[0] for _ in range(3))
+    assert best_ms < IMPORT_TIME_BUDGET_MS, f"app.main imported in {best_ms:.0f} ms (budget {IMPORT_TIME_BUDGET_MS:.0f} ms)"
+
+if __name__ == "__main__":
+    print("🧪 Measuring app.main import time")
+    test_app_main_skips_heavy_imports()
+    test_app_main_import_budget()
+    print("✅ Import-time budget checks passed")
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+In-process test of the MCP server mounted in the integrated FastAPI app
+"""
+
+import sys
+import json
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.testclient import TestClient
+
+MCP_HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+def rpc_result(response):
+    """Extract the JSON-RPC result from a streamable HTTP (SSE) response"""
+    for line in response.text.splitlines():
+        if line.startswith("data: "):
+            return json.loads(line[len("data: "):])["result"]
+    raise AssertionError(f"No JSON-RPC message in response: {response.text}")
+
+def test_mcp_mounted_with_ready_signal():
+    import integrated_server
+
+    with TestClient(integrated_server.app) as client:
+        assert integrated_server.mcp_ready.is_set()
+        assert client.get("/health").json()["mcp_server"] == "active"
+
+        init = client.post("/mcp-server/mcp", headers=MCP_HEADERS, json={
+            "jsonrpc": "2.0", "id": 1, "method": "initialize",
+            "params": {"protocolVersion": "2025-06-18", "capabilities": {},
+                       "clientInfo": {"name": "test", "version": "1.0"}}
+        })
+        assert init.status_code == 200
+        assert rpc_result(init)["serverInfo"]["name"] == "Finance Tracker MCP Server"
+
+        session_headers = dict(MCP_HEADERS, **{"mcp-session-id": init.headers["mcp-session-id"]})
+        client.post("/mcp-server/mcp", headers=session_headers,
+                    json={"jsonrpc": "2.0", "method": "notifications/initialized"})
+        tools = client.post("/mcp-server/mcp", headers=session_headers,
+                            json={"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        names = {tool["name"] for tool in rpc_result(tools)["tools"]}
+        assert {"get_transactions", "get_budget_status", "add_transactions_batch"} <= names
+
+    assert not integrated_server.mcp_ready.is_set()
+
+if __name__ == "__main__":
+    print("🧪 Testing mounted MCP server")
+    test_mcp_mounted_with_ready_signal()
+    print("✅ Mounted MCP server checks passed")
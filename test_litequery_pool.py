@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Test the LiteQueryHelper connection pool
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+from app.litequery_helper import LiteQueryHelper
+
+def test_pool_reuses_connections_and_closes(engine, db_path):
+    helper = LiteQueryHelper(db_path, max_readers=2)
+
+    async def scenario():
+        new_id = await helper.execute_insert(
+            "INSERT INTO transactions (amount_cents, description, transaction_type, category, date, user_id) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (4200, "Pooled", "EXPENSE", "food", "2025-01-02 00:00:00", 1)
+        )
+        readers = list(helper._all_readers)
+
+        results = await asyncio.gather(*(
+            helper.execute_query("SELECT id, amount_cents FROM transactions WHERE user_id = ?", (1,))
+            for _ in range(20)
+        ))
+        journal_mode = await helper.execute_query("PRAGMA journal_mode")
+        updated = await helper.execute_update("UPDATE transactions SET amount_cents = ? WHERE id = ?", (4300, new_id))
+
+        assert helper._all_readers == readers
+        await helper.close()
+        return new_id, results, journal_mode, updated
+
+    new_id, results, journal_mode, updated = asyncio.run(scenario())
+
+    assert len(results) == 20
+    assert all(rows == [{"id": new_id, "amount_cents": 4200}] for rows in results)
+    assert journal_mode[0]["journal_mode"] == "wal"
+    assert updated == 1
+    assert helper._readers is None and helper._writer is None
+
+if __name__ == "__main__":
+    print("🧪 Testing LiteQuery connection pool")
+    sys.exit(pytest.main(["-q", __file__]))
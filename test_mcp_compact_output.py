@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test the compact MCP tool output
+Covers the column-oriented table format, field projection, the max_tokens
+budget with its summarized output and continuation cursor, and the size
+metadata reported with every result.
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+from datetime import datetime, timedelta
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models import Transaction, TransactionType
+from app.services.rollups import rebuild_daily_totals
+from app.tool_output import encoded_size
+
+CATEGORIES = [f"category-{i:02d}" for i in range(30)]
+
+def seed(engine, rows=120):
+    start = datetime(2024, 3, 1, 9, 30, 15, 123456)
+    with Session(engine) as db:
+        db.add_all(
+            Transaction(amount=10 + i, description=f"Purchase number {i}",
+                        transaction_type=TransactionType.INCOME if i % 10 == 0 else TransactionType.EXPENSE,
+                        category=CATEGORIES[i % len(CATEGORIES)], date=start + timedelta(hours=i), user_id=1)
+            for i in range(rows)
+        )
+        db.commit()
+    with engine.begin() as conn:
+        rebuild_daily_totals(conn)
+
+def call_tool(engine, tool, **kwargs):
+    import mcp_server
+
+    original_engine = mcp_server.engine
+    mcp_server.engine = engine
+    try:
+        return asyncio.run(getattr(mcp_server, tool).fn(**kwargs))
+    finally:
+        mcp_server.engine = original_engine
+
+def without_meta(payload):
+    return {key: value for key, value in payload.items() if key != "_meta"}
+
+def test_table_format_and_projection(engine):
+    seed(engine)
+    rows = call_tool(engine, "get_transactions", user_id=1, limit=50)
+    table = call_tool(engine, "get_transactions", user_id=1, limit=50, output_format="table")
+    projected = call_tool(engine, "get_transactions", user_id=1, limit=50, output_format="table",
+                          fields=["date", "amount"])
+    unknown = call_tool(engine, "get_transactions", user_id=1, fields=["amount", "balance"])
+
+    assert table["transactions"]["columns"] == ["id", "date", "amount", "transaction_type", "category", "description"]
+    assert [row[0] for row in table["transactions"]["rows"]] == [t["id"] for t in rows["transactions"]]
+    assert table["transactions"]["rows"][0][1] == rows["transactions"][0]["date"][:19]
+    assert table["next_cursor"] == rows["next_cursor"]
+    assert projected["transactions"]["rows"][0] == [rows["transactions"][0]["date"][:19], rows["transactions"][0]["amount"]]
+    assert "balance" in unknown["error"]
+
+    # The metadata reports the encoded size of the rest of the result
+    assert rows["_meta"]["bytes"] == encoded_size(without_meta(rows))
+    assert table["_meta"]["bytes"] < rows["_meta"]["bytes"] * 0.6
+    assert projected["_meta"]["estimated_tokens"] < table["_meta"]["estimated_tokens"]
+    assert not rows["_meta"]["truncated"]
+
+def test_token_budget_summarizes_and_continues(engine):
+    seed(engine)
+    full = call_tool(engine, "get_transactions", user_id=1, limit=100, output_format="table")
+    budget = full["_meta"]["estimated_tokens"] // 4
+
+    seen = []
+    cursor = None
+    for _ in range(20):
+        page = call_tool(engine, "get_transactions", user_id=1, limit=100, output_format="table",
+                         max_tokens=budget, cursor=cursor)
+        assert page["_meta"]["estimated_tokens"] <= budget
+        seen.extend(row[0] for row in page["transactions"]["rows"])
+        cursor = page["next_cursor"]
+        if not page["_meta"]["truncated"] and cursor is None:
+            break
+    first = call_tool(engine, "get_transactions", user_id=1, limit=100, output_format="table", max_tokens=budget)
+
+    assert first["_meta"]["truncated"]
+    assert first["summary"]["count"] == 100
+    assert len(first["summary"]["top_spending_categories"]) == 5
+    assert 0 < len(first["transactions"]["rows"]) < 100
+    assert seen == list(range(120, 0, -1))  # Every transaction exactly once, in order
+
+    # A budget too small for any row still returns the summary and a cursor to the first row
+    tiny = call_tool(engine, "get_transactions", user_id=1, limit=100, max_tokens=1)
+    after = call_tool(engine, "get_transactions", user_id=1, limit=1, cursor=tiny["next_cursor"])
+    assert tiny["transactions"] == [] and tiny["summary"]["count"] == 100
+    assert after["transactions"][0]["id"] == 120
+
+def test_financial_summary_budget(engine):
+    seed(engine)
+    full = call_tool(engine, "get_financial_summary", user_id=1)
+    table = call_tool(engine, "get_financial_summary", user_id=1, output_format="table")
+    totals = call_tool(engine, "get_financial_summary", user_id=1, fields=["total_income", "net_worth"])
+
+    assert without_meta(totals) == {"total_income": full["total_income"], "net_worth": full["net_worth"]}
+    assert table["category_breakdown"]["columns"] == ["category", "amount"]
+    assert dict(map(tuple, table["category_breakdown"]["rows"])) == full["category_breakdown"]
+
+    budget = full["_meta"]["estimated_tokens"] // 2
+    breakdown = {}
+    cursor = None
+    for _ in range(10):
+        part = call_tool(engine, "get_financial_summary", user_id=1, max_tokens=budget, cursor=cursor)
+        assert part["_meta"]["estimated_tokens"] <= budget
+        assert part["total_expenses"] == full["total_expenses"]
+        breakdown.update(part["category_breakdown"])
+        cursor = part["next_cursor"]
+        if cursor is None:
+            break
+    assert breakdown == full["category_breakdown"]
+
+    # The cached summary is not changed by shaping it
+    again = call_tool(engine, "get_financial_summary", user_id=1)
+    assert without_meta(again) == without_meta(full)
+
+if __name__ == "__main__":
+    print("🧪 Testing compact MCP tool output")
+    sys.exit(pytest.main(["-q", __file__]))
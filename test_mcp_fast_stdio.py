@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Test the fast-start stdio MCP front end
+Checks that the tools/list manifest matches the FastMCP definitions, that the
+handshake is answered without importing the heavy stack, that tool calls
+still run through the real server and its metrics middleware, and that calls overlap and can be cancelled.
+"""
+
+import sys
+import os
+import json
+import time
+import queue
+import asyncio
+import threading
+import subprocess
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from sqlalchemy import text
+
+from mcp_fast_stdio import FastStdioServer, MANIFEST_PATH
+
+HEAVY_MODULES = ("fastmcp", "mcp", "sqlalchemy", "pydantic", "mcp_server", "app")
+
+RUNAWAY_QUERY = (
+    "WITH RECURSIVE r(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM r) "
+    "SELECT count(*) FROM (SELECT i FROM r LIMIT 1000000000)"
+)
+
+class QueueWriter:
+    """stdout stand-in that hands each written response to the test thread"""
+
+    def __init__(self):
+        self.responses = queue.Queue()
+
+    def write(self, data):
+        for line in data.splitlines():
+            self.responses.put(json.loads(line))
+
+    def flush(self):
+        pass
+
+def test_manifest_matches_tool_definitions():
+    from mcp_server import mcp
+
+    tools = asyncio.run(mcp.get_tools())
+    expected = [
+        tool.to_mcp_tool().model_dump(by_alias=True, exclude_none=True, mode="json")
+        for tool in tools.values()
+    ]
+    with open(MANIFEST_PATH, encoding="utf-8") as f:
+        manifest = json.load(f)["tools"]
+    assert manifest == expected, "mcp_tools_manifest.json is stale; run python mcp_fast_stdio.py --build-manifest"
+
+def test_handshake_skips_heavy_imports():
+    probe = (
+        "import io, sys, json\n"
+        "from mcp_fast_stdio import FastStdioServer\n"
+        "requests = [\n"
+        "    {'jsonrpc': '2.0', 'id': 1, 'method': 'initialize', 'params': {'protocolVersion': '2025-06-18'}},\n"
+        "    {'jsonrpc': '2.0', 'method': 'notifications/initialized'},\n"
+        "    {'jsonrpc': '2.0', 'id': 2, 'method': 'tools/list'},\n"
+        "]\n"
+        "out = io.StringIO()\n"
+        "FastStdioServer().serve(io.StringIO(''.join(json.dumps(r) + '\\n' for r in requests)), out)\n"
+        "print(json.dumps({'responses': out.getvalue().splitlines(), 'modules': sorted(sys.modules)}))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(project_root))
+    completed = subprocess.run(
+        [sys.executable, "-c", probe], cwd=project_root, env=env, capture_output=True, text=True, check=True
+    )
+    result = json.loads(completed.stdout)
+
+    responses = [json.loads(line) for line in result["responses"]]
+    assert [r["id"] for r in responses] == [1, 2]
+    assert responses[0]["result"]["protocolVersion"] == "2025-06-18"
+    assert len(responses[1]["result"]["tools"]) > 0
+
+    eager = [name for name in result["modules"] if name.split(".")[0] in HEAVY_MODULES]
+    assert not eager, f"handshake imported heavy modules: {eager[:5]}"
+
+def test_tool_call_runs_real_server(engine):
+    import mcp_server
+    from app.metrics import metrics_registry, TOOL
+
+    metrics_registry.clear()
+    original_engine = mcp_server.engine
+    mcp_server.engine = engine
+    try:
+        server = FastStdioServer()
+        added = asyncio.run(server.handle({
+            "jsonrpc": "2.0", "id": 1, "method": "tools/call",
+            "params": {"name": "add_transaction", "arguments": {
+                "amount": 12.5, "description": "Coffee", "category": "Food", "transaction_type": "expense"
+            }}
+        }))
+        assert added["result"]["isError"] is False
+        assert added["result"]["structuredContent"]["description"] == "Coffee"
+        assert "id" in added["result"]["structuredContent"]
+        # Stdio calls go through the server's middleware, so they are measured like any other
+        assert metrics_registry.snapshot()[(TOOL, "add_transaction")]["count"] == 1
+
+        unknown = asyncio.run(server.handle({"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": {"name": "nope"}}))
+        assert unknown["error"]["code"] == -32602
+        missing = asyncio.run(server.handle({"jsonrpc": "2.0", "id": 3, "method": "resources/list"}))
+        assert missing["error"]["code"] == -32601
+    finally:
+        mcp_server.engine = original_engine
+
+def test_calls_overlap_and_can_be_cancelled(engine):
+    import mcp_server
+
+    def runaway(db, *args):
+        return db.execute(text(RUNAWAY_QUERY)).scalar()
+
+    originals = (mcp_server.engine, mcp_server._get_transactions)
+    mcp_server.engine = engine
+    mcp_server._get_transactions = runaway
+    read_fd, write_fd = os.pipe()
+    stdin, feed = os.fdopen(read_fd, "r"), os.fdopen(write_fd, "w")
+    stdout = QueueWriter()
+    server = FastStdioServer()
+    serving = threading.Thread(target=server.serve, args=(stdin, stdout), daemon=True)
+    serving.start()
+
+    def send(message):
+        feed.write(json.dumps(message) + "\n")
+        feed.flush()
+
+    try:
+        send({"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+              "params": {"name": "get_transactions", "arguments": {}}})
+        send({"jsonrpc": "2.0", "id": 2, "method": "tools/call",
+              "params": {"name": "get_financial_goals", "arguments": {}}})
+
+        # The quick call answers while the runaway one is still running
+        quick = stdout.responses.get(timeout=10)
+        assert quick["id"] == 2 and quick["result"]["isError"] is False
+
+        cancelled_at = time.perf_counter()
+        send({"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": 1}})
+        feed.close()
+        serving.join(timeout=10)
+        assert not serving.is_alive(), "cancelled call kept the server from shutting down"
+        assert time.perf_counter() - cancelled_at < 5.0
+        assert stdout.responses.empty(), "a cancelled request must not be answered"
+    finally:
+        if not feed.closed:
+            feed.close()
+        mcp_server.engine, mcp_server._get_transactions = originals
+
+if __name__ == "__main__":
+    print("🧪 Testing fast-start MCP stdio server")
+    sys.exit(pytest.main(["-q", __file__]))
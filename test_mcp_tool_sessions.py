@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Test the MCP tool session wrapper
+Covers statement/row accounting, the query budget in reject and warn mode and
+the statement timeout enforced through the SQLite progress handler.
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+from datetime import datetime, timedelta
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models import Transaction, TransactionType
+from app.config import settings
+from app.metrics import count_row
+from app.tool_sessions import ToolTimeout, tool_session, tool_usage
+
+RUNAWAY_QUERY = (
+    "WITH RECURSIVE r(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM r) "
+    "SELECT count(*) FROM (SELECT i FROM r LIMIT 100000000)"
+)
+
+def seed(engine, rows=0):
+    now = datetime.now()
+    with Session(engine) as db:
+        db.add_all(
+            Transaction(amount=5.0, description=f"Item {i}", transaction_type=TransactionType.EXPENSE,
+                        category="food", date=now - timedelta(minutes=i), user_id=1)
+            for i in range(rows)
+        )
+        db.commit()
+    tool_usage.clear()
+
+def call_tool(engine, tool, **kwargs):
+    import mcp_server
+
+    original_engine = mcp_server.engine
+    mcp_server.engine = engine
+    try:
+        return asyncio.run(getattr(mcp_server, tool).fn(**kwargs))
+    finally:
+        mcp_server.engine = original_engine
+
+def test_statements_and_rows_are_counted(engine):
+    seed(engine, rows=5)
+    page = call_tool(engine, "get_transactions", user_id=1, limit=3)
+    added = call_tool(engine, "add_transaction", amount=9.99, description="Tea",
+                      transaction_type="expense", category="food")
+
+    usage = tool_usage.stats()
+    assert len(page["transactions"]) == 3 and "id" in added
+    assert usage["get_transactions"]["calls"] == 1
+    assert usage["get_transactions"]["statements"] == 1
+    assert usage["get_transactions"]["rows_read"] == 4  # One extra row detects the next page
+    assert usage["add_transaction"]["statements"] >= 2  # The insert and its rollup upsert
+    assert usage["add_transaction"]["rows_written"] >= 1
+    assert engine.pool.checkedout() == 0
+
+def override_settings(**values):
+    """Set settings attributes and return a function that restores them"""
+    originals = {name: getattr(settings, name) for name in values}
+    for name, value in values.items():
+        setattr(settings, name, value)
+    return lambda: [setattr(settings, name, value) for name, value in originals.items()]
+
+def test_query_budget_reject_and_warn(engine):
+    seed(engine, rows=20)
+    restore = override_settings(MCP_QUERY_BUDGET_ROWS=10, MCP_QUERY_BUDGET_MODE="reject",
+                                MCP_QUERY_BUDGET_STATEMENTS=settings.MCP_QUERY_BUDGET_STATEMENTS)
+    try:
+        rejected = call_tool(engine, "get_transactions", user_id=1, limit=15)
+
+        settings.MCP_QUERY_BUDGET_MODE = "warn"
+        allowed = call_tool(engine, "get_transactions", user_id=1, limit=15)
+
+        settings.MCP_QUERY_BUDGET_MODE = "reject"
+        settings.MCP_QUERY_BUDGET_STATEMENTS = 1
+        too_many = call_tool(engine, "add_transaction", amount=1.0, description="x",
+                             transaction_type="expense", category="food")
+    finally:
+        restore()
+
+    assert "query budget" in rejected["error"]
+    assert len(allowed["transactions"]) == 15
+    assert "query budget" in too_many["error"]
+
+    usage = tool_usage.stats()
+    assert usage["get_transactions"]["rejected"] == 1
+    assert usage["get_transactions"]["over_budget"] == 2
+    assert usage["add_transaction"]["rejected"] == 1
+    with Session(engine) as db:
+        assert db.query(Transaction).count() == 20  # The rejected write was rolled back
+
+def test_statement_timeout_interrupts_and_resets(engine):
+    seed(engine)
+    try:
+        with tool_session("runaway", engine, timeout_ms=50) as db:
+            db.execute(text(RUNAWAY_QUERY)).scalar()
+        raise AssertionError("the runaway statement was not interrupted")
+    except ToolTimeout:
+        pass
+
+    # The pooled connection goes back without the handler, with its own row factory
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM (SELECT 1 UNION ALL SELECT 2)")).scalar() == 2
+        assert conn.connection.dbapi_connection.row_factory is (count_row if settings.METRICS_ENABLED else None)
+    assert tool_usage.stats()["runaway"]["timeouts"] == 1
+
+if __name__ == "__main__":
+    print("🧪 Testing MCP tool sessions")
+    sys.exit(pytest.main(["-q", __file__]))
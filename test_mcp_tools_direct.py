@@ -53,7 +53,7 @@ def test_mcp_tools_direct():
     # Test 3: Get transactions
     print("\n3. Testing get_transactions...")
     try:
-        result = get_transactions(user_id=1, limit=5)
+        result = get_transactions(user_id=1, limit=5)["transactions"]
         print(f"   ✅ Found {len(result)} transactions")
         for tx in result[:2]:
             print(f"      - {tx.get('description')}: ${tx.get('amount')} ({tx.get('transaction_type')})")
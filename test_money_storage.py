@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test integer-cents money storage
+Covers the migration from the Float amount columns, exact sums through the
+rollup and the decimal values the schemas and MCP tools keep exposing.
+"""
+
+import sys
+from pathlib import Path
+from datetime import datetime
+from decimal import Decimal
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.models import Base, Budget, DailyCategoryTotal, Goal, Transaction
+from app.migrations import run_migrations, MIGRATIONS
+from app.money import from_cents, to_cents
+
+# The Float-column schema the app shipped with, before any migration
+LEGACY_SCHEMA = [
+    "CREATE TABLE transactions (id INTEGER PRIMARY KEY, amount FLOAT NOT NULL, description VARCHAR NOT NULL, "
+    "transaction_type VARCHAR(7) NOT NULL, category VARCHAR NOT NULL, date DATETIME, user_id INTEGER NOT NULL)",
+    "CREATE TABLE budgets (id INTEGER PRIMARY KEY, name VARCHAR NOT NULL, category VARCHAR NOT NULL, "
+    "amount FLOAT NOT NULL, period VARCHAR NOT NULL, start_date DATETIME NOT NULL, end_date DATETIME NOT NULL, "
+    "user_id INTEGER NOT NULL, created_at DATETIME)",
+    "CREATE TABLE goals (id INTEGER PRIMARY KEY, title VARCHAR NOT NULL, description TEXT, "
+    "target_amount FLOAT NOT NULL, current_amount FLOAT, target_date DATETIME NOT NULL, status VARCHAR(9), "
+    "user_id INTEGER NOT NULL, created_at DATETIME)",
+]
+
+def test_cents_conversion():
+    assert to_cents(19.99) == 1999
+    assert to_cents(0.015) == 2
+    assert to_cents("-2.345") == -235
+    assert to_cents(Decimal("1e3")) == 100000
+    assert to_cents(25) == 2500
+    assert from_cents(1999) == Decimal("19.99")
+    assert str(from_cents(5)) == "0.05"
+
+def test_migration_from_float_columns(db_path):
+    engine = create_engine(f"sqlite:///{db_path}")
+    with engine.begin() as conn:
+        for statement in LEGACY_SCHEMA:
+            conn.exec_driver_sql(statement)
+        conn.exec_driver_sql("CREATE INDEX ix_legacy_amount ON transactions (user_id, amount)")
+        conn.exec_driver_sql(
+            "INSERT INTO transactions (amount, description, transaction_type, category, date, user_id) VALUES "
+            "(19.99, 'a', 'EXPENSE', 'food', '2025-01-05 10:00:00', 1), "
+            "(0.1, 'b', 'EXPENSE', 'food', '2025-01-05 11:00:00', 1), "
+            "(0.2, 'c', 'EXPENSE', 'food', '2025-01-05 12:00:00', 1), "
+            "(1000.005, 'd', 'INCOME', 'salary', '2025-01-06 09:00:00', 1)"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO budgets (name, category, amount, period, start_date, end_date, user_id) "
+            "VALUES ('Food', 'food', 250.5, 'monthly', '2025-01-01', '2025-01-31', 1)"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO goals (title, target_amount, current_amount, target_date, status, user_id) "
+            "VALUES ('Trip', 1500.0, 333.33, '2025-12-01', 'ACTIVE', 1)"
+        )
+
+    # Same startup sequence as app.main
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA user_version").scalar() == len(MIGRATIONS)
+        columns = {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(transactions)")}
+        cents = [row[0] for row in conn.exec_driver_sql("SELECT amount_cents FROM transactions ORDER BY id")]
+        indexes = {row[1] for row in conn.exec_driver_sql("PRAGMA index_list(transactions)")}
+    assert "amount" not in columns and {"amount_cents", "currency"} <= columns
+    assert cents == [1999, 10, 20, 100001]
+    assert "ix_legacy_amount" not in indexes
+    assert "ix_transactions_user_type_category_date" in indexes
+
+    with Session(engine) as db:
+        food = db.query(DailyCategoryTotal).filter(DailyCategoryTotal.category == "food").one()
+        budget = db.query(Budget).one()
+        goal = db.query(Goal).one()
+        transaction = db.query(Transaction).first()
+    assert food.amount_sum == Decimal("20.29") and food.transaction_count == 3
+    assert (budget.amount, budget.currency) == (Decimal("250.50"), "USD")
+    assert (goal.target_amount, goal.current_amount) == (Decimal("1500.00"), Decimal("333.33"))
+    assert transaction.currency == "USD"
+
+def test_sums_are_exact_and_json_stays_numeric(client):
+    created = client.post("/api/v1/transactions/bulk", json=[
+        {"amount": 0.1, "description": "Gum", "transaction_type": "expense",
+         "category": "food", "date": "2025-03-10T10:00:00"}
+        for _ in range(10)
+    ] + [
+        {"amount": 0.2, "description": "Mint", "transaction_type": "expense",
+         "category": "food", "date": "2025-03-11T10:00:00"}
+    ])
+    single = client.post("/api/v1/transactions/", json={
+        "amount": 12.345, "description": "Lunch", "transaction_type": "expense",
+        "category": "food", "date": "2025-03-12T10:00:00"
+    }).json()
+    report = client.get("/api/v1/reports/spending",
+                        params={"start_date": "2025-03-01", "end_date": "2025-03-31"}).json()
+
+    assert created.status_code in (200, 201)
+    assert single["amount"] == 12.35 and single["currency"] == "USD"
+    # 10 x 0.1 + 0.2 + 12.35 in floats would be 13.549999999999999
+    assert report["total_expenses"] == 13.55
+    assert report["category_breakdown"] == {"food": 13.55}
+
+def test_goal_progress_stays_numeric(engine):
+    import asyncio
+    import mcp_server
+
+    with Session(engine) as db:
+        db.add(Goal(title="Trip", description="", target_amount=300, current_amount=100,
+                    target_date=datetime(2026, 1, 1), user_id=1))
+        db.commit()
+
+    original_engine = mcp_server.engine
+    mcp_server.engine = engine
+    try:
+        goals = asyncio.run(mcp_server.get_financial_goals.fn(user_id=1))
+    finally:
+        mcp_server.engine = original_engine
+
+    assert goals[0]["progress_percentage"] == 33.33
+    assert isinstance(goals[0]["progress_percentage"], float)
+
+if __name__ == "__main__":
+    print("🧪 Testing integer-cents money storage")
+    sys.exit(pytest.main(["-q", __file__]))
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Index usage test for the hot transaction queries
+Runs EXPLAIN QUERY PLAN on every statement issued by the REST, MCP and
+LiteQuery read paths and fails if any of them full-scans the transactions table
+or the daily_category_totals rollup.
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+from datetime import date, datetime, timedelta
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models import Budget, Transaction, TransactionType
+from app.migrations import run_migrations
+from app.litequery_helper import LiteQueryHelper
+from app.services.rollups import rebuild_daily_totals
+
+def seed(engine):
+    run_migrations(engine)
+    with Session(engine) as db:
+        for i in range(50):
+            db.add(Transaction(
+                amount=10.0 + i,
+                description=f"Purchase {i}",
+                transaction_type=TransactionType.EXPENSE if i % 5 else TransactionType.INCOME,
+                category=["food", "travel", "salary"][i % 3],
+                date=datetime.now() - timedelta(days=i),
+                user_id=1 + i % 2
+            ))
+        db.add(Budget(name="Food", category="food", amount=100.0, period="monthly",
+                      start_date=datetime.now() - timedelta(days=30), end_date=datetime.now(), user_id=1))
+        db.commit()
+    with engine.begin() as conn:
+        rebuild_daily_totals(conn)
+
+def capture_selects(engine, run):
+    """Run a callable and return the (statement, parameters) of every SELECT it issued"""
+    captured = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        run()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return captured
+
+def full_scans(engine, statement, parameters):
+    """Return the plan rows that scan the transactions or rollup table without an index"""
+    with engine.connect() as conn:
+        plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    details = [row[-1] for row in plan]
+    return [
+        detail for detail in details
+        if detail.startswith("SCAN") and "USING" not in detail
+        and detail.split()[1] in ("transactions", "t", "daily_category_totals")
+    ]
+
+def assert_indexed(engine, label, statements):
+    assert statements, f"{label}: no SELECT statements captured"
+    for statement, parameters in statements:
+        scans = full_scans(engine, statement, parameters)
+        assert not scans, f"{label} falls back to a full table scan: {scans}\n{statement}"
+
+def rest_and_service_paths(engine):
+    from app.routers.transactions_simple import _list_transactions
+    from app.routers.reports_simple import _build_transactions_csv
+    from app.services.reports import build_spending_report
+    from app.services.budgets import evaluate_budgets
+
+    start, end = date.today() - timedelta(days=30), date.today()
+    with Session(engine) as db:
+        yield "get_transactions", lambda: _list_transactions(db, 0, 100, None, None, None, None)
+        yield "get_transactions (filtered)", lambda: _list_transactions(db, 0, 100, "expense", "food", start, end)
+        _, next_cursor = _list_transactions(db, 0, 5, None, None, None, None)
+        yield "get_transactions (next page)", lambda: _list_transactions(db, 0, 5, None, None, None, None, next_cursor)
+        yield "get_spending_report", lambda: build_spending_report(db, 1, start, end)
+        yield "export_transactions_csv", lambda: _build_transactions_csv(db, start, end)
+        yield "get_budget_status", lambda: evaluate_budgets(db, 1)
+
+def mcp_paths():
+    import mcp_server
+
+    yield "mcp get_transactions", lambda: asyncio.run(mcp_server.get_transactions.fn(user_id=1, limit=10))
+    yield "mcp get_transactions (filtered)", lambda: asyncio.run(mcp_server.get_transactions.fn(
+        user_id=1, transaction_type="expense", category="food",
+        start_date=(date.today() - timedelta(days=30)).isoformat()
+    ))
+    yield "mcp get_financial_summary", lambda: asyncio.run(mcp_server.get_financial_summary.fn(user_id=1))
+    yield "mcp analyze_spending_patterns", lambda: asyncio.run(mcp_server.analyze_spending_patterns.fn(user_id=1, days=30))
+    yield "mcp get_budget_status", lambda: asyncio.run(mcp_server.get_budget_status.fn(user_id=1))
+    yield "mcp financial_snapshot", lambda: asyncio.run(mcp_server.financial_snapshot.fn(user_id=1))
+
+class RecordingLiteQueryHelper(LiteQueryHelper):
+    """LiteQueryHelper that records its SQL instead of executing it"""
+
+    def __init__(self):
+        super().__init__()
+        self.statements = []
+
+    async def execute_query(self, query, params=()):
+        self.statements.append((query, tuple(params)))
+        return []
+
+def test_rest_paths_use_indexes(engine):
+    seed(engine)
+    for label, run in rest_and_service_paths(engine):
+        assert_indexed(engine, label, capture_selects(engine, run))
+
+def test_mcp_paths_use_indexes(engine):
+    import mcp_server
+
+    seed(engine)
+    original_engine = mcp_server.engine
+    mcp_server.engine = engine
+    try:
+        for label, run in mcp_paths():
+            assert_indexed(engine, label, capture_selects(engine, run))
+    finally:
+        mcp_server.engine = original_engine
+
+def test_litequery_paths_use_indexes(engine):
+    seed(engine)
+    helper = RecordingLiteQueryHelper()
+
+    async def run_all():
+        await helper.get_user_financial_summary(1, "2025-01-01", "2025-12-31")
+        await helper.get_spending_by_category(1, "2025-01-01", "2025-12-31")
+        await helper.get_monthly_trends(1)
+        await helper.get_budget_performance(1)
+        await helper.get_recent_transactions(1)
+
+    asyncio.run(run_all())
+    assert len(helper.statements) == 5
+    for statement, parameters in helper.statements:
+        assert_indexed(engine, "LiteQueryHelper", [(statement, parameters)])
+
+if __name__ == "__main__":
+    print("🧪 Checking query plans for the hot transaction queries")
+    print("=" * 50)
+    sys.exit(pytest.main(["-q", __file__]))
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test the in-process report cache
+Covers LRU/TTL bounds, per-user invalidation on writes and the hit/miss
+counters for both the REST report endpoints and the read-only MCP tools.
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from sqlalchemy import event
+
+from app.cache import ReportCache, report_cache
+
+def count_selects(engine):
+    """Attach a SELECT counter to the engine and return it"""
+    counter = {"selects": 0}
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            counter["selects"] += 1
+
+    event.listen(engine, "before_cursor_execute", record)
+    return counter
+
+def test_lru_ttl_and_versions():
+    now = [0.0]
+    cache = ReportCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        return value
+
+    assert cache.get_or_compute("report", 1, ("a",), lambda: compute("a")) == "a"
+    assert cache.get_or_compute("report", 1, ("a",), lambda: compute("a2")) == "a"
+    cache.get_or_compute("report", 2, ("a",), lambda: compute("b"))
+    cache.get_or_compute("report", 1, ("c",), lambda: compute("c"))  # Evicts the least recently used
+    assert cache.get_or_compute("report", 1, ("a",), lambda: compute("a3")) == "a3"
+
+    # A write for user 1 invalidates user 1 only
+    cache.bump(1)
+    assert cache.get_or_compute("report", 1, ("c",), lambda: compute("c2")) == "c2"
+
+    now[0] = 11.0
+    assert cache.get_or_compute("report", 1, ("c",), lambda: compute("c3")) == "c3"
+
+    stats = cache.stats()
+    assert calls == ["a", "b", "c", "a3", "c2", "c3"]
+    assert (stats["hits"], stats["misses"]) == (1, 6)
+    assert (stats["evictions"], stats["stale"], stats["expired"]) == (2, 1, 1)
+
+def test_nothing_cached_on_error():
+    cache = ReportCache(max_entries=4, ttl_seconds=10)
+
+    def fail():
+        raise RuntimeError("boom")
+
+    for _ in range(2):
+        try:
+            cache.get_or_compute("report", 1, (), fail)
+        except RuntimeError:
+            pass
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["misses"] == 2
+
+def test_rest_reports_hit_until_a_write(engine, client):
+    params = {"start_date": "2025-03-01", "end_date": "2025-03-31"}
+    counter = count_selects(engine)
+    first = client.get("/api/v1/reports/spending", params=params).json()
+    selects_after_first = counter["selects"]
+    second = client.get("/api/v1/reports/spending", params=params).json()
+    client.get("/api/v1/reports/budget-status")
+    client.get("/api/v1/reports/budget-status")
+    assert first == second
+    assert counter["selects"] == selects_after_first + 1  # Only the first budget-status query
+
+    client.post("/api/v1/transactions/", json={
+        "amount": 40.0, "description": "Groceries", "transaction_type": "expense",
+        "category": "food", "date": "2025-03-10T10:00:00"
+    })
+    third = client.get("/api/v1/reports/spending", params=params).json()
+    stats = client.get("/api/v1/reports/cache/stats").json()
+
+    assert first["total_expenses"] == 0
+    assert third["total_expenses"] == 40.0
+    assert (stats["hits"], stats["misses"]) == (2, 3)
+
+def test_mcp_read_tools_are_cached_and_invalidated(engine):
+    import mcp_server
+
+    original_engine = mcp_server.engine
+    mcp_server.engine = engine
+    try:
+        counter = count_selects(engine)
+        assert asyncio.run(mcp_server.get_financial_goals.fn(user_id=1)) == []
+        asyncio.run(mcp_server.get_financial_summary.fn(user_id=1))
+        asyncio.run(mcp_server.get_budget_status.fn(user_id=1))
+        asyncio.run(mcp_server.analyze_spending_patterns.fn(user_id=1, days=30))
+        selects = counter["selects"]
+
+        asyncio.run(mcp_server.get_financial_goals.fn(user_id=1))
+        asyncio.run(mcp_server.get_financial_summary.fn(user_id=1))
+        asyncio.run(mcp_server.get_budget_status.fn(user_id=1))
+        asyncio.run(mcp_server.analyze_spending_patterns.fn(user_id=1, days=30))
+        assert counter["selects"] == selects
+
+        asyncio.run(mcp_server.create_financial_goal.fn(title="Trip", description="", target_amount=1000.0,
+                                                        target_date="2026-06-01"))
+        goals = asyncio.run(mcp_server.get_financial_goals.fn(user_id=1))
+        asyncio.run(mcp_server.add_transaction.fn(amount=12.0, description="Lunch", transaction_type="expense", category="food"))
+        summary = asyncio.run(mcp_server.get_financial_summary.fn(user_id=1))
+    finally:
+        mcp_server.engine = original_engine
+
+    assert [goal["title"] for goal in goals] == ["Trip"]
+    assert summary["total_expenses"] == 12.0
+    assert report_cache.stats()["hits"] == 4
+
+if __name__ == "__main__":
+    print("🧪 Testing the report cache")
+    sys.exit(pytest.main(["-q", __file__]))
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test the per-route and per-MCP-tool metrics
+Checks the latency histograms and SQL statement, row and DB time totals
+served in the Prometheus text format from /metrics.
+"""
+
+import sys
+import asyncio
+import re
+from pathlib import Path
+from datetime import datetime, timedelta
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from sqlalchemy.orm import Session
+from fastapi.testclient import TestClient
+
+from app.models import Transaction, TransactionType
+from app.metrics import LATENCY_BUCKETS, metrics_registry
+
+SAMPLE = re.compile(r'^(\w+)\{kind="(\w+)",name="([^"]*)"(?:,le="([^"]+)")?\} (\S+)$')
+
+def seed(engine, rows=30):
+    now = datetime.now()
+    with Session(engine) as db:
+        db.add_all(
+            Transaction(amount=4.0, description=f"Item {i}", transaction_type=TransactionType.EXPENSE,
+                        category="food", date=now - timedelta(minutes=i), user_id=1)
+            for i in range(rows)
+        )
+        db.commit()
+    metrics_registry.clear()
+
+def parse_metrics(text):
+    """{(metric, kind, name): value} of the counters, and histogram buckets keyed with their bound"""
+    samples = {}
+    for line in text.splitlines():
+        match = SAMPLE.match(line)
+        if match:
+            metric, kind, name, bound, value = match.groups()
+            key = (metric, kind, name, bound) if bound else (metric, kind, name)
+            samples[key] = float(value)
+    return samples
+
+def test_route_metrics(engine, client):
+    seed(engine)
+    for _ in range(3):
+        assert len(client.get("/api/v1/transactions/", params={"limit": 5}).json()) == 5
+    assert client.get("/api/v1/transactions/999999").status_code == 404
+    response = client.get("/metrics")
+
+    assert response.headers["content-type"].startswith("text/plain")
+    samples = parse_metrics(response.text)
+    listing = ("route", "GET /api/v1/transactions/")
+    assert samples[("finance_request_duration_seconds_count",) + listing] == 3
+    assert samples[("finance_request_duration_seconds_bucket",) + listing + ("+Inf",)] == 3
+    buckets = [samples[("finance_request_duration_seconds_bucket",) + listing + (str(b),)] for b in LATENCY_BUCKETS]
+    assert buckets == sorted(buckets)
+    assert samples[("finance_db_statements_total",) + listing] == 3
+    assert samples[("finance_db_rows_total",) + listing] == 3 * 6  # One extra row detects the next page
+    assert samples[("finance_db_seconds_total",) + listing] > 0
+
+    # Routes are labelled by their template, and a 404 is not an error
+    lookup = ("route", "GET /api/v1/transactions/{transaction_id}")
+    assert samples[("finance_request_duration_seconds_count",) + lookup] == 1
+    assert samples[("finance_request_errors_total",) + lookup] == 0
+
+def test_tool_metrics_through_the_mcp_server(engine):
+    from fastmcp import Client
+    import mcp_server
+    import integrated_server
+
+    seed(engine)
+
+    async def calls():
+        async with Client(mcp_server.mcp) as client:
+            await client.call_tool("get_transactions", {"user_id": 1, "limit": 5})
+            await client.call_tool("get_financial_summary", {"user_id": 1})
+            await client.call_tool("get_financial_summary", {"user_id": 1})  # Served from the report cache
+
+    original_engine = mcp_server.engine
+    mcp_server.engine = engine
+    try:
+        asyncio.run(calls())
+    finally:
+        mcp_server.engine = original_engine
+
+    samples = parse_metrics(TestClient(integrated_server.app).get("/metrics").text)
+    tool = ("tool", "get_transactions")
+    assert samples[("finance_request_duration_seconds_count",) + tool] == 1
+    assert samples[("finance_db_statements_total",) + tool] == 1
+    assert samples[("finance_db_rows_total",) + tool] == 6
+    summary = ("tool", "get_financial_summary")
+    assert samples[("finance_request_duration_seconds_count",) + summary] == 2
+    assert samples[("finance_db_statements_total",) + summary] == 1
+
+if __name__ == "__main__":
+    print("🧪 Testing request metrics")
+    sys.exit(pytest.main(["-q", __file__]))
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test the slow-query log
+Covers SQL normalization and bind shapes, the captured EXPLAIN QUERY PLAN and
+calling route or MCP tool, the bounded ring buffer and /debug/slow-queries.
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+from datetime import datetime, timedelta
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models import Transaction, TransactionType
+from app.config import settings
+from app.slow_queries import SlowQueryLog, bind_shape, normalize_sql, slow_query_log
+
+def seed(engine, rows=50):
+    now = datetime.now()
+    with Session(engine) as db:
+        db.add_all(
+            Transaction(amount=2.0, description=f"Item {i}", transaction_type=TransactionType.EXPENSE,
+                        category="food", date=now - timedelta(minutes=i), user_id=1)
+            for i in range(rows)
+        )
+        db.commit()
+    slow_query_log.clear()
+
+def with_threshold(threshold_ms, run):
+    original = settings.SLOW_QUERY_THRESHOLD_MS
+    settings.SLOW_QUERY_THRESHOLD_MS = threshold_ms
+    try:
+        return run()
+    finally:
+        settings.SLOW_QUERY_THRESHOLD_MS = original
+
+def test_normalization_and_bind_shape():
+    statement = """SELECT id FROM transactions
+                   WHERE category = 'café' AND amount_cents > 1250 AND id IN (?, ?, ?) LIMIT 10"""
+    assert normalize_sql(statement) == (
+        "SELECT id FROM transactions WHERE category = ? AND amount_cents > ? AND id IN (?, ...) LIMIT ?"
+    )
+    assert normalize_sql("SELECT t1.id FROM t1") == "SELECT t1.id FROM t1"
+    assert bind_shape((1, "food", None)) == ["int", "str", "NoneType"]
+    assert bind_shape({"user_id": 1}) == {"user_id": "int"}
+    assert bind_shape([(1, "a"), (2, "b")], executemany=True) == {"rows": 2, "each": ["int", "str"]}
+
+def test_slow_statement_is_recorded_with_its_plan(engine):
+    seed(engine)
+
+    def scan():
+        with engine.connect() as conn:
+            return conn.execute(text("SELECT count(*) FROM transactions WHERE description LIKE :pattern"),
+                                {"pattern": "%Item 4%"}).scalar()
+
+    assert with_threshold(0, scan) == 11
+    assert with_threshold(60_000, scan) == 11  # Under the threshold: not recorded
+
+    entries = slow_query_log.entries()
+    assert len(entries) == 1
+    entry = entries[0]
+    assert entry["sql"] == "SELECT count(*) FROM transactions WHERE description LIKE ?"
+    assert entry["bind_shape"] == ["str"]
+    assert entry["source"] is None
+    assert entry["duration_ms"] >= 0
+    assert any(line.strip().startswith("SCAN transactions") for line in entry["plan"])
+
+def test_route_and_tool_sources_and_endpoint(engine, client):
+    from fastmcp import Client
+    import mcp_server
+
+    seed(engine)
+    async def tool_call():
+        async with Client(mcp_server.mcp) as client:
+            await client.call_tool("get_transactions", {"user_id": 1, "limit": 5})
+
+    original_engine, original_token = mcp_server.engine, settings.DEBUG_TOKEN
+    mcp_server.engine = engine
+    settings.DEBUG_TOKEN = ""
+    try:
+        with_threshold(0, lambda: client.get("/api/v1/transactions/", params={"limit": 5}))
+        with_threshold(0, lambda: asyncio.run(tool_call()))
+        unauthorized = client.get("/debug/slow-queries")
+        settings.DEBUG_TOKEN = "test-debug-token"
+        response = client.get("/debug/slow-queries", params={"limit": 2},
+                              headers={"X-Debug-Token": "test-debug-token"})
+        forbidden = client.get("/debug/slow-queries", headers={"X-Debug-Token": "guess"})
+    finally:
+        settings.DEBUG_TOKEN = original_token
+        mcp_server.engine = original_engine
+
+    # The log shows statement shapes and plans, so it is guarded like the profilers
+    assert unauthorized.status_code == 404
+    assert forbidden.status_code == 403
+
+    body = response.json()
+    assert body["threshold_ms"] == settings.SLOW_QUERY_THRESHOLD_MS
+    assert body["recorded"] == 2
+    tool_entry, route_entry = body["entries"]
+    assert route_entry["source"] == "route GET /api/v1/transactions/"
+    assert tool_entry["source"] == "tool get_transactions"
+    for entry in (route_entry, tool_entry):
+        assert "LIMIT ?" in entry["sql"]
+        assert any("USING INDEX" in line for line in entry["plan"])
+
+def test_ring_buffer_is_bounded():
+    log = SlowQueryLog(3)
+    for i in range(5):
+        log.record({"sql": f"statement {i}"})
+    assert [entry["sql"] for entry in log.entries()] == ["statement 4", "statement 3", "statement 2"]
+    assert log.recorded == 5
+
+if __name__ == "__main__":
+    print("🧪 Testing the slow-query log")
+    sys.exit(pytest.main(["-q", __file__]))
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test the vectorized spending statistics against a plain-Python reference
+"""
+
+import sys
+import asyncio
+import random
+import statistics
+from pathlib import Path
+from datetime import date, datetime, timedelta
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models import Transaction, TransactionType
+from app.services.analytics import spending_statistics
+from app.services.rollups import rebuild_daily_totals
+
+START, END = date(2024, 1, 1), date(2024, 3, 31)
+
+def seed(engine, rows):
+    with Session(engine) as db:
+        db.add_all(Transaction(description="x", user_id=1, **row) for row in rows)
+        db.commit()
+    with engine.begin() as conn:
+        rebuild_daily_totals(conn)
+
+def random_rows(seed=7):
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(2000):
+        # Leave March 10-20 empty so zero days are exercised
+        day = START + timedelta(days=rng.randrange((END - START).days + 1))
+        if date(2024, 3, 10) <= day <= date(2024, 3, 20):
+            continue
+        rows.append({
+            "amount": round(rng.uniform(1, 200), 2),
+            "transaction_type": TransactionType.INCOME if rng.random() < 0.1 else TransactionType.EXPENSE,
+            "category": rng.choice(["food", "travel", "rent", "fun"]),
+            "date": datetime(day.year, day.month, day.day, rng.randrange(24)),
+        })
+    return rows
+
+def test_statistics_match_reference(engine):
+    rows = random_rows()
+    seed(engine, rows)
+    with Session(engine) as db:
+        stats = spending_statistics(db, 1, START, END)
+
+    expenses = [row for row in rows if row["transaction_type"] == TransactionType.EXPENSE]
+    n_days = (END - START).days + 1
+    daily = [0.0] * n_days
+    categories = {}
+    for row in expenses:
+        daily[(row["date"].date() - START).days] += row["amount"]
+        categories[row["category"]] = categories.get(row["category"], 0) + row["amount"]
+
+    assert stats["transaction_count"] == len(expenses)
+    assert round(stats["total_spent"], 6) == round(sum(daily), 6)
+    assert stats["days_with_spending"] == sum(1 for value in daily if value > 0)
+    assert round(stats["max_daily_spending"], 6) == round(max(daily), 6)
+    assert stats["rolling_means"]["7_day"] == round(sum(daily[-7:]) / 7, 2)
+    assert stats["rolling_means"]["30_day"] == round(sum(daily[-30:]) / 30, 2)
+    assert stats["daily_percentiles"]["p50"] == round(statistics.median(daily), 2)
+    assert list(stats["category_breakdown"]) == sorted(categories, key=categories.get, reverse=True)
+    for category, total in categories.items():
+        assert round(stats["category_breakdown"][category], 6) == round(total, 6)
+
+    mondays = [daily[i] for i in range(n_days) if (START + timedelta(days=i)).weekday() == 0]
+    assert stats["weekday_average_spending"]["Monday"] == round(sum(mondays) / len(mondays), 2)
+
+def test_empty_period_and_mcp_tool(engine):
+    import mcp_server
+
+    today = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+    seed(engine, [
+        {"amount": 10.0, "transaction_type": TransactionType.EXPENSE, "category": "food", "date": today},
+        {"amount": 30.0, "transaction_type": TransactionType.EXPENSE, "category": "food", "date": today - timedelta(days=1)},
+    ])
+    with Session(engine) as db:
+        assert spending_statistics(db, 1, START, END) == {}
+
+    original_engine = mcp_server.engine
+    mcp_server.engine = engine
+    try:
+        result = asyncio.run(mcp_server.analyze_spending_patterns.fn(user_id=1, days=7))
+        empty = asyncio.run(mcp_server.analyze_spending_patterns.fn(user_id=2, days=7))
+    finally:
+        mcp_server.engine = original_engine
+
+    assert result["total_spent"] == 40.0
+    assert result["transaction_count"] == 2
+    assert result["top_spending_category"] == ("food", 40.0)
+    assert result["average_daily_spending"] == round(40.0 / 7, 2)
+    assert result["min_daily_spending"] == 10.0
+    assert empty == {"message": "No transactions found for analysis"}
+
+if __name__ == "__main__":
+    print("🧪 Testing vectorized spending statistics")
+    sys.exit(pytest.main(["-q", __file__]))
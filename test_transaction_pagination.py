@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test keyset (cursor) pagination of transactions over REST and MCP
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+from datetime import datetime, timedelta
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.migrations import _normalize_transaction_dates
+from app.models import Transaction, TransactionType
+
+def seed(engine, rows=95):
+    base = datetime(2025, 1, 1)
+    with Session(engine) as db:
+        for i in range(rows):
+            # Several transactions share a timestamp so the id tiebreak matters
+            db.add(Transaction(amount=float(i), description=f"Item {i}", transaction_type=TransactionType.EXPENSE,
+                               category="food", date=base + timedelta(hours=i // 3), user_id=1))
+        db.commit()
+
+def test_rest_cursor_pagination(engine, client):
+    seed(engine)
+    seen, cursor, pages = [], None, 0
+    while True:
+        params = {"limit": 20}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/v1/transactions/", params=params)
+        assert response.status_code == 200
+        seen.extend(t["id"] for t in response.json())
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    bad = client.get("/api/v1/transactions/", params={"cursor": "not-a-cursor"})
+    first = client.get("/api/v1/transactions/", params={"limit": 20})
+    mixed = client.get("/api/v1/transactions/",
+                       params={"limit": 20, "skip": 20, "cursor": first.headers["X-Next-Cursor"]})
+
+    assert pages == 5
+    assert seen == list(range(95, 0, -1))
+    assert bad.status_code == 400
+    assert mixed.status_code == 400
+    assert "skip" in mixed.json()["detail"]
+
+def test_mcp_cursor_pagination(engine):
+    import mcp_server
+
+    seed(engine)
+    original_engine = mcp_server.engine
+    mcp_server.engine = engine
+    try:
+        first = asyncio.run(mcp_server.get_transactions.fn(user_id=1, limit=50))
+        second = asyncio.run(mcp_server.get_transactions.fn(user_id=1, limit=50, cursor=first["next_cursor"]))
+    finally:
+        mcp_server.engine = original_engine
+
+    assert len(first["transactions"]) == 50
+    assert len(second["transactions"]) == 45
+    assert second["next_cursor"] is None
+    ids = [t["id"] for t in first["transactions"] + second["transactions"]]
+    assert ids == list(range(95, 0, -1))
+
+def test_pagination_over_default_dates(engine, client):
+    """Rows created without a date page to the end over REST and MCP"""
+    import mcp_server
+
+    def rest_pages(client):
+        pages, cursor = [], None
+        while len(pages) < 10:
+            params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+            response = client.get("/api/v1/transactions/", params=params)
+            pages.append([t["id"] for t in response.json()])
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+        return pages
+
+    async def mcp_pages():
+        pages, cursor = [], None
+        while len(pages) < 10:
+            page = await mcp_server.get_transactions.fn(user_id=1, limit=3, cursor=cursor)
+            pages.append([t["id"] for t in page["transactions"]])
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+        return pages
+
+    async def add_via_mcp():
+        for i in range(4):
+            await mcp_server.add_transaction.fn(amount=1.0, description=f"Tool {i}", transaction_type="expense",
+                                                category="food", user_id=1)
+
+    original_engine = mcp_server.engine
+    mcp_server.engine = engine
+    try:
+        for i in range(5):
+            response = client.post("/api/v1/transactions/", json={
+                "amount": 1.0, "description": f"Row {i}", "transaction_type": "expense", "category": "food"})
+            assert response.status_code == 200
+        asyncio.run(add_via_mcp())
+        rest = rest_pages(client)
+        tools = asyncio.run(mcp_pages())
+    finally:
+        mcp_server.engine = original_engine
+
+    assert rest == [[9, 8], [7, 6], [5, 4], [3, 2], [1]]
+    assert tools == [[9, 8, 7], [6, 5, 4], [3, 2, 1]]
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT count(*) FROM transactions WHERE length(date) != 26").scalar() == 0
+
+def test_migration_normalizes_server_default_dates(engine):
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO transactions (amount_cents, description, transaction_type, category, user_id) "
+            "VALUES (100, 'Raw', 'EXPENSE', 'food', 1)"
+        )
+        assert conn.exec_driver_sql("SELECT length(date) FROM transactions").scalar() == 19
+        _normalize_transaction_dates(conn)
+        stored = conn.exec_driver_sql("SELECT date FROM transactions").scalar()
+    assert len(stored) == 26 and stored.endswith(".000000")
+
+if __name__ == "__main__":
+    print("🧪 Testing cursor pagination")
+    sys.exit(pytest.main(["-q", __file__]))